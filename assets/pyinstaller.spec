@@ -16,7 +16,13 @@ a = Analysis(
     pathex=[],
     binaries=[],
     # https://pyinstaller.org/en/stable/spec-files.html#adding-data-files
-    datas=[],
+    datas=[
+        # Binary Qt resources, memory mapped at runtime
+        (
+            str(BUILD_WORK_APP_DIR / 'src/show_dialog/ui/forms/resources.rcc'),
+            'src/show_dialog/ui/forms',
+        ),
+    ],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
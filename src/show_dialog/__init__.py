@@ -1,20 +1,77 @@
+from .startup_trace import startup_trace  # isort: skip  # First import, to time the package import
+
+import importlib
+import time
+from typing import TYPE_CHECKING
+
+from .answers import Answer, Answers
+from .asyncio_loop import QtEventLoopPolicy, show_dialog_async
 from .data_class import DataFileType
-from .exit_code import ExitCode
+from .exit_code import ExitCode, ExitSource
 from .inputs import Buttons, Inputs, Theme
-from .main import main, show_dialog
+from .main import main, show_dialog, show_sequence
+from .recording import Record, load_records, replay_answers
+from .runtime import DialogHandle, DialogRuntime, open_dialog
+from .scheduler import DialogScheduler
+from .sequence import StopPolicy
 from .style import Style
-from .ui.show_dialog import ShowDialog
+
+if TYPE_CHECKING:
+    from .ui.show_dialog import ShowDialog
 
 __version__ = '0.9.0'
 
 __all__ = [
+    'Answer',
+    'Answers',
     'Buttons',
     'DataFileType',
+    'DialogHandle',
+    'DialogRuntime',
+    'DialogScheduler',
     'ExitCode',
+    'ExitSource',
     'Inputs',
+    'QtEventLoopPolicy',
+    'Record',
     'ShowDialog',
+    'StopPolicy',
     'Style',
     'Theme',
+    'load_records',
     'main',
+    'open_dialog',
+    'replay_answers',
     'show_dialog',
+    'show_dialog_async',
+    'show_sequence',
 ]
+
+_LAZY_ATTRIBUTES = {
+    'ShowDialog': ('.ui.show_dialog', 'ShowDialog'),
+}
+"""
+Attributes that depend on Qt, mapped to ``(module, attribute)``.
+
+These are only imported when first accessed, so that using the data classes (ex ``Inputs``) doesn't
+load PySide6, the Qt resources, ``qdarkstyle`` or ``markdown``.
+"""
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attribute_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    attribute = getattr(importlib.import_module(module_name, __name__), attribute_name)
+    globals()[name] = attribute  # Next lookups don't go through `__getattr__`
+
+    return attribute
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+startup_trace.package_imported = time.perf_counter()
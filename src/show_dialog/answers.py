@@ -0,0 +1,124 @@
+"""
+Answers to the dialogs, to run without a person, ex in CI.
+
+The answers are loaded from a file with ``--auto-answer answers.yaml``::
+
+    answers:
+      - title: Turn on the device
+        exit_code: Fail
+      - inputs_hash: 3f2a
+        exit_code: Pass
+        delay: 0.5
+      - exit_code: Pass  # All other dialogs
+
+Each dialog gets the first answer that matches its inputs.
+"""
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+
+from mashumaro import DataClassDictMixin, field_options
+
+from .data_class import JSONFileMixin
+from .exit_code import ExitCode
+from .inputs import Inputs
+
+
+def _deserialize_exit_code(value: str | int) -> ExitCode:
+    """Exit code from its name, ex ``Fail``, or value, ex ``2``."""
+    return ExitCode[value] if isinstance(value, str) else ExitCode(value)
+
+
+@dataclass(frozen=True)
+class Answer(DataClassDictMixin):
+    """
+    Answer to the dialogs with inputs that match ``title``, ``dialog_title`` and ``inputs_hash``.
+
+    Fields that are not set match any inputs.
+    """
+
+    exit_code: ExitCode = field(
+        default=ExitCode.Pass,
+        metadata=field_options(
+            serialize=lambda exit_code: exit_code.name, deserialize=_deserialize_exit_code
+        ),
+    )
+    """Exit code of the dialog. Can be the name, ex ``Fail``, or the value, ex ``2``."""
+
+    delay: float = 0
+    """Time in seconds until the dialog is answered."""
+
+    title: str = ''
+
+    dialog_title: str = ''
+
+    inputs_hash: str = ''
+    """
+    Start of the ``Inputs.content_hash()``, to match inputs with the same titles. Shown in the logs
+    when the dialog is answered.
+    """
+
+    times: int = 0
+    """Number of dialogs answered with this answer, ``0`` for any number."""
+
+    def matches(self, inputs: Inputs) -> bool:
+        if self.title and self.title != inputs.title:
+            return False
+        if self.dialog_title and self.dialog_title != inputs.dialog_title:
+            return False
+        return not self.inputs_hash or inputs.content_hash().startswith(self.inputs_hash)
+
+
+NO_ANSWER = Answer(exit_code=ExitCode.Unknown)
+"""Answer to the dialogs that don't match any answer."""
+
+
+@dataclass(frozen=True)
+class Answers(JSONFileMixin):
+    """Answers to the dialogs, instead of a person."""
+
+    answers: list[Answer] = field(default_factory=list)
+    """The first answer that matches the inputs is used."""
+
+    build_dialog: bool = True
+    """
+    Whether the dialog is built and shown before being answered, which goes through the same code
+    as with a person. If ``False``, Qt is not loaded, which is faster.
+    """
+
+    _used: Counter[int] = field(
+        default_factory=Counter,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata=field_options(serialize='omit'),
+    )
+    """Number of dialogs answered with each answer, by index."""
+
+    def answer(self, inputs: Inputs) -> Answer:
+        """
+        First answer that matches the inputs and was not used its number of ``times``.
+
+        :return: The answer, or ``NO_ANSWER`` if no answer matches, which exits with
+            ``ExitCode.Unknown``.
+        """
+        answer = None
+        for index, candidate in enumerate(self.answers):
+            if candidate.matches(inputs) and (
+                not candidate.times or self._used[index] < candidate.times
+            ):
+                self._used[index] += 1
+                answer = candidate
+                break
+        if answer is None:
+            logging.error(
+                f'No answer for the inputs with title `{inputs.title}` and hash '
+                f'`{inputs.content_hash()}`.'
+            )
+            return NO_ANSWER
+        logging.debug(
+            f'Answer `{answer.exit_code.name}` for the inputs with title `{inputs.title}` and hash '
+            f'`{inputs.content_hash()}`.'
+        )
+        return answer
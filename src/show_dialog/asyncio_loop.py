@@ -0,0 +1,187 @@
+"""
+Show dialogs from ``asyncio`` code, with Qt and ``asyncio`` running in one event loop.
+
+``QtEventLoop`` is an ``asyncio`` event loop that runs the Qt event loop while waiting for I/O or
+timers, so the dialogs are responsive while coroutines are awaited and no threads are needed::
+
+    asyncio.set_event_loop_policy(QtEventLoopPolicy())
+    asyncio.run(main())
+
+In ``main()``, prompts are awaited with ``show_dialog_async()``, ex concurrently with
+``asyncio.gather()`` or with a timeout with ``asyncio.wait_for()``.
+
+``PySide6.QtAsyncio`` is not used because it requires Python 3.12.
+"""
+
+import asyncio
+import math
+import selectors
+from typing import TYPE_CHECKING
+
+from .exit_code import ExitCode
+from .inputs import Inputs
+from .ipc.ipc_params import IpcParams
+from .runtime import DialogRuntime
+
+if TYPE_CHECKING:
+    from PySide6.QtCore import QEventLoop, QSocketNotifier
+
+
+class _QtSelector(selectors.BaseSelector):
+    """
+    Selector that runs the Qt event loop while waiting for the files to be ready.
+
+    The files are watched with ``QSocketNotifier`` and the actual selecting is done by the default
+    selector, without waiting.
+    """
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._notifiers: dict[int, list['QSocketNotifier']] = {}
+        self._qt_loop: 'QEventLoop | None' = None
+
+    def register(self, fileobj, events, data=None):
+        from PySide6.QtCore import QSocketNotifier
+
+        key = self._selector.register(fileobj, events, data)
+        notifiers = []
+        for event, notifier_type in [
+            (selectors.EVENT_READ, QSocketNotifier.Type.Read),
+            (selectors.EVENT_WRITE, QSocketNotifier.Type.Write),
+        ]:
+            if events & event:
+                notifier = QSocketNotifier(key.fd, notifier_type)
+                notifier.setEnabled(False)  # Only enabled while selecting
+                notifier.activated.connect(self.wake)
+                notifiers.append(notifier)
+        self._notifiers[key.fd] = notifiers
+        return key
+
+    def unregister(self, fileobj):
+        key = self._selector.unregister(fileobj)
+        for notifier in self._notifiers.pop(key.fd):
+            notifier.setEnabled(False)
+        return key
+
+    def select(self, timeout=None):
+        from PySide6.QtCore import QEventLoop, Qt, QTimer
+
+        ready = self._selector.select(0)
+        if ready or (timeout is not None and timeout <= 0):
+            return ready
+
+        self._qt_loop = QEventLoop()
+        timer = None
+        if timeout is not None:
+            timer = QTimer()
+            timer.setSingleShot(True)
+            timer.setTimerType(Qt.TimerType.PreciseTimer)
+            timer.timeout.connect(self._qt_loop.quit)
+            timer.start(math.ceil(timeout * 1000))
+        notifiers = [notifier for notifiers in self._notifiers.values() for notifier in notifiers]
+        for notifier in notifiers:
+            notifier.setEnabled(True)
+        try:
+            self._qt_loop.exec()
+        finally:
+            for notifier in notifiers:
+                notifier.setEnabled(False)
+            if timer:
+                timer.stop()
+            self._qt_loop = None
+
+        return self._selector.select(0)
+
+    def wake(self):
+        """Stop waiting, ex when a callback is scheduled from a Qt slot."""
+        if self._qt_loop is not None:
+            self._qt_loop.quit()
+
+    def get_map(self):
+        return self._selector.get_map()
+
+    def close(self):
+        for fd in list(self._notifiers):
+            for notifier in self._notifiers.pop(fd):
+                notifier.setEnabled(False)
+        self._selector.close()
+
+
+class QtEventLoop(asyncio.SelectorEventLoop):
+    """
+    ``asyncio`` event loop that runs the Qt event loop while waiting.
+
+    Creates the ``QApplication`` if it doesn't exist. Must run in the thread where the
+    ``QApplication`` is created, usually the main thread.
+    """
+
+    def __init__(self):
+        from PySide6.QtWidgets import QApplication
+
+        QApplication.instance() or QApplication()
+        self._qt_selector = _QtSelector()
+        self._runtime: DialogRuntime | None = None
+        super().__init__(self._qt_selector)
+
+    def call_soon(self, callback, *args, context=None):
+        handle = super().call_soon(callback, *args, context=context)
+        # Called from a Qt slot, ex a dialog exited, the callback runs without waiting for Qt
+        self._qt_selector.wake()
+        return handle
+
+    def call_at(self, when, callback, *args, context=None):
+        timer_handle = super().call_at(when, callback, *args, context=context)
+        self._qt_selector.wake()
+        return timer_handle
+
+    @property
+    def runtime(self) -> DialogRuntime:
+        """Runtime used by ``show_dialog_async()`` by default, until the loop is closed."""
+        if self._runtime is None:
+            self._runtime = DialogRuntime().__enter__()
+        return self._runtime
+
+    def close(self):
+        if self._runtime is not None:
+            self._runtime.__exit__(None, None, None)
+            self._runtime = None
+        super().close()
+
+
+class QtEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    """Event loop policy with ``QtEventLoop`` as the event loop, ex for ``asyncio.run()``."""
+
+    def new_event_loop(self) -> QtEventLoop:
+        return QtEventLoop()
+
+
+async def show_dialog_async(
+    inputs: Inputs,
+    *,
+    runtime: DialogRuntime | None = None,
+    ipc_params: IpcParams | None = None,
+) -> ExitCode:
+    """
+    Show the dialog and wait for it to exit, without blocking the event loop.
+
+    If cancelled, ex with ``asyncio.wait_for()``, the dialog exits with ``ExitCode.Cancel``.
+
+    :param inputs: Inputs to the dialog.
+    :param runtime: Runtime to show the dialog, ex to set the style. Default is the runtime of the
+        event loop, with the default style.
+    :param ipc_params: Inter-Process Communication parameters.
+    :return: Exit code of the dialog.
+    :raises RuntimeError: If the running event loop is not a ``QtEventLoop``.
+    """
+    loop = asyncio.get_running_loop()
+    if not isinstance(loop, QtEventLoop):
+        raise RuntimeError('Dialogs require the Qt event loop. See `QtEventLoopPolicy`.')
+    if runtime is None:
+        runtime = loop.runtime
+
+    future = runtime.open(inputs, ipc_params=ipc_params)
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        runtime.cancel(future)
+        raise
@@ -15,6 +15,17 @@ def is_truthy(value) -> bool:
     return str(value).strip().lower() in ['true', '1']
 
 
+def _user_cache_dir() -> Path:
+    """Per-user cache directory, following the conventions of each OS."""
+    if sys.platform == 'win32':
+        base_dir = Path(os.environ.get('LOCALAPPDATA', Path.home() / 'AppData' / 'Local'))
+    elif sys.platform == 'darwin':
+        base_dir = Path.home() / 'Library' / 'Caches'
+    else:
+        base_dir = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'))
+    return base_dir / 'show_dialog'
+
+
 # region Run configs
 IS_BUNDLED_APP = getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS')
 """
@@ -42,6 +53,45 @@ else:
 ASSETS_DIR = PROJECT_ROOT / 'assets'
 
 DEFAULT_STYLE = os.environ.get('SHOW_DIALOG_DEFAULT_STYLE', Style.Style02.value)
+
+CACHE_DIR = Path(os.environ.get('SHOW_DIALOG_CACHE_DIR', '') or _user_cache_dir())
+"""
+Directory where files generated at runtime are cached across runs.
+
+Set with the environment variable ``SHOW_DIALOG_CACHE_DIR``.
+"""
+
+STYLESHEET_CACHE = is_truthy(os.environ.get('SHOW_DIALOG_STYLESHEET_CACHE', 'True'))
+"""
+Whether to save the generated app stylesheets in ``CACHE_DIR``, so that following runs don't need
+to generate them again.
+
+Set the environment variable ``SHOW_DIALOG_STYLESHEET_CACHE`` to ``False`` or ``0`` to disable.
+"""
+
+DAEMON_PORT = int(os.environ.get('SHOW_DIALOG_DAEMON_PORT', '47823'))
+"""
+Port on ``localhost`` where the daemon started with ``show_dialog --serve`` listens for dialogs to
+show, sent by the launcher ``show_dialog_launcher``.
+
+Set with the environment variable ``SHOW_DIALOG_DAEMON_PORT``.
+"""
+
+MAX_VISIBLE_DIALOGS = int(os.environ.get('SHOW_DIALOG_MAX_VISIBLE_DIALOGS', '5'))
+"""
+Maximum number of dialogs shown at once by the daemon started with ``show_dialog --serve``. The
+other dialogs wait, by priority, until one exits. ``0`` for no limit.
+
+Set with the environment variable ``SHOW_DIALOG_MAX_VISIBLE_DIALOGS``.
+"""
+
+RECORD_FILE = os.environ.get('SHOW_DIALOG_RECORD_FILE', '')
+"""
+File where each dialog is recorded when it exits, to replay the session later. See ``recording``.
+Empty to not record.
+
+Set with ``--record`` or the environment variable ``SHOW_DIALOG_RECORD_FILE``.
+"""
 # endregion
 
 # region Global constants
@@ -70,6 +70,32 @@ class JSONFileMixin(DataClassJSONMixin):
                 data = yaml.safe_load(f)
         return cls.from_dict(data, **from_dict_kwargs)
 
+    @classmethod
+    def list_from_file(
+        cls: Type[T],
+        file: str | Path,
+        file_type: DataFileType = DataFileType.AUTO,
+        **from_dict_kwargs: Any,
+    ) -> list[T]:
+        """
+        Load a list of instances from a file with a list, or a YAML file with multiple documents.
+
+        A file with one instance is loaded as a list with one instance.
+        """
+        file_path = Path(file)
+        if file_type is DataFileType.AUTO:
+            file_type = DataFileType.from_file(file_path)
+
+        with open(file_path) as f:
+            if file_type is DataFileType.JSON:
+                data = json.load(f)
+            else:
+                documents = [document for document in yaml.safe_load_all(f) if document is not None]
+                data = documents[0] if len(documents) == 1 else documents
+        if not isinstance(data, list):
+            data = [data]
+        return [cls.from_dict(item, **from_dict_kwargs) for item in data]
+
 
 class DefaultsMixin(DataClassDictMixin):
     """
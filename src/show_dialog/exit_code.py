@@ -1,4 +1,4 @@
-from enum import IntEnum
+from enum import Enum, IntEnum
 
 
 class ExitCode(IntEnum):
@@ -34,3 +34,22 @@ class ExitCode(IntEnum):
     """
     Timeout occurred and ``timeout_pass`` is ``False`` in inputs.
     """
+
+
+class ExitSource(str, Enum):
+    """How the dialog exited, ie, where the exit code came from."""
+
+    BUTTON = 'button'
+    """One of the buttons was clicked."""
+    SHORTCUT = 'shortcut'
+    """One of the shortcuts was used, ex ``Ctrl+P``."""
+    CLOSE = 'close'
+    """The window was closed, ex with the ``X`` button."""
+    TIMEOUT = 'timeout'
+    """Timeout occurred."""
+    IPC = 'ipc'
+    """A message was received by the IPC server."""
+    ANSWER = 'answer'
+    """Answered automatically, ex with ``--auto-answer``."""
+    API = 'api'
+    """Exited from code, ex ``DialogRuntime.cancel()``."""
@@ -1,3 +1,5 @@
+import hashlib
+import json
 from dataclasses import dataclass
 from enum import Enum
 
@@ -138,3 +140,19 @@ class Inputs(JSONFileMixin, DefaultsMixin):
 
     See the ``Theme`` class for available options.
     """
+
+    priority: int = 0
+    """
+    When many dialogs are requested at once, ex from the daemon, the dialogs with higher priority
+    are shown first. Can be negative.
+    """
+
+    def content_hash(self) -> str:
+        """
+        SHA-256 of the inputs as hex, which is the same for equal inputs.
+
+        The ``priority`` is not included, as it's not part of what's shown.
+        """
+        content = self.to_dict()
+        del content['priority']
+        return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
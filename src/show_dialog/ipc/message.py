@@ -16,6 +16,12 @@ class MessageType(str, Enum):
     ACK = 'ack'
     PASS = 'pass'
     FAIL = 'fail'
+    SHOW = 'show'
+    """
+    Show the dialog that was started hidden.
+
+    ``data`` can have fields of ``Inputs`` to change before showing, see ``REVEAL_INPUTS_FIELDS``.
+    """
 
 
 class MessageId:
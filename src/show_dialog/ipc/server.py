@@ -1,6 +1,8 @@
 import logging
 import selectors
 import socket
+import sys
+import threading
 from typing import Callable
 
 from .ipc_params import IpcParams
@@ -13,16 +15,32 @@ class IpcServer:
         self.process = process
         self.sel = selectors.DefaultSelector()
         self.loop = True
+        # Written to in `stop()`, to wake up the event loop. Created in `start()`
+        self._wakeup_writer: socket.socket | None = None
+        self._wakeup_lock = threading.Lock()
 
     def start(self):
         # Create a TCP socket
         server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if sys.platform == 'win32':
+            # Other processes can't bind the port and receive the messages
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+        else:
+            # Bind right away after a previous server, ex of the previous dialog
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         server_socket.bind((self.params.host, self.params.port))
         server_socket.listen()
         server_socket.setblocking(False)  # Set the socket to non-blocking
 
+        with self._wakeup_lock:
+            if not self.loop:  # Stopped before starting
+                server_socket.close()
+                return
+            wakeup_reader, self._wakeup_writer = socket.socketpair()
+
         # Register the server socket to the selector
         self.sel.register(server_socket, selectors.EVENT_READ, self.accept)
+        self.sel.register(wakeup_reader, selectors.EVENT_READ, lambda _: None)
 
         logging.debug(f'Server is listening at {self.params.host}:{self.params.port}')
 
@@ -44,10 +62,18 @@ class IpcServer:
         finally:
             logging.debug('Server is closing.')
             self.sel.close()
+            server_socket.close()
+            wakeup_reader.close()
+            with self._wakeup_lock:
+                self._wakeup_writer.close()
+                self._wakeup_writer = None
 
     def stop(self):
         logging.debug('Server is stopping.')
-        self.loop = False
+        with self._wakeup_lock:
+            self.loop = False
+            if self._wakeup_writer is not None:
+                self._wakeup_writer.send(b'\0')
 
     def accept(self, sock):
         """Callback function to handle incoming connections."""
@@ -0,0 +1,118 @@
+"""
+Thin client that shows dialogs in the daemon started with ``show_dialog --serve``.
+
+Takes the same arguments as ``show_dialog`` and exits with the same ``ExitCode``, but doesn't load
+Qt, so the dialog is displayed much faster. If the daemon is not running, the dialog is shown in
+this process instead.
+
+The launcher and the daemon exchange JSON messages, one per line. The launcher sends a
+``LaunchRequest`` and the daemon replies with a ``LaunchResponse`` when the dialog exits.
+"""
+
+import json
+import logging
+import socket
+from dataclasses import dataclass
+from pathlib import Path
+
+from . import config
+from .data_class import JSONFileMixin
+from .exit_code import ExitCode
+from .inputs import Inputs
+from .ipc.ipc_params import IpcParams
+from .style import Style
+
+DAEMON_HOST = '127.0.0.1'
+CONNECT_TIMEOUT = 2.0
+"""Timeout in seconds to connect to the daemon. There's no timeout waiting for the dialog."""
+
+
+@dataclass(frozen=True)
+class LaunchRequest(JSONFileMixin):
+    """Dialog to show in the daemon."""
+
+    inputs: Inputs
+    style: Style | None = None
+    stylesheet: str | None = None
+    """Contents of the stylesheet, not the path. Ignored if ``style`` is set."""
+    ipc_params: IpcParams | None = None
+    hidden: bool = False
+    """Start the dialog hidden, until the IPC server receives a ``show`` message."""
+
+
+@dataclass(frozen=True)
+class LaunchResponse(JSONFileMixin):
+    """Sent by the daemon when the dialog exits."""
+
+    exit_code: ExitCode
+
+
+def launch(request: LaunchRequest, port: int = config.DAEMON_PORT) -> ExitCode:
+    """
+    Show the dialog in the daemon and wait for it to exit.
+
+    :raises ConnectionRefusedError: If the daemon is not running.
+    """
+    with socket.create_connection((DAEMON_HOST, port), timeout=CONNECT_TIMEOUT) as daemon_socket:
+        daemon_socket.settimeout(None)
+        daemon_socket.sendall(json.dumps(request.to_dict()).encode() + b'\n')
+        with daemon_socket.makefile('rb') as f:
+            response = f.readline()
+
+    if not response:
+        logging.error('Daemon closed the connection before the dialog exited.')
+        return ExitCode.Unknown
+    return LaunchResponse.from_json(response).exit_code
+
+
+def main():
+    from .main import _exit, _parse_args, _set_config_values, show_dialog
+
+    args = _parse_args()
+    if args.serve:
+        raise ValueError('Start the daemon with `show_dialog --serve`.')
+    inputs, ipc_params, answers = _set_config_values(args)
+    if isinstance(inputs, list):
+        raise ValueError('Sequences of inputs are shown with `show_dialog`, not the launcher.')
+    if answers is not None:
+        raise ValueError('Answers are used with `show_dialog`, not the launcher.')
+    if args.record:
+        raise ValueError(
+            'Dialogs shown by the daemon are recorded with `SHOW_DIALOG_RECORD_FILE` set for the '
+            'daemon.'
+        )
+    if args.validate_only:
+        logging.info('Arguments are valid.')
+        return
+
+    style, stylesheet = None, None
+    if args.stylesheet in {style.value for style in Style}:
+        style = Style(args.stylesheet)
+    elif args.stylesheet:
+        stylesheet = Path(args.stylesheet).read_text()
+    request = LaunchRequest(
+        inputs, style=style, stylesheet=stylesheet, ipc_params=ipc_params, hidden=args.hidden
+    )
+
+    try:
+        exit_code = launch(request)
+    except ConnectionRefusedError:
+        logging.debug('Daemon is not running, showing the dialog in this process.')
+        exit_code = show_dialog(
+            inputs,
+            stylesheet=stylesheet,
+            style=style,
+            ipc_params=ipc_params,
+            hidden=args.hidden,
+            mode='return',
+        )
+    else:
+        if exit_code is not ExitCode.Pass:
+            logging.error(f'Error: {exit_code} - {exit_code.name}')
+
+    logging.debug(f'Launcher exiting with code {exit_code} - {exit_code.name}.')
+    _exit(exit_code, fast=args.fast_exit)
+
+
+if __name__ == '__main__':
+    main()
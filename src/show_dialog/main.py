@@ -1,24 +1,30 @@
 import logging
+import os
 import pprint
 import sys
+import time
 import types
-from typing import Literal
-
-from PySide6.QtWidgets import QApplication
+from typing import Iterable, Literal
 
 from . import config
-from .exit_code import ExitCode
+from .answers import Answers
+from .exit_code import ExitCode, ExitSource
 from .inputs import Inputs
 from .ipc.ipc_params import IpcParams
-from .ui.show_dialog import ShowDialog
-from .utils_qt import list_resources, read_file
+from .recording import record_dialog, replay_answers
+from .sequence import StopPolicy
+from .startup_trace import startup_trace
+from .style import Style
 
 
 def show_dialog(
     inputs: Inputs,
     *,
-    stylesheet: str = config.DEFAULT_STYLE,
+    stylesheet: str | None = None,
+    style: Style | None = None,
     ipc_params: IpcParams | None = None,
+    hidden: bool = False,
+    answers: Answers | None = None,
     mode: Literal['exit', 'raise', 'return'] = 'exit',
 ) -> ExitCode:
     """
@@ -27,21 +33,25 @@ def show_dialog(
     :param inputs: Inputs to the dialog.
     :param stylesheet: Stylesheet to be used. This is the whole stylesheet as a string, not a path
         to a stylesheet file.
+    :param style: One of the included styles. If set, the theme and style are loaded from a
+        prebuilt theme pack in the resources and ``stylesheet`` is ignored. If neither is set, the
+        style in ``config.DEFAULT_STYLE`` is used.
     :param ipc_params: Inter-Process Communication parameters.
+    :param hidden: Start with the dialog ready but hidden, until a ``show`` message is received by
+        the IPC server. Requires ``ipc_params``.
+    :param answers: Answer the dialog instead of a person, ex in CI. If ``answers.build_dialog`` is
+        ``False``, Qt is not loaded and the dialog is not shown.
     :param mode: One of:
         * ``exit``: Exit with ``sys.exit(code)``.
         * ``raise``: Raise a ``ValueError`` exception if there was an error.
         * ``return``: Return an ``ExitCode``, regardless of whether there was an error.
     """
-
-    app: QApplication = QApplication.instance()  # type: ignore
-    if not app:
-        app = QApplication()
-    window = ShowDialog(app, inputs, stylesheet=stylesheet, ipc_params=ipc_params)
-    window.show()
-    app_response = app.exec()
-    app.closeAllWindows()
-    exit_code = ExitCode(app_response)
+    if hidden and ipc_params is None:
+        raise ValueError('IPC parameters are required to start the dialog hidden.')
+    if answers is not None and not answers.build_dialog:
+        exit_code = _answer(inputs, answers)
+    else:
+        exit_code = _show_dialog(inputs, stylesheet, style, ipc_params, hidden, answers)
 
     if exit_code is not ExitCode.Pass:
         msg = f'Error: {exit_code} - {exit_code.name}'
@@ -55,9 +65,95 @@ def show_dialog(
     return exit_code
 
 
-def _parse_args():
+def _show_dialog(
+    inputs: Inputs,
+    stylesheet: str | None,
+    style: Style | None,
+    ipc_params: IpcParams | None,
+    hidden: bool,
+    answers: Answers | None,
+) -> ExitCode:
+    """Show the dialog and return its exit code. See ``show_dialog()``."""
+    # Qt is imported here and not at module level, so that importing this module is Qt free
+    with startup_trace.phase('import_qt'):
+        from PySide6.QtWidgets import QApplication
+
+        from .ui.show_dialog import ShowDialog
+
+    if style is None and stylesheet is None:
+        style, stylesheet = _default_style()
+    app: QApplication = QApplication.instance()  # type: ignore
+    if not app:
+        with startup_trace.phase('qapplication'):
+            app = QApplication()
+    with startup_trace.phase('show_dialog'):
+        window = ShowDialog(
+            app, inputs, stylesheet=stylesheet, style=style, ipc_params=ipc_params, answers=answers
+        )
+    if hidden:
+        with startup_trace.phase('prepare'):
+            window.prepare()
+    else:
+        with startup_trace.phase('show'):
+            window.show()
+    app_response = app.exec()
+    app.closeAllWindows()
+    window.deleteLater()  # Otherwise the dialog is kept and restyled with the next dialogs
+
+    return ExitCode(app_response)
+
+
+def _answer(inputs: Inputs, answers: Answers) -> ExitCode:
+    """Answer the dialog without showing it, or loading Qt."""
+    answer = answers.answer(inputs)
+    time.sleep(answer.delay)
+    record_dialog(inputs, answer.exit_code, ExitSource.ANSWER, answer.delay)
+    return answer.exit_code
+
+
+def show_sequence(
+    all_inputs: Iterable[Inputs],
+    *,
+    stylesheet: str | None = None,
+    style: Style | None = None,
+    stop_policy: StopPolicy = StopPolicy.FAIL,
+    answers: Answers | None = None,
+) -> list[ExitCode]:
+    """
+    Show the dialogs one after the other, ex the steps of a manual test procedure, in one window
+    that is updated in place between them.
+
+    :param all_inputs: Inputs to each dialog, ie, step.
+    :param stylesheet: Stylesheet to be used. This is the whole stylesheet as a string, not a path
+        to a stylesheet file.
+    :param style: One of the included styles. If set, ``stylesheet`` is ignored. If neither is set,
+        the style in ``config.DEFAULT_STYLE`` is used.
+    :param stop_policy: When to stop without showing the remaining steps.
+    :param answers: Answer the dialogs instead of a person, ex in CI. If ``answers.build_dialog``
+        is ``False``, Qt is not loaded and the dialogs are not shown.
+    :return: Exit codes of the steps that were shown.
+    """
+    if answers is not None and not answers.build_dialog:
+        exit_codes = []
+        for inputs in all_inputs:
+            exit_codes.append(_answer(inputs, answers))
+            if stop_policy.stops(exit_codes[-1]):
+                break
+        return exit_codes
+
+    from .runtime import DialogRuntime
+
+    with DialogRuntime(stylesheet=stylesheet, style=style, pool_size=0, answers=answers) as runtime:
+        return runtime.show_sequence(all_inputs, stop_policy=stop_policy)
+
+
+def _parse_args(args: list[str] | None = None):
     """
     Parse CLI arguments.
+
+    Does not import Qt, so that ``--help``, ``--version`` and argument errors are fast.
+
+    :param args: Arguments to parse. Default is ``sys.argv``.
     """
     from argparse import ArgumentParser, RawTextHelpFormatter
 
@@ -76,14 +172,26 @@ def _parse_args():
         '--inputs-file',
         type=str,
         help='Path to JSON or YAML file that maps to the `Inputs` class.\n'
-        'If both `--inputs` and `--inputs-file` are specified, `--inputs` takes precedence.',
+        'If both `--inputs` and `--inputs-file` are specified, `--inputs` takes precedence.\n'
+        'A file with a list of inputs, or a YAML file with multiple documents, is a sequence: the '
+        'dialogs are shown one after the other in one window. Exits with the code of the first '
+        'step that did not pass.',
+    )
+    parser.add_argument(
+        '--stop-on',
+        choices=[policy.value for policy in StopPolicy],
+        default=StopPolicy.FAIL.value,
+        help='With a sequence of inputs, when to stop without showing the remaining steps:\n'
+        '  `fail`: At the first step that does not pass.\n'
+        '  `cancel`: Only if a step is cancelled, ie, the window is closed.\n'
+        '  `never`: Show all the steps.',
     )
     parser.add_argument(
         '--stylesheet',
         type=str,
         default=config.DEFAULT_STYLE,
         help=f'Path to CSS file to apply. Can be a path to an external file or one of the included '
-        f'{", ".join("`"+file+"`" for file in list_resources(":/stylesheets"))}',
+        f'{", ".join("`" + style.value + "`" for style in Style)}',
     )
     parser.add_argument(
         '--ipc',
@@ -98,6 +206,46 @@ def _parse_args():
         help='Path to JSON file that maps to the `IpcParams` class.\n'
         'If both `--ipc` and `--ipc-file` are specified, `--ipc` takes precedence.',
     )
+    parser.add_argument(
+        '--hidden',
+        action='store_true',
+        help='Start with the dialog ready but hidden, and show it when the IPC server receives a '
+        '`show` message.\nThe message can change the texts in the inputs. Requires `--ipc` or '
+        '`--ipc-file`.',
+    )
+    parser.add_argument(
+        '--auto-answer',
+        type=str,
+        metavar='FILE',
+        help='Path to JSON or YAML file that maps to the `Answers` class, to answer the dialogs '
+        'without a person, ex in CI.\nEach dialog is answered with the exit code of the first '
+        'answer that matches its inputs, by title, dialog title or hash.\nThe dialog is shown on '
+        'the `offscreen` Qt platform, unless `QT_QPA_PLATFORM` is set.',
+    )
+    parser.add_argument(
+        '--record',
+        type=str,
+        metavar='FILE',
+        help='Append each dialog, its exit code, what made it exit and the time to answer to '
+        '`FILE`, one line of JSON per dialog, to replay the session later with `--replay`.\n'
+        'Can also be set with the environment variable `SHOW_DIALOG_RECORD_FILE`.',
+    )
+    parser.add_argument(
+        '--replay',
+        type=str,
+        metavar='FILE',
+        help='Answer the dialogs as recorded with `--record` in `FILE`: each dialog is answered '
+        'with the exit code recorded for the same inputs, in the order recorded, after the '
+        'recorded time to answer.\nLike `--auto-answer`, the dialog is shown on the `offscreen` '
+        'Qt platform, unless `QT_QPA_PLATFORM` is set.',
+    )
+    parser.add_argument(
+        '--replay-speed',
+        type=float,
+        default=1.0,
+        help='With `--replay`, how many times faster to answer than recorded, ex `10`. `0` to '
+        'answer right away.',
+    )
     parser.add_argument(
         '--log-level',
         # Can use `logging.getLevelNamesMapping()` instead of `_nameToLevel` on python 3.11+
@@ -105,6 +253,48 @@ def _parse_args():
         default='info',
         help='Log level to use.',
     )
+    parser.add_argument(
+        '--validate-only',
+        action='store_true',
+        help='Validate the inputs, stylesheet and IPC parameters and exit without showing the '
+        'dialog.\nExits with code 0 if valid. Qt is not loaded.',
+    )
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Run as a daemon that keeps Qt loaded and shows the dialogs requested with '
+        '`show_dialog_launcher`, which takes the same arguments as this app.\nListens on '
+        '`localhost`, at the port set with the environment variable `SHOW_DIALOG_DAEMON_PORT`.',
+    )
+    parser.add_argument(
+        '--fork',
+        action='store_true',
+        help='With `--serve`, show each dialog in a new process, forked from the daemon, which has '
+        'Qt and the app already imported.\nSlower than showing the dialogs in the daemon, but each '
+        'dialog runs in its own process. Linux only.',
+    )
+    parser.add_argument(
+        '--dashboard',
+        action='store_true',
+        help='With `--serve`, show the dialogs as rows in one dashboard window, with their title, '
+        'description, timeout and buttons, instead of one window per dialog, ex for the prompts '
+        'of many test stations.\nDialogs with IPC parameters are still shown in their own window.',
+    )
+    parser.add_argument(
+        '--startup-trace',
+        nargs='?',
+        const='-',
+        metavar='FILE',
+        help='Record the time of each startup phase, until the dialog is displayed, and save it as '
+        'JSON to `FILE`.\nIf `FILE` is not specified, the JSON is written to stderr.',
+    )
+    parser.add_argument(
+        '--fast-exit',
+        action='store_true',
+        help='Exit right after the dialog exits, skipping the clean up of Qt and Python objects, '
+        'so that the calling process gets the exit code sooner.\nLogs and output are written '
+        'before exiting.',
+    )
     parser.add_argument(
         '-v',
         '--version',
@@ -112,12 +302,28 @@ def _parse_args():
         version=__version__,
     )
 
-    return parser.parse_args()
+    parsed_args = parser.parse_args(args)
+    if not parsed_args.serve:
+        for option in ('fork', 'dashboard'):
+            if getattr(parsed_args, option):
+                parser.error(f'`--{option}` requires `--serve`.')
+    elif parsed_args.fork and parsed_args.dashboard:
+        parser.error('`--dashboard` is not supported with `--fork`.')
 
+    return parsed_args
 
-def _set_config_values(args) -> tuple[Inputs, str | None, IpcParams | None]:
+
+def _set_config_values(args) -> tuple[Inputs | list[Inputs], IpcParams | None, Answers | None]:
     """
-    Set ``config`` values.
+    Set ``config`` values and validate the arguments.
+
+    The inputs are a list if the inputs file is a sequence, with more than one inputs.
+
+    Does not import Qt. The stylesheet is validated, but read later with ``_read_stylesheet``, as
+    reading from the Qt resources requires Qt.
+
+    :raises ValueError: If the arguments are not valid.
+    :raises FileNotFoundError: If a file in the arguments does not exist.
     """
     from . import __version__
 
@@ -127,6 +333,9 @@ def _set_config_values(args) -> tuple[Inputs, str | None, IpcParams | None]:
         f'File: {sys.executable}'
     )
 
+    if args.record:
+        config.RECORD_FILE = args.record
+
     # Config contents
     config_dict = {
         key: getattr(config, key, '__UNDEFINED__')
@@ -146,29 +355,45 @@ def _set_config_values(args) -> tuple[Inputs, str | None, IpcParams | None]:
     logging.debug('Config:\n' + '\n'.join(f'  {key}: {val}' for key, val in config_dict.items()))
 
     # Inputs
+    inputs_start = time.perf_counter()
     inputs_json = args.inputs
     inputs_file = args.inputs_file
 
     if not (inputs_json or inputs_file):
         raise ValueError('Either `--inputs` or `--inputs-file` must be specified.')
 
-    inputs = Inputs()
+    inputs: Inputs | list[Inputs] = Inputs()
     if inputs_json:
-        inputs = Inputs.from_json(inputs_json)
+        inputs = inputs_from_json = Inputs.from_json(inputs_json)
     if inputs_file:
-        inputs_from_file = Inputs.from_file(inputs_file)
+        all_inputs_from_file = Inputs.list_from_file(inputs_file)
+        if not all_inputs_from_file:
+            raise ValueError(f'No inputs in `{inputs_file}`.')
         if inputs_json:
-            inputs = Inputs.from_dict(inputs_from_file.to_dict() | inputs.to_dict())
+            # `--inputs` applies to all the steps
+            all_inputs_from_file = [
+                Inputs.from_dict(inputs_from_file.to_dict() | inputs_from_json.to_dict())
+                for inputs_from_file in all_inputs_from_file
+            ]
+        if len(all_inputs_from_file) == 1:
+            inputs = all_inputs_from_file[0]
         else:
-            inputs = inputs_from_file
-    logging.debug(f'Inputs:\n{pprint.pformat(inputs.to_dict(), indent=2)}')
+            inputs = all_inputs_from_file
+    if isinstance(inputs, list):
+        logging.debug(
+            f'Sequence of {len(inputs)} inputs:\n'
+            + '\n'.join(pprint.pformat(step.to_dict(), indent=2) for step in inputs)
+        )
+    else:
+        logging.debug(f'Inputs:\n{pprint.pformat(inputs.to_dict(), indent=2)}')
+    startup_trace.record('set_config_values.inputs', inputs_start)
 
     # Stylesheet
-    css = None
-    if args.stylesheet:
-        css = read_file(args.stylesheet)
+    with startup_trace.phase('set_config_values.stylesheet'):
+        _validate_stylesheet(args.stylesheet)
 
     # IPC params
+    ipc_params_start = time.perf_counter()
     ipc_params_json = args.ipc
     ipc_params_file = args.ipc_file
     ipc_params = None
@@ -182,15 +407,144 @@ def _set_config_values(args) -> tuple[Inputs, str | None, IpcParams | None]:
             ipc_params = ipc_params_from_file
     if ipc_params:
         logging.debug(f'IPC params:\n{pprint.pformat(ipc_params.to_dict(), indent=2)}')
+        if isinstance(inputs, list):
+            raise ValueError('IPC is not supported with a sequence of inputs.')
+    elif args.hidden:
+        raise ValueError('`--hidden` requires `--ipc` or `--ipc-file`.')
+    startup_trace.record('set_config_values.ipc_params', ipc_params_start)
 
-    return inputs, css, ipc_params
+    # Answers
+    answers = None
+    if args.auto_answer and args.replay:
+        raise ValueError('Only one of `--auto-answer` and `--replay` can be specified.')
+    if args.replay_speed < 0:
+        raise ValueError('`--replay-speed` must not be negative.')
+    if args.auto_answer:
+        answers = Answers.from_file(args.auto_answer)
+    elif args.replay:
+        answers = replay_answers(args.replay, speed=args.replay_speed)
+    if answers is not None:
+        logging.debug(f'Answers:\n{pprint.pformat(answers.to_dict(), indent=2)}')
+
+    return inputs, ipc_params, answers
+
+
+def _validate_stylesheet(stylesheet: str | None):
+    """
+    Verify the stylesheet exists, without reading it.
+
+    Files in the Qt resources can only be checked with Qt, so instead they're checked against the
+    included styles, which are all the stylesheets in the resources.
+    """
+    from pathlib import Path
+
+    if not stylesheet:
+        return
+    if stylesheet.startswith(':'):
+        if stylesheet not in {style.value for style in Style}:
+            raise FileNotFoundError(stylesheet)
+    elif not Path(stylesheet).is_file():
+        raise FileNotFoundError(stylesheet)
+
+
+def _read_stylesheet(stylesheet: str | None) -> str | None:
+    """
+    Read the stylesheet file, which can be in the Qt resources.
+    """
+    if not stylesheet:
+        return None
+
+    from .ui import resources  # noqa: F401  # Register Qt resources
+    from .utils_qt import read_file
+
+    return read_file(stylesheet)
+
+
+def _default_style() -> tuple[Style | None, str | None]:
+    """
+    Style and stylesheet from ``config.DEFAULT_STYLE``, which is one of the included styles or the
+    path to a stylesheet file.
+    """
+    if config.DEFAULT_STYLE in {style.value for style in Style}:
+        return Style(config.DEFAULT_STYLE), None
+    return None, _read_stylesheet(config.DEFAULT_STYLE)
+
+
+def _exit(exit_code: ExitCode, fast: bool = False):
+    """
+    Exit the process with the exit code.
+
+    :param fast: Exit with ``os._exit``, which skips the interpreter shutdown, where all the Qt
+        objects are deleted. Logging and the standard streams are flushed first. The IPC server, if
+        any, is already stopped when the dialog exits.
+    """
+    if fast:
+        logging.shutdown()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+    sys.exit(exit_code)
 
 
 def main():
+    _parse_args_start = time.perf_counter()
     _args = _parse_args()
-    _inputs, _stylesheet, _ipc_params = _set_config_values(_args)
-    _exit_code = show_dialog(_inputs, stylesheet=_stylesheet, ipc_params=_ipc_params, mode='return')
+    if _args.startup_trace:
+        startup_trace.enable(_args.startup_trace)
+    startup_trace.record('parse_args', _parse_args_start)
+    if _args.serve:
+        logging.basicConfig(level=logging.getLevelName(_args.log_level.upper()))
+        if _args.fork:
+            from .ui.zygote import serve
+
+            serve()
+        else:
+            from .ui.daemon import serve as serve_daemon
+
+            serve_daemon(dashboard=_args.dashboard)
+        return
+
+    with startup_trace.phase('set_config_values'):
+        _inputs, _ipc_params, _answers = _set_config_values(_args)
+    if _args.validate_only:
+        logging.info('Arguments are valid.')
+        startup_trace.finish()
+        return
+    if _args.stylesheet in {style.value for style in Style}:
+        # Included style, loaded with the theme from a theme pack
+        _style, _stylesheet = Style(_args.stylesheet), None
+    else:
+        with startup_trace.phase('read_stylesheet'):
+            _style, _stylesheet = None, _read_stylesheet(_args.stylesheet)
+    if _answers is not None and not os.environ.get('QT_QPA_PLATFORM'):
+        os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+    if isinstance(_inputs, list):
+        _exit_codes = show_sequence(
+            _inputs,
+            stylesheet=_stylesheet,
+            style=_style,
+            stop_policy=StopPolicy(_args.stop_on),
+            answers=_answers,
+        )
+        logging.info(f'Steps exit codes: {", ".join(code.name for code in _exit_codes)}')
+        _exit_code = next(
+            (code for code in _exit_codes if code is not ExitCode.Pass), ExitCode.Pass
+        )
+        if _exit_code is not ExitCode.Pass:
+            logging.error(f'Error: {_exit_code} - {_exit_code.name}')
+    else:
+        _exit_code = show_dialog(
+            _inputs,
+            stylesheet=_stylesheet,
+            style=_style,
+            ipc_params=_ipc_params,
+            hidden=_args.hidden,
+            answers=_answers,
+            mode='return',
+        )
+    startup_trace.finish()  # In case the dialog was not painted
     logging.debug(f'App exiting with code {_exit_code} - {_exit_code.name}.')
+    _exit(_exit_code, fast=_args.fast_exit)
 
 
 if __name__ == '__main__':
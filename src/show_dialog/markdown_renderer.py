@@ -0,0 +1,67 @@
+"""
+Markdown to HTML, for descriptions with ``description_md``.
+
+``markdown`` is imported only when first rendering. Creating a ``Markdown`` instance loads its
+extensions, so one instance is kept for each set of extensions and the rendered HTML is cached.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from markdown import Markdown
+
+
+class MarkdownRenderer:
+    """
+    Render Markdown to HTML, reusing the ``Markdown`` instances and caching the results.
+
+    Not thread safe.
+    """
+
+    def __init__(self, cache_size: int = 128):
+        """
+        :param cache_size: Number of rendered HTML texts to keep. The least recently used are
+            discarded first.
+        """
+        self.cache_size = cache_size
+        self._converters: dict[tuple[str, ...], 'Markdown'] = {}
+        self._cache: OrderedDict[tuple[str, tuple[str, ...]], str] = OrderedDict()
+
+    def converter(self, extensions: Iterable[str] = ()) -> 'Markdown':
+        """``Markdown`` instance with the extensions, created when first used."""
+        extensions = tuple(extensions)
+        if (converter := self._converters.get(extensions)) is None:
+            import markdown
+
+            converter = self._converters[extensions] = markdown.Markdown(extensions=extensions)
+        return converter
+
+    def render(self, text: str, extensions: Iterable[str] = ()) -> str:
+        """
+        Convert the Markdown ``text`` to HTML.
+
+        :param text: Markdown text.
+        :param extensions: Names of the ``markdown`` extensions to use, ex ``['nl2br']``.
+        """
+        extensions = tuple(extensions)
+        key = (hashlib.sha256(text.encode()).hexdigest(), extensions)
+        if (cached_html := self._cache.get(key)) is not None:
+            self._cache.move_to_end(key)
+            return cached_html
+
+        # Reset clears the state from the previous text, ex reference links
+        html: str = self.converter(extensions).reset().convert(text)
+        self._cache[key] = html
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return html
+
+    def clear(self):
+        """Clear the rendered HTML cache. The ``Markdown`` instances are kept."""
+        self._cache.clear()
+
+
+markdown_renderer = MarkdownRenderer()
+"""Renderer used by the app."""
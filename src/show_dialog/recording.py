@@ -0,0 +1,110 @@
+"""
+Recording of the dialogs shown in a session, to replay them later, ex to reproduce an issue.
+
+When ``config.RECORD_FILE`` is set, with ``--record`` or the environment variable
+``SHOW_DIALOG_RECORD_FILE``, each dialog is appended to the file when it exits, as one line of JSON.
+Many processes can append to the same file, ex all the dialogs shown by a test run.
+
+A recording is replayed with ``--replay``, which answers the same dialogs with the same exit codes,
+optionally faster.
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from mashumaro import DataClassDictMixin, field_options
+
+from . import config
+from .answers import Answer, Answers, _deserialize_exit_code
+from .exit_code import ExitCode, ExitSource
+from .inputs import Inputs
+
+
+def _compact_inputs(inputs: Inputs) -> dict:
+    """Inputs as a dict, without the fields with default values."""
+    defaults = Inputs().to_dict()
+    return {key: value for key, value in inputs.to_dict().items() if value != defaults[key]}
+
+
+@dataclass(frozen=True)
+class Record(DataClassDictMixin):
+    """Dialog shown in a session and how it was answered."""
+
+    inputs: Inputs = field(metadata=field_options(serialize=_compact_inputs))
+
+    exit_code: ExitCode = field(
+        metadata=field_options(
+            serialize=lambda exit_code: exit_code.name, deserialize=_deserialize_exit_code
+        )
+    )
+
+    source: ExitSource
+
+    duration: float
+    """Time in seconds from when the dialog was shown until it exited."""
+
+    time: float = 0
+    """Time when the dialog exited, in seconds since the epoch."""
+
+
+def append_record(record: Record, file: str | Path):
+    """
+    Append the record to the file, as one line of JSON.
+
+    The line is written at once, so records appended by different processes are not mixed.
+    """
+    line = json.dumps(record.to_dict(), separators=(',', ':')) + '\n'
+    with open(file, 'a', encoding='utf-8') as f:
+        f.write(line)
+
+
+def record_dialog(inputs: Inputs, exit_code: ExitCode, source: ExitSource, duration: float):
+    """
+    Append the dialog to ``config.RECORD_FILE``, if set. Errors writing the file are logged, so
+    that the dialog exits anyway.
+
+    :param duration: Time in seconds from when the dialog was shown until it exited.
+    """
+    if not config.RECORD_FILE:
+        return
+    record = Record(inputs, exit_code, source, round(duration, 3), round(time.time(), 3))
+    try:
+        append_record(record, config.RECORD_FILE)
+    except OSError as e:
+        logging.error(f'Error recording the dialog in `{config.RECORD_FILE}`: {e}')
+
+
+def load_records(file: str | Path) -> list[Record]:
+    """Records in the file, in the order they were recorded."""
+    with open(file, encoding='utf-8') as f:
+        return [Record.from_dict(json.loads(line)) for line in f if line.strip()]
+
+
+def replay_answers(file: str | Path, speed: float = 1, build_dialog: bool = True) -> Answers:
+    """
+    Answers to show the recorded dialogs again and answer them as they were answered.
+
+    Each record answers one dialog with the same inputs, in the order they were recorded. The
+    answers are kept in the process, so in separate processes, ex one for each dialog, dialogs with
+    the same inputs get the answer recorded first.
+
+    :param file: Recording, ie, file with the records.
+    :param speed: How many times faster to answer than recorded, ex ``10``. ``0`` to answer right
+        away.
+    :param build_dialog: See ``Answers.build_dialog``.
+    """
+    return Answers(
+        [
+            Answer(
+                record.exit_code,
+                delay=record.duration / speed if speed else 0,
+                inputs_hash=record.inputs.content_hash(),
+                times=1,
+            )
+            for record in load_records(file)
+        ],
+        build_dialog=build_dialog,
+    )
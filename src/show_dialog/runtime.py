@@ -0,0 +1,438 @@
+"""
+Runtime to show many dialogs from Python, ex in a test harness.
+
+``show_dialog()`` looks up or creates the ``QApplication`` and sets it up for each dialog.
+``DialogRuntime`` sets up the application once and keeps it, and the caches (stylesheets, theme
+packs, Markdown), for all the dialogs shown with it.
+
+Dialogs can also be opened from other threads with ``open_dialog()``, while the GUI thread runs the
+event loop, ex in ``DialogRuntime.wait()``.
+"""
+
+import concurrent.futures
+import functools
+import logging
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from .answers import Answers
+from .exit_code import ExitCode
+from .inputs import Inputs
+from .ipc.ipc_params import IpcParams
+from .main import _default_style
+from .sequence import StopPolicy
+from .style import Style
+
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QApplication
+
+    from .ui.invoker import Invoker
+    from .ui.show_dialog import ShowDialog
+
+
+class DialogRuntime:
+    """
+    Context manager that owns the ``QApplication`` and shows dialogs.
+
+    Example::
+
+        with DialogRuntime(style=Style.Style01) as runtime:
+            for inputs in all_inputs:
+                exit_code = runtime.show(inputs)
+
+    Several dialogs can be open at the same time, each with its own result::
+
+        with DialogRuntime() as runtime:
+            futures = [runtime.open(inputs) for inputs in all_inputs]
+            runtime.wait(futures)
+            exit_codes = [future.result() for future in futures]
+
+    Worker threads open dialogs with ``open_dialog()`` while the GUI thread waits::
+
+        with DialogRuntime() as runtime, ThreadPoolExecutor() as executor:
+            jobs = [executor.submit(run_test, test) for test in tests]  # Call `open_dialog()`
+            runtime.wait(jobs)
+
+    The theme is set in the app, so dialogs open at the same time should use the same theme.
+
+    Like ``show_dialog()``, it must be used from the thread where the ``QApplication`` is created,
+    usually the main thread.
+    """
+
+    running: 'DialogRuntime | None' = None
+    """
+    Runtime inside its ``with`` block, the innermost if nested. Used by ``open_dialog()`` by
+    default.
+    """
+
+    def __init__(
+        self,
+        *,
+        stylesheet: str | None = None,
+        style: Style | None = None,
+        pool_size: int = 2,
+        answers: Answers | None = None,
+    ):
+        """
+        :param stylesheet: Stylesheet to be used in all dialogs. This is the whole stylesheet as a
+            string, not a path to a stylesheet file.
+        :param style: One of the included styles. If set, ``stylesheet`` is ignored. If neither is
+            set, the style in ``config.DEFAULT_STYLE`` is used.
+        :param pool_size: Number of hidden dialogs that are built in advance and reused with
+            ``ShowDialog.reconfigure()``, instead of building a new dialog each time. Dialogs with
+            IPC parameters are not reused. ``0`` to always build new dialogs.
+        :param answers: Answer the dialogs instead of a person, ex in CI. The dialogs are always
+            built and shown, ``answers.build_dialog`` is ignored.
+        """
+        self.stylesheet = stylesheet
+        self.style = style
+        self.pool_size = pool_size
+        self.answers = answers
+        self._pool: list['ShowDialog'] = []
+        """Hidden dialogs, ready to be reused."""
+        self.app: 'QApplication | None' = None
+        """Set while the runtime is running, ie, inside the ``with`` block."""
+        self.dialogs: dict['ShowDialog', Future[ExitCode]] = {}
+        """Open dialogs and their futures."""
+        self._quit_on_last_window_closed = True
+        self._thread: threading.Thread | None = None
+        """GUI thread, where the runtime was entered."""
+        self._invoker: 'Invoker | None' = None
+        self._previous_running: 'DialogRuntime | None' = None
+        """``running`` when this runtime was entered, ex an outer runtime, restored on exit."""
+
+    def __enter__(self) -> 'DialogRuntime':
+        # Qt is imported here and not at module level, so that importing this module is Qt free
+        from PySide6.QtWidgets import QApplication
+
+        from .ui.invoker import Invoker
+        from .ui.show_dialog import ShowDialog  # noqa: F401  # Import once, before the dialogs
+
+        if self.style is None and self.stylesheet is None:
+            self.style, self.stylesheet = _default_style()
+
+        app: QApplication = QApplication.instance() or QApplication()  # type: ignore
+        # Dialogs are closed one at a time, the app keeps running between them
+        self._quit_on_last_window_closed = app.quitOnLastWindowClosed()
+        app.setQuitOnLastWindowClosed(False)
+        self.app = app
+        self._thread = threading.current_thread()
+        self._invoker = Invoker()
+        self._previous_running, DialogRuntime.running = DialogRuntime.running, self
+        for _ in range(self.pool_size):
+            dialog = self._create_dialog(Inputs())
+            dialog.prepare()
+            self._pool.append(dialog)
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        from PySide6.QtCore import QCoreApplication, QEvent
+
+        if self.app is None:
+            return
+        # Open the dialogs requested from other threads, which are cancelled below
+        QCoreApplication.sendPostedEvents(self._invoker, QEvent.Type.MetaCall)
+        self._invoker = None
+        for dialog in list(self.dialogs):
+            dialog.exit(ExitCode.Cancel)
+        for dialog in self._pool:
+            dialog.deleteLater()
+        self._pool.clear()
+        self.app.closeAllWindows()
+        # Delete the dialogs, which is deferred until there's an event loop
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        self.app.setQuitOnLastWindowClosed(self._quit_on_last_window_closed)
+        self.app = None
+        self._thread = None
+        DialogRuntime.running, self._previous_running = self._previous_running, None
+
+    def show(self, inputs: Inputs, *, ipc_params: IpcParams | None = None) -> ExitCode:
+        """
+        Show the dialog and wait for it to exit.
+
+        Other open dialogs can be answered while waiting.
+
+        :param inputs: Inputs to the dialog.
+        :param ipc_params: Inter-Process Communication parameters.
+        :return: Exit code of the dialog.
+        :raises RuntimeError: If the runtime is not running, ie, used outside the ``with`` block.
+        """
+        future = self.open(inputs, ipc_params=ipc_params)
+        self.wait([future])
+
+        return future.result()
+
+    def show_sequence(
+        self, all_inputs: Iterable[Inputs], *, stop_policy: StopPolicy = StopPolicy.FAIL
+    ) -> list[ExitCode]:
+        """
+        Show the dialogs one after the other, in one window that is updated in place between them.
+
+        :param all_inputs: Inputs to each dialog, ie, step.
+        :param stop_policy: When to stop without showing the remaining steps.
+        :return: Exit codes of the steps that were shown.
+        :raises RuntimeError: If the runtime is not running, ie, used outside the ``with`` block.
+        """
+        from PySide6.QtCore import QEventLoop
+
+        from .ui.show_dialog import ShowDialog
+
+        if self.app is None:
+            raise RuntimeError('Dialog runtime is not running. Use it in a `with` block.')
+
+        exit_codes: list[ExitCode] = []
+        dialog: ShowDialog | None = None
+        loop = QEventLoop()
+        try:
+            for inputs in all_inputs:
+                if dialog is None:
+                    dialog = ShowDialog(
+                        self.app,
+                        inputs,
+                        stylesheet=self.stylesheet,
+                        style=self.style,
+                        quit_app=False,
+                        keep_open=True,
+                        answers=self.answers,
+                    )
+                    dialog.exited.connect(exit_codes.append)
+                    dialog.exited.connect(loop.quit)
+                else:
+                    dialog.reconfigure(inputs)
+                dialog.show()  # Shown again if the window was closed in the previous step
+                loop.exec()
+                logging.debug(f'Step {len(exit_codes)} exited with code {exit_codes[-1].name}.')
+                if stop_policy.stops(exit_codes[-1]):
+                    break
+        finally:
+            if dialog is not None:
+                dialog.hide()
+                dialog.deleteLater()
+
+        return exit_codes
+
+    def open(self, inputs: Inputs, *, ipc_params: IpcParams | None = None) -> Future[ExitCode]:
+        """
+        Show the dialog and return without waiting for it to exit.
+
+        The dialog can be answered while the event loop runs, ex in ``wait()``.
+
+        :param inputs: Inputs to the dialog.
+        :param ipc_params: Inter-Process Communication parameters.
+        :return: Future with the exit code, set when the dialog exits.
+        :raises RuntimeError: If the runtime is not running, ie, used outside the ``with`` block.
+        """
+        if self.app is None:
+            raise RuntimeError('Dialog runtime is not running. Use it in a `with` block.')
+
+        if self._pool and ipc_params is None:
+            dialog = self._pool.pop()
+            dialog.reconfigure(inputs)
+        else:
+            dialog = self._create_dialog(inputs, ipc_params)
+        future: Future[ExitCode] = Future()
+        future.set_running_or_notify_cancel()  # Can't be cancelled, the dialog is already shown
+        self.dialogs[dialog] = future
+        dialog.show()
+
+        return future
+
+    def wait(self, futures: Iterable[Future] | None = None, timeout: float | None = None) -> bool:
+        """
+        Run the event loop until the dialogs exit.
+
+        :param futures: Futures returned by ``open()``. Default is all the open dialogs. Can also
+            be other futures, ex of jobs in other threads that open dialogs with ``open_dialog()``.
+        :param timeout: Maximum time to wait, in seconds. ``None`` to wait until the dialogs exit.
+        :return: Whether the dialogs exited, ie, ``False`` if the timeout occurred first.
+        :raises RuntimeError: If the runtime is not running, ie, used outside the ``with`` block.
+        """
+        from PySide6.QtCore import QEventLoop, QTimer
+
+        futures = list(self.dialogs.values() if futures is None else futures)
+        if all(future.done() for future in futures):
+            return True
+
+        invoker = self._invoker
+        if invoker is None:
+            raise RuntimeError('Dialog runtime is not running. Use it in a `with` block.')
+        loop = QEventLoop()
+        waiting = threading.Event()
+        """Cleared when this wait returns, ex on timeout, after which the futures are ignored."""
+        waiting.set()
+
+        def quit_loop():
+            if waiting.is_set():
+                loop.quit()
+
+        def on_done(_):
+            # Futures may be done in other threads, the loop is stopped in the GUI thread
+            if waiting.is_set() and all(f.done() for f in futures):
+                invoker.call(quit_loop)
+
+        for future in futures:
+            future.add_done_callback(on_done)
+        if timeout is not None:
+            QTimer.singleShot(int(timeout * 1000), quit_loop)
+        loop.exec()
+        waiting.clear()
+
+        return all(future.done() for future in futures)
+
+    def call_in_gui_thread(self, function: Callable[[], None]):
+        """
+        Call ``function`` in the GUI thread. Thread safe.
+
+        Called right away if in the GUI thread, otherwise queued to run when the GUI thread runs the
+        event loop, ex in ``wait()``.
+
+        :raises RuntimeError: If the runtime is not running, ie, used outside the ``with`` block.
+        """
+        invoker = self._invoker
+        if invoker is None:
+            raise RuntimeError('Dialog runtime is not running. Use it in a `with` block.')
+        invoker.call(function)
+
+    def in_gui_thread(self) -> bool:
+        """Whether the current thread is the GUI thread."""
+        return threading.current_thread() is self._thread
+
+    def cancel(self, future: Future[ExitCode]) -> bool:
+        """
+        Exit the dialog of ``future`` with ``ExitCode.Cancel``, ex when no longer waiting for it.
+
+        :param future: Future returned by ``open()``.
+        :return: Whether the dialog was open.
+        """
+        for dialog, dialog_future in self.dialogs.items():
+            if dialog_future is future:
+                dialog.exit(ExitCode.Cancel)
+                return True
+        return False
+
+    def _create_dialog(self, inputs: Inputs, ipc_params: IpcParams | None = None) -> 'ShowDialog':
+        from .ui.show_dialog import ShowDialog
+
+        dialog = ShowDialog(
+            self.app,  # type: ignore[arg-type]
+            inputs,
+            stylesheet=self.stylesheet,
+            style=self.style,
+            ipc_params=ipc_params,
+            quit_app=False,
+            answers=self.answers,
+        )
+        dialog.finished.connect(lambda code: self._finish(dialog, ExitCode(code)))
+        return dialog
+
+    def _finish(self, dialog: 'ShowDialog', exit_code: ExitCode):
+        future = self.dialogs.pop(dialog)
+        if dialog.ipc_params is None and len(self._pool) < self.pool_size:
+            self._pool.append(dialog)
+        else:
+            dialog.deleteLater()
+        logging.debug(f'Dialog exited with code {exit_code} - {exit_code.name}.')
+        future.set_result(exit_code)
+
+
+class DialogHandle:
+    """
+    Dialog opened with ``open_dialog()``, possibly from another thread.
+
+    The methods can be called from any thread. In the GUI thread, waiting runs the event loop.
+    """
+
+    def __init__(self, runtime: DialogRuntime):
+        self.runtime = runtime
+        self._future: Future[ExitCode] = Future()
+        """Set when the dialog exits. Cancelled if the dialog is cancelled before it's shown."""
+        self._dialog_future: Future[ExitCode] | None = None
+        """Future from ``DialogRuntime.open()``, set in the GUI thread when the dialog is shown."""
+
+    def _open(self, inputs: Inputs, ipc_params: IpcParams | None):
+        """Show the dialog. Called in the GUI thread."""
+        if not self._future.set_running_or_notify_cancel():
+            return
+        try:
+            self._dialog_future = self.runtime.open(inputs, ipc_params=ipc_params)
+        except Exception as e:
+            self._future.set_exception(e)
+            return
+        self._dialog_future.add_done_callback(lambda f: self._future.set_result(f.result()))
+
+    def done(self) -> bool:
+        """Whether the dialog exited or was cancelled before being shown."""
+        return self._future.done()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Wait for the dialog to exit.
+
+        :param timeout: Maximum time to wait, in seconds. ``None`` to wait until the dialog exits.
+        :return: Whether the dialog exited, ie, ``False`` if the timeout occurred first.
+        """
+        if self.runtime.in_gui_thread():
+            return self.runtime.wait([self._future], timeout)
+        concurrent.futures.wait([self._future], timeout)
+        return self._future.done()
+
+    def result(self, timeout: float | None = None) -> ExitCode:
+        """
+        Wait for the dialog to exit and return its exit code.
+
+        :param timeout: Maximum time to wait, in seconds. ``None`` to wait until the dialog exits.
+        :raises TimeoutError: If the timeout occurred first. The builtin ``TimeoutError``, also in
+            Python 3.10, where ``concurrent.futures.TimeoutError`` is a different class.
+        :raises concurrent.futures.CancelledError: If the dialog was cancelled before being shown.
+        """
+        if not self.wait(timeout):
+            raise TimeoutError(f'Dialog did not exit within {timeout} s.')
+        return self._future.result()
+
+    def cancel(self) -> bool:
+        """
+        Cancel the dialog.
+
+        If not shown yet, it won't be shown and ``result()`` raises ``CancelledError``. If shown, it
+        exits with ``ExitCode.Cancel``.
+
+        :return: Whether the dialog was cancelled, ie, ``False`` if it already exited.
+        """
+        if self._future.cancel():
+            return True
+        if self._future.done():
+            return False
+        self.runtime.call_in_gui_thread(self._cancel_dialog)
+        return True
+
+    def _cancel_dialog(self):
+        if self._dialog_future is not None:
+            self.runtime.cancel(self._dialog_future)
+
+
+def open_dialog(
+    inputs: Inputs, *, runtime: DialogRuntime | None = None, ipc_params: IpcParams | None = None
+) -> DialogHandle:
+    """
+    Show the dialog without waiting for it to exit. Can be called from any thread.
+
+    The dialog is shown in the GUI thread, when it runs the event loop, ex in
+    ``DialogRuntime.wait()``.
+
+    :param inputs: Inputs to the dialog.
+    :param runtime: Runtime to show the dialog. Default is the running runtime.
+    :param ipc_params: Inter-Process Communication parameters.
+    :return: Handle to wait for the dialog or cancel it.
+    :raises RuntimeError: If there's no running runtime.
+    """
+    if runtime is None:
+        runtime = DialogRuntime.running
+        if runtime is None:
+            raise RuntimeError(
+                'No dialog runtime is running. Use `DialogRuntime` in a `with` block.'
+            )
+    handle = DialogHandle(runtime)
+    runtime.call_in_gui_thread(functools.partial(handle._open, inputs, ipc_params))
+    return handle
@@ -0,0 +1,138 @@
+"""
+Schedule the dialogs requested by many producers at once, ex in the daemon, instead of showing them
+all in the order requested.
+
+* Dialogs are shown by ``Inputs.priority``, highest first, and in the order requested for the same
+  priority.
+* Identical pending dialogs, ie, with the same ``Inputs.content_hash()``, are merged: one dialog is
+  shown and its exit code is sent to every requester.
+* At most ``max_visible`` dialogs are shown at once and the others wait, which avoids window storms
+  that freeze the desktop.
+
+Doesn't import Qt. Not thread safe, use it in the GUI thread.
+"""
+
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import Callable
+
+from . import config
+from .exit_code import ExitCode
+from .inputs import Inputs
+
+ExitCallback = Callable[[ExitCode], None]
+"""Called with the exit code of the dialog."""
+
+ShowFunction = Callable[[ExitCallback], Callable[[], None]]
+"""
+Shows the dialog and calls the ``ExitCallback`` when it exits. Returns a function that cancels the
+dialog, ie, exits it with ``ExitCode.Cancel``.
+"""
+
+
+@dataclass(eq=False)
+class _Request:
+    """Dialog requested one or more times, queued or shown."""
+
+    key: str
+    inputs: Inputs
+    show: ShowFunction
+    priority: int
+    order: int
+    waiters: list[ExitCallback] = field(default_factory=list)
+    cancel: Callable[[], None] | None = None
+    """Set when shown."""
+    shown: bool = False
+    done: bool = False
+
+
+class DialogScheduler:
+    def __init__(self, max_visible: int = config.MAX_VISIBLE_DIALOGS):
+        """
+        :param max_visible: Maximum number of dialogs shown at once. ``0`` for no limit, ex when the
+            dialogs are rows in a dashboard.
+        """
+        self.max_visible = max_visible
+        self.visible = 0
+        """Number of dialogs shown."""
+        self._requests: dict[str, _Request] = {}
+        """Requests not done, by content hash."""
+        self._queue: list[tuple[int, int, _Request]] = []
+        """Heap of ``(-priority, order, request)``. Entries of requests shown, done or with another
+        priority are skipped."""
+        self._order = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        """Number of dialogs waiting to be shown."""
+        return sum(not request.shown for request in self._requests.values())
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests waiting for their dialog to exit, shown or not."""
+        return sum(len(request.waiters) for request in self._requests.values())
+
+    def submit(
+        self, inputs: Inputs, on_exit: ExitCallback, show: ShowFunction
+    ) -> Callable[[], None]:
+        """
+        Show the dialog now or when there's room, or merge it with an identical pending dialog.
+
+        :param inputs: Inputs to the dialog, to sort and merge it.
+        :param on_exit: Called with the exit code of the dialog.
+        :param show: Shows the dialog, if not merged with another. See ``ShowFunction``.
+        :return: Function to withdraw the request, ex when the requester is gone, without calling
+            ``on_exit``. The dialog is cancelled, or not shown, if no one else is waiting for it.
+        """
+        key = inputs.content_hash()
+        request = self._requests.get(key)
+        if request is None:
+            request = _Request(key, inputs, show, inputs.priority, next(self._order))
+            self._requests[key] = request
+            heapq.heappush(self._queue, (-request.priority, request.order, request))
+        elif not request.shown and inputs.priority > request.priority:
+            request.priority = inputs.priority
+            heapq.heappush(self._queue, (-request.priority, request.order, request))
+        request.waiters.append(on_exit)
+        self._show_next()
+
+        return lambda: self._withdraw(request, on_exit)
+
+    def cancel_queued(self):
+        """Exit the dialogs waiting to be shown with ``ExitCode.Cancel``, without showing them."""
+        for request in [request for request in self._requests.values() if not request.shown]:
+            self._done(request, ExitCode.Cancel)
+
+    def _show_next(self):
+        while self._queue and (not self.max_visible or self.visible < self.max_visible):
+            priority, _, request = heapq.heappop(self._queue)
+            if request.shown or request.done or -priority != request.priority:
+                continue
+            request.shown = True
+            self.visible += 1
+            cancel = request.show(lambda exit_code, r=request: self._done(r, exit_code))
+            if not request.done:  # Not exited right away, ex an error showing the dialog
+                request.cancel = cancel
+
+    def _done(self, request: _Request, exit_code: ExitCode):
+        if request.done:
+            return
+        request.done = True
+        del self._requests[request.key]
+        if request.shown:
+            self.visible -= 1
+        for on_exit in request.waiters:
+            on_exit(exit_code)
+        self._show_next()
+
+    def _withdraw(self, request: _Request, on_exit: ExitCallback):
+        if request.done or on_exit not in request.waiters:
+            return
+        request.waiters.remove(on_exit)
+        if request.waiters:
+            return
+        if request.cancel is not None:
+            request.cancel()  # Exits the dialog, which calls `_done`
+        else:
+            self._done(request, ExitCode.Cancel)
@@ -0,0 +1,29 @@
+"""
+Sequence of dialogs, ex the steps of a manual test procedure, shown one after the other in one
+window, which is updated in place between the steps.
+
+See ``show_sequence()`` and ``DialogRuntime.show_sequence()``.
+"""
+
+from enum import Enum
+
+from .exit_code import ExitCode
+
+
+class StopPolicy(str, Enum):
+    """When to stop a sequence of dialogs, without showing the remaining steps."""
+
+    FAIL = 'fail'
+    """Stop at the first step that doesn't pass, ex failed, cancelled or timed out."""
+    CANCEL = 'cancel'
+    """Stop only if a step is cancelled, ie, the window is closed or ``Ctrl+Q`` is used."""
+    NEVER = 'never'
+    """Show all the steps."""
+
+    def stops(self, exit_code: ExitCode) -> bool:
+        """Whether the sequence stops after a step exits with ``exit_code``."""
+        if self is StopPolicy.FAIL:
+            return exit_code is not ExitCode.Pass
+        if self is StopPolicy.CANCEL:
+            return exit_code is ExitCode.Cancel
+        return False
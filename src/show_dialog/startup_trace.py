@@ -0,0 +1,132 @@
+"""
+Timings of the app startup phases, from the interpreter start until the dialog is first painted.
+
+Enabled with the CLI option ``--startup-trace``. Timestamps are from ``time.perf_counter()``,
+which is monotonic.
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class Phase:
+    name: str
+    start: float
+    end: float
+
+
+def _process_start() -> float | None:
+    """
+    Time when this process started, converted to the ``time.perf_counter()`` clock.
+
+    Only available on Linux, with a resolution of a clock tick (usually 10ms).
+    """
+    try:
+        with open('/proc/self/stat') as f:
+            stat = f.read()
+        # Field 22 is the start time in clock ticks since boot. Split after the process name, which
+        # is field 2 and may contain spaces, so field 3 is at index 0.
+        start_ticks = int(stat.rsplit(')', 1)[1].split()[19])
+        since_start = time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf(
+            'SC_CLK_TCK'
+        )
+    except (AttributeError, IndexError, OSError, ValueError):
+        return None
+
+    return time.perf_counter() - since_start
+
+
+class StartupTrace:
+    def __init__(self):
+        self.created = time.perf_counter()
+        """When this module was imported, which is the start of the package import."""
+        self.package_imported: float | None = None
+        """When the package import finished. Set by the package."""
+        self.enabled = False
+        self.output = '-'
+        """File where the trace is saved as JSON. ``-`` for stderr."""
+        self.phases: list[Phase] = []
+
+    def enable(self, output: str = '-'):
+        """
+        Start recording phases.
+
+        :param output: File where the trace is saved in ``finish()``. ``-`` for stderr.
+        """
+        self.enabled = True
+        self.output = output
+
+    def record(self, name: str, start: float, end: float | None = None):
+        """Record a phase that already happened."""
+        if self.enabled:
+            self.phases.append(Phase(name, start, time.perf_counter() if end is None else end))
+
+    @contextmanager
+    def phase(self, name: str):
+        """Record the phase that runs in this context."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start)
+
+    def mark(self, name: str):
+        """Record an event, ie, a phase with no duration."""
+        now = time.perf_counter()
+        self.record(name, now, now)
+
+    def to_dict(self) -> dict:
+        """
+        Trace with times in milliseconds since the process started or, if not available, since the
+        package import started.
+        """
+        process_start = _process_start()
+        origin = self.created if process_start is None else process_start
+        phases = []
+        if process_start is not None:
+            phases.append(Phase('interpreter_start', process_start, self.created))
+        if self.package_imported is not None:
+            phases.append(Phase('package_import', self.created, self.package_imported))
+        phases += self.phases
+
+        return {
+            'origin': 'interpreter_start' if process_start is not None else 'package_import',
+            'phases': [
+                {
+                    'name': phase.name,
+                    'start_ms': round((phase.start - origin) * 1000, 3),
+                    'end_ms': round((phase.end - origin) * 1000, 3),
+                    'duration_ms': round((phase.end - phase.start) * 1000, 3),
+                }
+                for phase in phases
+            ],
+        }
+
+    def finish(self):
+        """Save the trace to ``output`` and stop recording. Does nothing if not enabled."""
+        if not self.enabled:
+            return
+        self.enabled = False
+
+        trace_json = json.dumps(self.to_dict(), indent=2)
+        if self.output == '-':
+            print(trace_json, file=sys.stderr)
+        else:
+            try:
+                Path(self.output).write_text(trace_json)
+            except OSError as e:
+                logging.error(f'Error saving startup trace to `{self.output}`: {e}')
+            else:
+                logging.debug(f'Startup trace saved to {self.output}')
+        self.phases.clear()
+
+
+startup_trace = StartupTrace()
+"""Trace used by the app."""
@@ -10,9 +10,10 @@ class Style(str, Enum):  # StrEnum is Python 3.11+
     1. Create the ``.css`` file under ``assets/stylesheets``.
     2. Add to ``assets/resources.qrc``, under the ``stylesheets`` folder.
        This file is XML, it's self-explanatory how to add a new entry.
-    3. Rebuild the resource file to include the new CSS file with the command ``inv ui.rc``.
-    4. Add a new entry to this enum, where the value is the path in the resource file,
+    3. Add a new entry to this enum, where the value is the path in the resource file,
        starting with ``:/``.
+    4. Build the theme packs (each theme combined with each style) and rebuild the resource file
+       to include the new CSS file with the command ``inv ui.theme-packs``.
     """
 
     Style01 = ':/stylesheets/style_01.css'
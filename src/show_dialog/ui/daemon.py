@@ -0,0 +1,160 @@
+"""
+Daemon that keeps a ``QApplication`` running and shows the dialogs requested by the launcher.
+
+Started with ``show_dialog --serve``. See ``launcher.py`` for the client side. With ``--dashboard``,
+the dialogs are shown as rows in one ``Dashboard`` window.
+
+The dialogs are shown by priority, identical dialogs are merged and the number of dialogs shown at
+once is limited. See ``scheduler.py``.
+"""
+
+import json
+import logging
+import signal
+from typing import Callable
+
+from PySide6.QtCore import QObject
+from PySide6.QtNetwork import QAbstractSocket, QHostAddress, QTcpServer, QTcpSocket
+from PySide6.QtWidgets import QApplication
+
+from .. import config
+from ..exit_code import ExitCode
+from ..launcher import LaunchRequest, LaunchResponse
+from ..scheduler import DialogScheduler, ExitCallback
+from .dashboard import Dashboard
+from .show_dialog import ShowDialog
+
+
+class DialogDaemon(QObject):
+    def __init__(
+        self,
+        app: QApplication,
+        port: int = config.DAEMON_PORT,
+        dashboard: bool = False,
+        max_visible: int = config.MAX_VISIBLE_DIALOGS,
+    ):
+        """
+        :param app: App where the dialogs are shown. Keeps running after the dialogs exit.
+        :param port: Port to listen on ``localhost``. ``0`` to use any free port.
+        :param dashboard: Show the dialogs as rows in one dashboard window. Dialogs with IPC
+            parameters are still shown in their own window, as the IPC server is per dialog.
+        :param max_visible: Maximum number of dialogs shown at once, ``0`` for no limit. Not
+            limited in the dashboard.
+        :raises OSError: If not able to listen on the port, ex another daemon is running.
+        """
+        super().__init__()
+        self.app = app
+        self.dialogs: set[ShowDialog] = set()
+        """Dialogs being displayed."""
+        self.dashboard = Dashboard() if dashboard else None
+        self.scheduler = DialogScheduler(0 if dashboard else max_visible)
+        """Schedules the dialogs without IPC parameters, which are driven by their IPC server."""
+
+        self.server = QTcpServer(self)
+        self.server.newConnection.connect(self._accept)
+        if not self.server.listen(QHostAddress(QHostAddress.SpecialAddress.LocalHost), port):
+            raise OSError(f'Daemon not able to listen on port {port}: {self.server.errorString()}')
+        logging.info(f'Daemon listening on port {self.port}.')
+
+    @property
+    def port(self) -> int:
+        return self.server.serverPort()
+
+    def close(self):
+        """Stop listening and cancel the dialogs being displayed or waiting."""
+        self.server.close()
+        self.scheduler.cancel_queued()
+        for dialog in list(self.dialogs):
+            dialog.exit(ExitCode.Cancel)
+        if self.dashboard:
+            self.dashboard.cancel_all()
+            self.dashboard.hide()
+
+    def _accept(self):
+        while (connection := self.server.nextPendingConnection()) is not None:
+            connection.readyRead.connect(lambda c=connection: self._read(c))
+            connection.disconnected.connect(connection.deleteLater)
+
+    def _read(self, connection: QTcpSocket):
+        if not connection.canReadLine():
+            return
+        # One dialog per connection
+        connection.readyRead.disconnect()
+        line = bytes(connection.readLine().data())
+
+        try:
+            request = LaunchRequest.from_json(line)
+            if request.hidden and request.ipc_params is None:
+                raise ValueError('IPC parameters are required to start the dialog hidden.')
+        except Exception as e:
+            logging.error(f'Error showing dialog: {e}')
+            self._reply(connection, ExitCode.Unknown)
+            return
+
+        def on_exit(exit_code: ExitCode):
+            self._reply(connection, exit_code)
+
+        if request.ipc_params is None:
+            cancel = self.scheduler.submit(
+                request.inputs, on_exit, lambda done: self._show(request, done)
+            )
+        else:
+            cancel = self._show(request, on_exit)
+        # Launcher was terminated while the dialog is displayed or waiting
+        connection.disconnected.connect(cancel)
+
+    def _show(self, request: LaunchRequest, on_exit: ExitCallback) -> Callable[[], None]:
+        """
+        Show the dialog, in its own window or in the dashboard.
+
+        :param on_exit: Called with the exit code when the dialog exits.
+        :return: Function to cancel the dialog.
+        """
+        if self.dashboard and request.ipc_params is None:
+            dashboard = self.dashboard
+            prompt = dashboard.add(request.inputs, on_exit)
+            return lambda: dashboard.finish(prompt, ExitCode.Cancel)
+
+        try:
+            dialog = ShowDialog(
+                self.app,
+                request.inputs,
+                stylesheet=request.stylesheet,
+                style=request.style,
+                ipc_params=request.ipc_params,
+                quit_app=False,
+                style_app=False,  # Dialogs of other launchers may have other themes and styles
+            )
+        except Exception as e:
+            logging.error(f'Error showing dialog: {e}')
+            on_exit(ExitCode.Unknown)
+            return lambda: None
+
+        dialog.finished.connect(lambda code: self._finish(dialog, on_exit, ExitCode(code)))
+        self.dialogs.add(dialog)
+        if request.hidden:
+            dialog.prepare()
+        else:
+            dialog.show()
+        return lambda: dialog.exit(ExitCode.Cancel)
+
+    def _finish(self, dialog: ShowDialog, on_exit: ExitCallback, exit_code: ExitCode):
+        self.dialogs.discard(dialog)
+        dialog.deleteLater()
+        on_exit(exit_code)
+
+    @staticmethod
+    def _reply(connection: QTcpSocket, exit_code: ExitCode):
+        if connection.state() is QAbstractSocket.SocketState.ConnectedState:
+            connection.write(json.dumps(LaunchResponse(exit_code).to_dict()).encode() + b'\n')
+            connection.disconnectFromHost()  # After writing what's pending
+
+
+def serve(port: int = config.DAEMON_PORT, dashboard: bool = False):
+    """Run the daemon until the process is terminated. See ``DialogDaemon``."""
+    app: QApplication = QApplication.instance() or QApplication()  # type: ignore
+    app.setQuitOnLastWindowClosed(False)
+    # Python can't handle Ctrl+C while Qt's event loop is running, use the default handler instead
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    daemon = DialogDaemon(app, port, dashboard)  # noqa: F841
+    app.exec()
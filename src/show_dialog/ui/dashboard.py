@@ -0,0 +1,318 @@
+"""
+Dashboard that shows the pending prompts of many producers in one window, ex the stations of a test
+floor, instead of one ``ShowDialog`` window, and process, per prompt.
+
+Started with ``show_dialog --serve --dashboard``: each dialog requested with
+``show_dialog_launcher`` is added as a row and the launcher exits with the exit code of its row.
+
+The list is virtualized: the rows are painted by a delegate, only when visible, and have no
+widgets, so the memory and the time to repaint stay flat as the number of prompts grows. One timer
+updates the countdowns and times out the prompts.
+"""
+
+import bisect
+import heapq
+import itertools
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from PySide6.QtCore import QAbstractListModel, QEvent, QModelIndex, QRect, QSize, Qt, QTimer, Signal
+from PySide6.QtGui import QFont, QFontMetrics
+from PySide6.QtWidgets import (
+    QApplication,
+    QListView,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from .. import config
+from ..exit_code import ExitCode, ExitSource
+from ..inputs import Buttons, Inputs
+from ..recording import record_dialog
+
+PREVIEW_LENGTH = 200
+"""Maximum number of characters of the description shown in a row, before eliding."""
+
+
+@dataclass(eq=False)
+class Prompt:
+    """Prompt pending in the dashboard."""
+
+    id: int
+    inputs: Inputs
+    on_exit: Callable[[ExitCode], None]
+    """Called with the exit code when the prompt is answered, times out or is cancelled."""
+    added_at: float = field(default_factory=time.perf_counter)
+    deadline: float | None = None
+    """``time.perf_counter()`` when the prompt times out, if it has a timeout."""
+    preview: str = field(init=False)
+    """Description in one line."""
+    pass_text: str = field(init=False)
+    fail_text: str | None = field(init=False)
+    """``None`` if there's only one button."""
+    finished: bool = field(default=False, init=False)
+    """Whether the prompt exited, ie, is no longer pending."""
+
+    def __post_init__(self):
+        self.preview = ' '.join(self.inputs.description[: PREVIEW_LENGTH * 2].split())[
+            :PREVIEW_LENGTH
+        ]
+        if self.inputs.buttons == Buttons.OK:
+            pass_text, fail_text = Buttons.OK.value, None
+        else:
+            pass_text, fail_text = self.inputs.buttons.split('/')
+        self.pass_text = self.inputs.pass_button_text or pass_text
+        self.fail_text = fail_text and (self.inputs.fail_button_text or fail_text)
+        if self.inputs.timeout and self.deadline is None:
+            self.deadline = self.added_at + self.inputs.timeout
+
+    def remaining(self, now: float) -> int | None:
+        """Seconds until the prompt times out, rounded up, or ``None`` if there's no timeout."""
+        if self.deadline is None:
+            return None
+        return max(0, math.ceil(self.deadline - now))
+
+
+class PromptListModel(QAbstractListModel):
+    """
+    Pending prompts, by ``Inputs.priority`` and in the order they were added for the same priority.
+    The prompt is in ``Qt.UserRole``.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.prompts: list[Prompt] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.prompts)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        prompt = self.prompts[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return prompt.inputs.title
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return prompt.preview
+        if role == Qt.ItemDataRole.UserRole:
+            return prompt
+        return None
+
+    def add(self, prompt: Prompt):
+        """Insert the prompt after the prompts with the same or higher priority."""
+        row = bisect.bisect_right(
+            self.prompts, -prompt.inputs.priority, key=lambda p: -p.inputs.priority
+        )
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.prompts.insert(row, prompt)
+        self.endInsertRows()
+
+    def remove(self, prompt: Prompt) -> bool:
+        """:return: Whether the prompt was removed, ``False`` if it's not in the list."""
+        try:
+            row = self.prompts.index(prompt)
+        except ValueError:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.prompts[row]
+        self.endRemoveRows()
+        return True
+
+
+class PromptDelegate(QStyledItemDelegate):
+    """Paints a prompt in a row, with its title, description, countdown and buttons."""
+
+    ROW_HEIGHT = 56
+    MARGIN = 8
+    BUTTON_SIZE = QSize(90, 30)
+    COUNTDOWN_WIDTH = 50
+
+    clicked = Signal(object, object)
+    """Button clicked in a row, with the prompt and the exit code of the button."""
+
+    def sizeHint(self, option, index):
+        return QSize(0, self.ROW_HEIGHT)
+
+    def button_rects(self, rect: QRect, prompt: Prompt) -> dict[ExitCode, QRect]:
+        """Rectangle of each button in the row, by exit code, from right to left."""
+        rects = {}
+        exit_codes = [ExitCode.Pass] + ([ExitCode.Fail] if prompt.fail_text else [])
+        right = rect.right() - self.MARGIN
+        top = rect.top() + (rect.height() - self.BUTTON_SIZE.height()) // 2
+        for exit_code in exit_codes:
+            rects[exit_code] = QRect(
+                right - self.BUTTON_SIZE.width() + 1,
+                top,
+                self.BUTTON_SIZE.width(),
+                self.BUTTON_SIZE.height(),
+            )
+            right -= self.BUTTON_SIZE.width() + self.MARGIN
+        return rects
+
+    def paint(self, painter, option, index):
+        prompt: Prompt = index.data(Qt.ItemDataRole.UserRole)
+        style = option.widget.style() if option.widget else QApplication.style()
+        painter.save()
+        style.drawPrimitive(
+            QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, option.widget
+        )
+
+        rect = option.rect
+        button_rects = self.button_rects(rect, prompt)
+        right = min(button_rect.left() for button_rect in button_rects.values()) - self.MARGIN
+        remaining = prompt.remaining(time.perf_counter())
+        if remaining is not None:
+            countdown_rect = QRect(
+                right - self.COUNTDOWN_WIDTH, rect.top(), self.COUNTDOWN_WIDTH, rect.height()
+            )
+            align = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            painter.drawText(countdown_rect, align, f'{remaining} s')
+            right = countdown_rect.left() - self.MARGIN
+
+        left = rect.left() + self.MARGIN
+        width = max(0, right - left)
+        half = rect.height() // 2
+        align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        title_font = QFont(option.font)
+        title_font.setBold(True)
+        title = QFontMetrics(title_font).elidedText(
+            prompt.inputs.title, Qt.TextElideMode.ElideRight, width
+        )
+        painter.setFont(title_font)
+        painter.drawText(QRect(left, rect.top(), width, half), align, title)
+        preview = option.fontMetrics.elidedText(prompt.preview, Qt.TextElideMode.ElideRight, width)
+        painter.setFont(option.font)
+        painter.drawText(
+            QRect(left, rect.top() + half, width, rect.height() - half), align, preview
+        )
+
+        for exit_code, button_rect in button_rects.items():
+            button = QStyleOptionButton()
+            button.rect = button_rect
+            button.text = prompt.pass_text if exit_code is ExitCode.Pass else prompt.fail_text
+            button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+            style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton  # noqa: W503
+        ):
+            prompt: Prompt = index.data(Qt.ItemDataRole.UserRole)
+            position = event.position().toPoint()
+            for exit_code, button_rect in self.button_rects(option.rect, prompt).items():
+                if button_rect.contains(position):
+                    self.clicked.emit(prompt, exit_code)
+                    return True
+        return False
+
+
+class Dashboard(QWidget):
+    """Window with the pending prompts. Shown when a prompt is added."""
+
+    def __init__(self):
+        super().__init__()
+        self.setObjectName('dashboard')
+        self.resize(720, 480)
+        self.model = PromptListModel(self)
+        self.delegate = PromptDelegate(self)
+        self.delegate.clicked.connect(
+            lambda prompt, exit_code: self.finish(prompt, exit_code, ExitSource.BUTTON)
+        )
+        self.view = QListView(self)
+        self.view.setModel(self.model)
+        self.view.setItemDelegate(self.delegate)
+        self.view.setUniformItemSizes(True)
+        self.view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.view)
+
+        self._ids = itertools.count(1)
+        self._deadlines: list[tuple[float, int, Prompt]] = []
+        """
+        Heap of the prompts with a timeout, by deadline. Finished prompts are skipped, and removed
+        when they are more than the pending ones.
+        """
+        self._pending_deadlines = 0
+        """Number of pending prompts in ``_deadlines``."""
+        self.timer = QTimer(self)
+        self.timer.setInterval(1000)
+        self.timer.timeout.connect(self._tick)
+        self._update_title()
+
+    @property
+    def prompts(self):
+        """Pending prompts, in the order they're displayed."""
+        return self.model.prompts
+
+    def add(self, inputs: Inputs, on_exit: Callable[[ExitCode], None]) -> Prompt:
+        """
+        Add a prompt, which is pending until answered, timed out or cancelled.
+
+        :param on_exit: Called with the exit code when the prompt exits, ex to reply to its
+            producer.
+        """
+        prompt = Prompt(next(self._ids), inputs, on_exit)
+        if prompt.deadline is not None:
+            heapq.heappush(self._deadlines, (prompt.deadline, prompt.id, prompt))
+            self._pending_deadlines += 1
+            if not self.timer.isActive():
+                self.timer.start()
+        self.model.add(prompt)
+        self._update_title()
+        if not self.isVisible():
+            self.show()
+        return prompt
+
+    def finish(self, prompt: Prompt, exit_code: ExitCode, source: ExitSource = ExitSource.API):
+        """
+        Remove the prompt and call its ``on_exit`` with the exit code. Ignored if the prompt already
+        exited.
+        """
+        if prompt.finished or not self.model.remove(prompt):
+            return
+        prompt.finished = True
+        if prompt.deadline is not None:
+            self._pending_deadlines -= 1
+            if len(self._deadlines) > 2 * self._pending_deadlines:
+                self._compact_deadlines()
+        record_dialog(prompt.inputs, exit_code, source, time.perf_counter() - prompt.added_at)
+        self._update_title()
+        prompt.on_exit(exit_code)
+
+    def cancel_all(self, source: ExitSource = ExitSource.API):
+        """Exit all the pending prompts with ``ExitCode.Cancel``."""
+        for prompt in list(self.prompts):
+            self.finish(prompt, ExitCode.Cancel, source)
+
+    def closeEvent(self, event):
+        """Closing the window cancels the pending prompts. It's shown again with the next prompt."""
+        self.cancel_all(ExitSource.CLOSE)
+        super().closeEvent(event)
+
+    def _tick(self):
+        now = time.perf_counter()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            prompt = heapq.heappop(self._deadlines)[2]
+            if prompt.finished:
+                continue
+            exit_code = ExitCode.Pass if prompt.inputs.timeout_pass else ExitCode.Timeout
+            self.finish(prompt, exit_code, ExitSource.TIMEOUT)
+        if self._deadlines:
+            self.view.viewport().update()  # Countdowns, only the visible rows are repainted
+        else:
+            self.timer.stop()
+
+    def _compact_deadlines(self):
+        """Remove the finished prompts from ``_deadlines``, so it doesn't grow with many prompts."""
+        self._deadlines = [entry for entry in self._deadlines if not entry[2].finished]
+        heapq.heapify(self._deadlines)
+
+    def _update_title(self):
+        self.setWindowTitle(f'{config.APPLICATION_NAME} - {len(self.prompts)} pending')
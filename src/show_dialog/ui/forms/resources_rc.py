@@ -1,19 +1,1100 @@
 # Resource object code (Python 3)
 # Created by: object code
-# Created by: The Resource Compiler for Qt version 6.7.2
+# Created by: The Resource Compiler for Qt version 6.8.3
 # WARNING! All changes made in this file will be lost!
 
 from PySide6 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x00X\
+\x00\x00\x00R\
 {\
-\x0d\x0a  \x22host\x22: \x22loc\
-alhost\x22,\x0d\x0a  \x22por\
-t\x22: 23344,\x0d\x0a  \x22t\
-imeout\x22: 5,\x0d\x0a  \x22\
-buffer_size\x22: 10\
-24\x0d\x0a}\x0d\x0a\
+\x0a  \x22host\x22: \x22loca\
+lhost\x22,\x0a  \x22port\x22\
+: 23344,\x0a  \x22time\
+out\x22: 5,\x0a  \x22buff\
+er_size\x22: 1024\x0a}\
+\x0a\
+\x00\x00\x10S\
+(\
+\xb5/\xfd`\x80\x89M\x82\x00\xaa@\xdc\x0b&\xe0\xb4\
+\xb6\x01\xca\xc7\xeaEdS\xfa\x10\x03dM\x11C\x0d\
+\xbf\xdb\x81\x9a\x8c\x1f\x0a&|_}\xceU\xe7\x930\
+\xc3\x1a\xe3\x85\xb8\x00\xb0\x00\xb6\x00R\x86\x1c\xb8\x80\x01\
+\xf8\xd8\xe5sz5\xb9\xe8\xb3a\xdcg>\x06eP\
+g;\x09?\x95\xd1$H\x08\xa18Y\x1a\xe5\xfb\xd4\
+\xd7\xb8\xd29\x90\xbf\xe6\x8df\x9d\xb0(\x99\xb8_\x11\
+\xff\xb8k';\x0a!sA\x98\x184\x9cL&\xe1\
+-\xacT\xf2s\x9a\x04\x84\x8b\xa5\xb5\xf3\xb4\x16\xae\xdc\
+L\x0d\x95\x06\x07\xce\xe6\x82`\xc1`.\x02\xd1c\xe8\
+2\xe2L\x96IS\x11x\x8d\xf9{@,\xad\xb2\xb9\
+\x9e\xc7\x1b\x16%YA\xf4JA\xf7\x0c\x8b\x12\xc9m\
+3\x9c\x98{\xf4\xe2mo\xb7pd\xca\xf6\xfb\xde\xab\
+f\xcf\xeb\xb5\x09E\xc9y\x9a\xdf\xd3\x98\x15\x00\x1c\x14\
+D\x145%,T\x04\x22\xf7\x0e\xddj \xcd0*\
+8\x08;#\xa6\xa5?e\xb5\xd0\xc1\x80\xfc_\xdb\x8a\
+\xb0\xc4\xa0\x15\xda6M\x19\xa9\x92e\xa6\xc8\xe1R\xb9\
+$d\x1b\xa5\xb0\xde\x89o\x9f\x13\xa3\x9c\x9f^\xb4M\
+\xe4\xday\xb2\xf4\xb8\xe1\xf7\x06\xfdg\xbbUa2[\
+8y\x22\x5c\x9c\xc4\xf8\xe9o\x1e\xf4\x0a\xd4f\xbbG\
+\xc4\xfc\x1fvj\xf3\xf5;\xb7#\xe5~\xa4tB^\
+Y\x8d\xb9\x8a\xc5\xaf\xd9E\x12\xb3\xdc\xc3]BN\x81\
+X\xfba\xb0(\x99\xbd\xafQ\xb6\xfe\xcc\xe0V*!\
+Y&72}\x13e\x95\xec\x95\x92\xd8\xd4\x89\x119\
+\xe3\xa7\xc7\xc2\xf9\xf1\xf0~2\x82\x00OG\x03\xa8\x16\
+\xcfN\xe7\xb5\x82\xee\xf3\xc0\xfa\x03\x90\xd7w \xdb-\
+\xee\x04\x18J\xb3\xc0\xd1D\x17\x11w\x8f!\x06\xa5E\
+\xff'E\xd7b\x0c*!\xa7\xbc\xa2@\x9a%^\xeb\
+uy\x8b>7\x93T\xc9:\x02\xa4\x00\x85}>\x11\
+\xb1\xe8\x91C\xf28T\xe64\xac\xf7r\x0b\x09\x19\x84\
+\x0b\xe6#1\x90\xc6~g\xaf\xe5\xda\xc3P\xdb\x0c\xed\
+\xdc(\xe5\xf1\xaf\xf8\xad.\x8c\x82\xc3 \xf1\xfaz\xa1\
+2L\xa4\xc5\x9f\xa8\xff0\xf9\x95 \x7f*\x93yx\
+8\xa5\xd2\xa4)\xe4Ts\xac:\x9d\x19\x22\xb0\x22~\
+\xf1{:\xa0\xc8\xff\xb0$\x8c\xd1\xac\xb0b\x866#\
+\xb6\x88E\xacA\xfe,\x96\xac}\x135\xc3\x96i\x0b\
+_\xeb\xc7E\x91R\xba\xbf\x00\xa1\xbf\x851\xf95\xb4\
+\xdf\x095\x03-k\x5c\x01\xd3a\xc5\xc5\x19\x94\xa9\x9c\
+\xca\xce\xc90b\xf6\xd3Bz]\xa2~0<8\xb2\
+\xbd\xf4\x1d,\x0c\xa2)\xe4\x11\x8bX\xb6\xedm\x04\xb6\
+S\xa6|\x96\x9c\xf4\xfbt!\xe4o\xbf3l\xa4\xc9\
+\x8a\xf0\xb4t\x9b\xe1\xe3\xf74\xd6\x17\x06\x9d\x01NI\
+\xa1\xf4F\x7f\xbd\x13\xd7\xfb\x0f\xf2\xc7\x9a\xec\xfb%E\
+\x9d\xd6d\xb3\x7f<\x9d8\xe9i\x86\x15\xcb&\xf5c\
+\xb5~\xb5\xfbS\x1dzHK\xc2\xb2A\xbd\xde\xbb\xbd\
+VYoTi\x12\xc6\xa2iX\xd0`\xa6\x89%\xcb\
+*\x9d+\x1dJ\x92[\xa9\x14H\xff\xb5\x91\xf9\x1b\xfd\
+cH\x06b9\xc7\x82\xf2Jmkt\xae\xd2\x8cL\
+\x8b\xa4L\x0b\x86\x07\xa8\x83\xed\xc8\xd4\x98HR\x94$\
+\xcb\x01\xe3@\x10\x0c\x10\x1a\xacR\x86\xf3H\x95\xf5\x01\
+S\xa0\xc0P\x90\x18\x1a\x85\x05\xc1$8\x0c\x04\x0da\
+0\x04\xc1\x18N\x82 \x08\xce\x08\x08CD\x9asC\
+v>\xd9\x0e\x00\x0fR\x013\x94\xcd\x16\xaa\x1cO\xf1\
+\xc2\xcd4\x10\x0a\x1fA\x0f\x9cm\x8c_\xd5\x10\xccY\
+*\xee\xad/\x07\xcc\xf1\xb2\x09/\xb6\xf1/\xc2\xe6\xac\
+\x09\x84|Z~\xf4\x04K)\xf9\x84\x04\xe4\xa7cp\
+O|\x82x\xaf\xce\x7fP;\x03t\x04\xd1\xdb&\xf0\
+v]\xc2\xe7Q\xef\xe1\x92\xe4\x1a\xc7\xcc\x93\xed\xc6\xb7\
+\xe0\x1aP\x06\xac\xe0G\x96\x06n\x0d\xbaV\xe9r6\
+X\x85\xe8\x92EI\xfaA\xf7\x05\xb5\xb4\xd7\xed\x1e\xfd\
+\xebE^\x9d\x9chb\xd0\xe2\xc7\x8a\x13\xbf\xed'\xd3\
+\xa0.\xfc|VQ\xcc\xd5t\xb2~\x10\xe5\xe2\x93\xa0\
+\xc98\x13lP\x1804Z\xcb\x8d\xd1\xd1&\x02}\
+\x111\xd9V\x05\x11\xd7\x8av\xe4\xceT@\x08\x22\xa2\
+\x05\x1f1\x8c\xdf\x1a\x1bf\xef\xa07\x19d\x88\x10\xf0\
+\x11=e\xc1\xe5\xa7\xa2\xca\xaa\xe5\xea!\xce\xcf\xb4\xfb\
+z\x89!u\x12\x9e\xb4\x04Z\xf3LEhV\xe8\xc2\
+\xad\x16'x\xa4S5xY\xe7G\x8a%%'r\
+\x15o\xa6\x14^@\xed\xe5\x0a\x87\xcc\x05\x0d\xea\x89@\
+\xb9\xaa\xb4aV\xc6!\xf3RK\xecH2\x11\xef\x80\
+\x9fz\x86\x11\xf9T\x09}\x95M\xd8tQ\xba\xc0\xc4\
+T\x1eB\xd4\xb8\xb2E\xfa\xb8\xef\x0e[tbf\xe1\
+\xd1\x8f\xaeY\xb4\x8a\xcf7H\x04\xa3\xca{H\xa5\xca\
+6\xee?3\x08\x8a\x17\xe2\xcd\x83\x12A\x90\xb9\xebY\
+\x9c\xe7<no:\xd1\xfa\x0f\xe5s\x07\x1b<\xbf\x08\
+\x16\x15R$\xfd\xed\xa7\x8bO\xed\xb0\x81hE<T\
+\xc8e\xbf\x12]\xb5A\xd1\x89<\xbe[A\x80Y\xa2\
+$[QR\xd6:+\xafR\xee\xe1\xc8\xed8\x9b\x96\
+\x05\xe6\x82\xc8\xff*\x0fw\xb0s\x9c<\x16\x0bH&\
+\x1dR\x91\xc6`\x22\xccr\x0b\x15\xe2<\xe8m|n\
+1\x5c`\xc2\xf1\xf0\x0cZ\x1eTM\x95\x07\x7fL\xc3\
+\xf7\x99\x8c\xcf\xf8W\xb4\x90\xa7\xa3\xa4\x88\xe4\xa3vG\
+A#\xd0P\xba\x1eh\x7f\xfc\xb0\x10L\xac\xf2\x982\
+>$\xb64\xf9p\xf9P\xa4%\xad~\xa9G{\x03\
+\x01B\xa3\xf7B\xd4\xf1\xbe{\x90\xec\xb7\xf9\xfa\x91J\
+\x04\xab\xfb\x16!;.~v,\x08\xbfS\x11\xc6~\
+~\xed\x82Gs\xfdm\xbc\xe4G\xbf\xd4\x02\xdc\xcb\xc5\
+\x1f\x13\xaea'\xbaa\xe1l\x1f\xb4\xaf2\x15\x1cN\
+M4s`G\xfe\x97\xeaQ\x8cO\x04\xb2~\x05\xab\
+)\x1a7\xbdt\xe9\xb2\xc5\x5c\xb9\xd7\xa2d\x13\x00=\
+\xed\x89U\x1c\x87\xa04\xae3\xf3+`Y\xe27L\
+(h\xf15F\x8dS(\xf3\xb9k\xf4\xc1\xcc\x9f\x90\
+\x93\x098;\x0e\x89\xb7\xbe\x07\xbf3L\xb6XV\xb6\
+\xa9.\xd3\x9f\xb6\xda\x843Y\x0e3\xf3\x99\x9f|&\
+\xaa\xe3\xa3\xa5G\xde\x07\xf0\x93bg\xe9\xf3\xe6\x9d\x93\
+2\x97DJ\xa0\xcf\x95KQ\xde\xe9\xa5\xb4\xfb\x8b\xfb\
+\xaa\xa1?\xfb\xa8\xe3\xa3\xb9\x16oS\x07\xa6\xee\x5ce\
+\x98\x14q\xae\xde,9X\xbd\xd0&\xa2\xeb\xec\xad4\
+8id\x19\xde\x83\x1d|\x05\xddb)\x0a\x10\x0b\xbf\
+\x0dO\xfd\xf0J\x88\x88a)\x026\x9f\xb8\x01\xa7\x05\
+=&\x93-K|\xeb^y]\xc1\xd8\x227\xfc\xc8\
+\xe8~\x8f\xdcq\x00\x9c\x9au\xdf\xb2;\x15/\xc6-\
+G\xef\x167\xfa\xa9\xdd\xb0K\xda\xca\xea_\x80\xae5\
+\xb5\x88\x91$f\x01\xe9\xe6\x9c(\x19\xe8i\xce_u\
+\x22n\xd8V\xd7\x9d\xd6\xc4\xcf\xf8\xfeO2\xb6\x0c\x96\
+U\x86D\xf0\x96{\xd8J\x8a\xa1aA\x9d\xa5\xa8\xcf\
+a\xcdt)u`?\x1dW84\x8d\x01\x03+n\
+\xa5Gu\x8c\x9b\xdd,IR\x92|\xb5\x0a\xea\x94\x17\
+\x15\xd1\x9c\xf0\x9c\x93\xa4\xd3\x94\xe6CN\x97\x91f\xd8\
+\x8c\xa8\xf3\x8f\xb7\x93\xec-\x84\x97\x0b\x22$]\x86\xc6\
+\x14\x0e\xc8\xce\x81h\x8c\xe06\x1b\x0f**\xb5\xda\xa2\
+\x10\x7f\x22F\x1e7\x14H5h\x9e\xab\xb7\xeb+\x14\
+\x88iA\xc1-\x9c\x0a\x0b\x19\x17\x0b99Y![\
+!\x0a\xdf\xefx\x15\xac\xed`9\xee\x13\xf8\xe5!\xde\
+k\xb5\x11N\x1f}r\x8d\xda`\xdf$\xdf\xe7C\xbc\
+\x85e\x06\xa1Q\xef\xa0\xda\xc7hr\xa0M\xbe\xc4g\
+\xefxx\xbae\xa7bZ3\xff\xdc'\xe4\x5c\xa8\x86\
+\xa8\xaaC\x8b\xd2, \xd7\xc2\x16\x18M'W\xbe\xdd\
+I\xe7V:\x9d\xbc\xc1U\xc65\x9e\x9cWn\xf2\xc0\
+{N\xa6\xf9\xa5\xa5\xea\x1a\xdeOY\x03\xb1Z\x82D\
+\x97\xd7\xe0]N{6\xdf\xf7,\xc1x,G\x1c\x1b\
+\xac0\x04k\xa0\xfa\x16#\xbdRQw6\xe1~\xca\
+\xa5%\x8b:\x10{\x01O\x89\x00\xd2\x19\xdeeY3\
+$NH\xb8\xec\xcb\x0b\xce|\xe7~\xe5j\x88\xd6|\
+\x84 \x92\x95b\xfa\xf7\xd2\xf2\xf3Py\xf2\x97\xe4\xd5\
+{\xabw\x88\xce\xb8\x0d\x0f\x09W\x97w\xa7s\xa4*\
+\xe4,K\xacq\xd5\xd4\x822\x8e\x01\x87\x8d\x9d79\
+}\x1d\xab\xde\x81\xbe\x0c^\x87sx\xca\xf5q\x03\x1a\
+\xb5\xc7\x81[yh\xe1\x97Bn/\xd5\xbey\xe7\xa1\
+\xbd\xf3\xf8PN\x1e\xb0\x9e\xf4\xc1\xa2\x17\xcf\xe8\xb9z\
+:^\xcbmo\x1a'\xde\xd1\xd0\xb1\x84\xf9T\xfc\xb1\
+\x22g5|\xde\xa0M\x0b\xc2M\x13\x1b\xfc\xccR\x01\
+\xed\x06Sb\x03x\xea\xd7~\x19\xaa\xa2\xf7\x14%\xac\
+A\xd2\x1a\x15\x10\xf72\x07-\xcd!p\x83\x1a\xe7G\
+(b\x9f_\x08\xe2\x08FD=_\xd3<\xc1\xe7P\
+\xc7\xe9#\xfc\xf4o\x01\xd2)\x98\x13]0\xfac\xee\
+\xb3\x08\xc9\xbc`\xf6#=\xc6 S/\xee\xbb\x0be\
+\x1eYa\x0f.\xcaN\xb3,@\x17\xf2\xe9\x8fk\xab\
+\x22\xb4\x9b\x98$\x81^\xbb\xa6\x0b\x84\x02\x91\x82\x0c\xad\
+(!;\xa6\xa4\xa0\xa1\xa9\xfa\xbd.\x9b\xe0\x8d{\x91\
+G\xc6\x7f\xd9\xc0\x01\x03\xce\xe3d\xc4\xdb\xe8qd3\
+\xb7\x97\x99\x94\xee\x0b\x90>\x1a&hs\x0cT+\xf2\
+u\xc5\x07)\x84\x9d\x7f\xf1/\x8bA\x15\xd4\xf5\x8dH\
+[\xed\xdb\xd4 \x9f\xbe\xbd\x8a\xa2\x16\x13\xa7\xab%\xe8\
+\x826tV\xaca\x00%\x1f\x08\x106O\x1a\xc6\xba\
+\xb8\xcb\xf8\xf6\x8f\xee\xf5\x00f\x83\xcb\xb0?\x227\xea\
+U]\xf2\xb6<\xf6aD6\xb3\x1f@\xef\xdf\xab;\
+u.\xe3\xe6\x1f\xc0\x82\xed\x89\x06\xc7\x9aM!Es\
+\xe3/;\x1b\xdaf\xbc,4:9\xf1*1\x80\xe8\
+\x0bt\xcfb\xec\xf3\xbc\xbe\xbbB\xba\x04\x09\x1f!\x14\
+`,\x92p\x97\x95A\x89\xbb\x09\x13\xc9\x98g\xcaL\
+\xbb\xf0z\xa3\xbfL\x03{i\x87\xabJ.dj\x8e\
+\x08\xd6\x92\x04\xb4\x8e;\xa0\xc6\xc7\x0b@0\xa5\x97\xc8\
+\x81C\x92i3`\x8c\xc7\xc2\x146Z!\x94\x86c\
+a\xdb\x118\x10\xba\x0b\x12&#\xe2\x01\xfdi@T\
+\xa4X\xb7'HHa\x82\xa9J\xd5\xab\x9f\x01 \x0a\
+\x9f\x83a\x93R\xb8}:\xad\x05\x12$\x9c\x17\xc6]\
+\xd4\xf0\x02l\x00\xf0\xcb\xc2\xe9>r\x1b\xc9\x1f=\xf8\
+t\xa9'\xdac\xe1X \x03\xf2\x22\xb0!\x05\x16\xd3\
++`\xce\xae:\xcf\x1d#\xc3SO\xe8\xb6\xf5\xcbV\
+.\x0ek\x84\x97G;\x82\x92\xd3\x0d\x0c\xecrg\x90\
+u\xee\xc58y\x0f@|$I\x88\x0b\xe4\xf79\xd4\
+\x93\xa4_\x81M\xf5\x9a;\x9e\x80\xac\x92\x88\x0d\xb0!\
+\xab\xe1\xf0M\x11l\xbb\x0d\x81\xa7\xf5\x00@WZ^\
+\xa0\x1co=4\xfb}\x94\x13\xda\xf3C{\xdekP\
+\x8c\x16\x1b\x05\x95\xddS:\x03n6\x1e\x91I\x05\x9f\
+\x13\xca9\x19\x88\x93;\x99\xd3\x84\xb3\xbc\xb5\x06\xbe\x8c\
+Y\xa4V\x0f\xda\x06bp6\x91\x12;\xcd\xddW\xe0\
+\xb6\xef\x0e\xf3\xb6a\xc5\x883K\xde\xedi'\xb5|\
+Y\x89\xdb\xb7\xa6\xfb\xa8\xec\x10I\x04\x09\xb2\xfa\xe6\xde\
+\xcc\xe0\xc1\x1e?\x9a\x81\x99\xd1BQ\xa8\x1a\x8b\x85\xd0\
+\x0f\xc3\xa9#y\x8c\xa6yK\x89\xce\xbe\xf7i\x0b\xcb\
+j\x5c\xfcv\x10\xa9^'\xe5\x17\x16n\x87D\xb2@\
+\xd5\x9b=\x02\x02\x9bY{\xbcWN2!U:I\
+\x81u\xb2\xfa\x8al\x05\x5c\xc6\x84g\xbd\x8c\xc3\x88\x9d\
+\x9a\xe4\xd6\xa9\x88\xd0\x1eJI.\xa7P7\xdc\xf6P\
+\xfc\x81\x1d\x1b\xb8=\xe6\xd5\x06\x1a)\xef\x86\xc6\xc4\xb7\
+\x8d\x18To\x13\xe8\xec\x06\xb8b[\x83\xa2\x89\x18*\
+\xf9<\x0b\xf5\xf7D\x0a\xf0\xa4J\xa8\x01\x19\x08 \x8b\
+\xd9\x0eT\x9c\x07\x08\x11*\xfa\x1f(`\xba\x1b\xc2\x22\
+\xc8\xbd\xc1M\x22\x86\x22\xc9\xa2\xf4\x07\xb2\xd5\xf9\xc1\x88\
+\xa5\x05\x98\xff\x1fj\xc0\x10+OZ98S\x0b \
+f\x1d\xff\x9f\x1a\x22\x88\xd3\xd7\x1fr\xb8\xa9\xe0B\xf9\
+\xe0\x1a!\xe7]\xbf\x9a\x0b\xc0H!\xdbho\xbe\x9e\
+\x89'\xf3\x85\x8fl\xcb\xda\x04$\x8a\x03-\xcb\xc2(\
+b)d\x96SF5\x8c+\x80\xb1DU\x10\x9b\x02\
+\x08\xce\xa2\xef\x01\xe1a\xb6\xfd\xcd02\xa2\xb6;\x5c\
+T\xa6\x0dh\xdeD5y\xac\xeb2x\x8a^X\xb1\
+b.t.\xd0\xe2\xe4H\xf8\xde$\x7f\x04\x0b\xcfb\
+\xe1\xc4\xc5\x93\xe3R\xfd\xe5[\xa4\x08\xe1\x9a\xef\xfdS\
+\xe5\xee\x0e\xe4]\xd9\x19fB6\x9cb)<\xb1\x22\
+\xaf#1\x89\x89a\x96\xb7\xb3\xd24\xe5\xa3g\xb1b\
+t2J\x9b\xb5\xea\xa4\x09\x8b\xcb\xd5\xe7\xaa<\xd2\xd7\
+\xf7\xcf\x060\xaeJx_Jq\xdb\xf8$5}\x06\
+\xa1 t\xc3\x91\x89P+z\x06\xdb{5\xdf\x08\xa4\
+f>\xe2\x12\xbe)mn\xf6\xd3\x8a\xe4\xa1\xfc\x938\
+c\x86EFa\x89rj&Z$?\xe6\xa4\x9es\
+W\xd0z\xd7\x8cur\xc1_\x9c\x0b\x1eG$=\xd3\
+B,*:3\x0e\x0d\x85G\xf2\xb9\xbe\x9d\x8f\x17\x11\
+\xe7?\xf1\x053w\xb5\xe0XJ\xca)th%\xd8\
+\x1b\x8c\xc9\xcd\x00\x98\x0d\x90\xe5p\xd1\x06\xfa\xb8\xca:\
+\x85*\x9e\xce\x1cc\xfc\x861\xa3\x8c\x22\x014.'\
+\x90\x04x\x8ei\xf3\xab\x87\x93\xfa\xd2\xabI\xb2\x07\xc6\
+)\x8b\x9d\xb9\x9e\xa2\x0c.\x8f\xf4\x8d\xa58\x1b\x03\xe2\
+HM,Q\x8a\x07\xe3\xe9\x89\x9a\xc1\x98nI\x8f\x91\
+\x5c\x1d`EdXr\xb9\x97\xae\x834\xc5\x9e\xb3\x8a\
+\x86\x18\x94\x06\x88I&\x10\xb7\x07\xf9[Z\x12\xc6\xbe\
+\x9eV\x0bP\xf49\xd9\xe2\x18auf}\xeb\x07\x00\
+jd\x00\xf9_U8\xca\xf4)\x07#\xb2\xc2\xdfu\
+\xa1\xed\xca\x09\xbe\x8a-\xaa\x9c\xf6\xec\xb4\x9e\xfa\xddn\
+\xec\xa1x\x03\xdd7\x078\xaf/\x0e\xb2\xa1\xd9@\xf7\
+\xb9C\xd31\xae\x0frs\x8e\xd9\x85P\x11Q\xe6[\
+\xd0;qB\x08\xa8\xde!Fy\xbcP+\x1d\x82n\
+\xbf\xf9T\xd6x\x10\x07\xa6ed \x11\x12\x89\x17\x86\
+\x881\xd4\x1bgI\xbc\xc4\xe9q\xdcH\xe2\xd8K\x04\
+}\xc0\x83\xef\xc0P\xb1\x98\xcc\x0e\xb2\xb0R\xc0\xfe\x1e\
+\x08\x02\x0c\xd5\xaa\xf9\xff-\xdd\xfc\x1f\x83\xab\x96\xeeL\
+\xdb\xaf\xb6\x17\x83\x9d\xd5|p\x09\x86\xb2\x14\x00,\xfb\
+\xb2Qu|,bo9\x80dW\x19}\x0a]$\
+\xf3\x1e\x16\xa1\x96\xacz\x0a\x02\x88\x99q\xb3\x09\x03\xe1\
+u\xfeb\x14ww\x82\xee\xa1H(\xac\xda\x22)l\
+\xfaYp&\x04U\xf8\x9ay\x87\x13=}\x80\xeb\x98\
+\xad+\x0a1\xa3\xde<\xbc\x0c\xbdd\x84lgk\xb9\
+\x1fB\xaf 1\xdc\x92\xcf(\xff=H\xcasN\xcf\
+\x88\xc1P\x0c\x0e\xc8[2b}I\xc3\xb96b1\
+s\xa5\xf8L!\x18\xe33v\xec;8*\xb5sE\
+\xbcf6\xd1\xcdz\xd9)\x07\x0a\xc51\xf6\x86uX\
+8\xa8\xbc\x08\xd0n\xaf\xac=\xd4s\x01X\xc9\x0e\xf8\
+>\x01\x7f\xf7\xc1\x00p^\x1b\xa1\xbc\xe6Z\xc7\xa9\xee\
+\xbdD^\xb8\x18\x99\xa3'\x22\x12v>\x83\x7f:Y\
+\xf9\x12\xce\x87<_XP\xa2\x8b\x0a\x95\x94\xb1\xa6r\
+\x0a\xd6\x82\xb1>*\xa7\x0f\xd2\xcaF\xc5\xd0m\x971\
+\xc5\xf1\x9b_G\x99\xcc\x22Z\x22M\xb6U\xc4:\xcc\
+\xae=A[\xb7\xf1D\x80\xcdD\xd4\xc9\xad\xc6|\xa3\
+\xb5\x9c{\xd9\xf8F\xa4\x11\xe68b\xd6Y/f\xb6\
+\x93\xffr?\xe7\xb7\xecU~\x83\x82\x04\xcc\x89\x9c\xd1\
+\xb0#\xe7\x0e\x13\x84\x0a\xc2.\x86R\x0e\x22gCF\
+1Mh\xc8\xa0~\x08\xb1\x99[\x82\xaeQ\xad*c\
+\xea#\x8ejc\x8e\xed\x02\x5c\x8d\xc7\x873\x0c`.\
+\xb1\x1fw\x12\x1e\xeb\x1b\x00D\x1e\xf6zS\x0c\x86\xb6\
+\x0b\x82\x91bsH\x14u\x1f\xa7m\xf0p\xeaW\x89\
+\x9f\xa2f\x83\xcb\xad\x04\x83\xe1I\x9d\xe2\x89v\xad\xbf\
+\xe0{\xd8,B\xfb\x7f\xa4j(\xb17\xce\xfc\xa7\xf4\
+_5\xcd,Q\x96\xffwJ\x0a\xeb\x04pce\xb8\
+\x9f\xe4\x98\x08:)\xd8q\x85\xa7\x92\xde#\xf1A\xc4\
+\x9e\xd1\xa7N\xe1\x80n\xe9\xc3M7G\x9c\xcf\xb4\xa4\
+$8oN\x17*B\xaa&\xa0\xa1\x15\x96Tl\xeb\
+}E\xe0TX\x01\x181\x81\xbf\x09z`J8\x97\
+\xba$\x01|\x87\x91\x22\x9f\x0aI\xb2d\xc3\xd9W\x90\
+\x10\x1aX\x0d\xdb\x7fcxP\x81\x8f\x1bDh`4\
+F\xa9\xa4sX\xcdH/]\x97\x8e]\xf6%\xcc\x81\
+J\xfb\x0d\xc1\x04+]y\xf0<\x8e\x8a;P\xc1\x08\
+\xef\xa1/ZR\x07)&\xc78m\xcf\xd9\xd0\xff\x22\
+?\x93\x9d\xdd3\xf1\x0b\xdf\x09;Y\x17\x91\xa8}\xcc\
+\xa4\xf0I\xfb\xd0^\xb5\xf5\xc8I?9!\xe7\xd1M\
+\x18\x8a\x1a\x11\xa8\x1cM\x89)\x97\x80\x16\xae\xa2\x94\xcf\
+\x06K\xdb\xa9\x22\x12\xa5(\x12\xb2\xc3\xa9\x05U|\x87\
+{d1\x01c\xf8;\x0e.i\x853\xe2\x0b\xe4\xa5\
+\x10i\x83\xe1\xe1\x08\xf1\xb06\xc9Q\x0a6\xa5%P\
+\x7f`\xc9@\x8a\xb3\xb5u\xcf\xec\xf5[\xfcO\xae\x1c\
+\xe2i=\xa2dA?s\xabP\xa1\x0c\x9b\xb3\xed\xa6\
+\xbb\x02\
+\x00\x00\x00\x13\
+/\
+* link-color:  *\
+/\x0a\
+\x00\x00\x10\x92\
+(\
+\xb5/\xfd`\x87\x8aE\x84\x00*B\x14\x0c&\xe0\xb4\
+\xb6\x01\xca\xc7\xeaEdS\xfa\x906\xe4\xb6\x91\xc7\x93\
+;\xa5\xf1}\x05}\x09\x1b\xeb\xb7xo\x22\xf6I\x98\
+a\x8d\xf1B\xba\x00\xb3\x00\xba\x00\xee\xf3\xa0\xfa\x83\xf9\
+\xb1\x18\x1e\xc8\xf6\x8a=R\x86\x1c\xb8\x80\x01\xf8\xd8\xe5\
+s:eq\xd1g\xc3\xb8\xcf|\x0c\xca\xa0\xcev\x12\
+\xfe\x84\xa92m\x1a,\x95F\xf9>\xf55:\x90\xbf\
+\xe6\x8df\x9d\x98\xb8_\x11\xff\xb8k';\x8eC\x03\
+\x073-4p\xdeBJ%?\xd7\xe9L\x9b\xceB\
+k\xe7Y-\x5c\xa9\xe1X.\x96\x85\x8a&\xb3A\xd8\
+H\x1b\x81\xe81t\x195t\x04^c\xfe\x16H\xa5\
+T6\xd7z\xbcaQ\x92\x15D\xaf\x13t\xcf\xb0(\
+\x91\xdc6\xc3\x89\xb9\xa5\x17o{\xbb\x85#S\xb6\xdf\
+\xf7N5[\xaf\x97&\x14%g5\xbf\xa71+\x00\
+8(\x88:\x1d\x85\xcdEA r\xef\xd0\xab\x06\xd2\
+\x0c\xa3\x82\x83:\xe9~\x03\x84\xfe\x15\xc6\xe4\xe7\xd0~\
+'\xd4\x0c\xb4\xacq\xed\x8c\x98\x95\xfe\x94T\x83\x07\x03\
+\xf2\x7fm+\xc2\x12\x83Uh\x9b\xc5\x92\x91*Y\xc6\
+\x12e8\x18\x8e\x85\x93it\xc2z'\xbe}Nl\
+r~z\xd14\x91k\xe7\xc9\xd2\xa3\x86\xdf\x1b\xf4\x9f\
+\xed\x15\x85\xc9l\xe1\xe4\x99\x80\xe0$\xc6O_\xf3\xa0\
+S\xa06\xdb=\x22\xe6\xff\xb0S\x9b\xaf\xdf\xb9\x1e)\
+\xf7#\xc5\x13r\xaaj\xccU*~\xcd.\x92X\xe5\
+\x1e\x0e!\xe4\x13H\xb5\x9f\x8dE\xc9\xec}\x8d\xb2\xf5\
+g\x06\x97R\x09\xe9bq#\xd3\xa3\xac\x92\xbdN\x12\
+\x9b:1\x22g\xfc\xf4X\xb8\x9f\x8c \xc0\xeah\x00\
+\xb5\xe2\xe9\xf1\xbcR0md\xfeF\xff\x18\x92\x81T\
+\xce\xb1\xa0\xbcN\xdb\x1a\x9d\xa34#\xd3\x22)\xd36\
+\x0b\x9cLF!Bp\x8f!\x06\xa5E\xff'E\xd7\
+b\x0c*!\x9f\x9c\x9a@\x9a%^\xebuy\x8b>\
+5\x16\xa9\x92u\x04H\x01\x0c\xfb|\x22b\xd1#\x87\
+d9T\xe64\xac\xf7r\x9b)3!L\x1f\x89\x81\
+4\xf6;{+\xd7\x16Cm3\xb4S\xa3\x93\xe5_\
+\xf1K]\x18\x05g#\xf1\xfaz\xa1n&\xb2\xe2O\
+\xd4\x7f\x98\xfcJ\x90\xffD\xc9d\x1e\x1eN\xa94\xc9\
+\x12\xf2\xa99R\x1e\xcf\x0c\x11X\x11\xbf\xf8-\x0f(\
+\xf2?,\x09c4+\xac\x98\xa1\xcd\x88-b\x11k\
+\x90\xbf\xcb%k\xd7D\xcd\xb0e\xda\xc2\xd7\xfaqQ\
+\x14%o\x1f\xb2z\xf4\xee[Rj\x14 \x900\x14\
+\x89\x22\x0dP\xd6G\xfeJ\xee[\x0cR\xd0#\x80\x99\
+\x0e+.\xce\xa0L\xe5T~\xe7d\x181,0\xfb\
+i!\xbd\x10\xa2~0<8\xb2\xbd\xf4;\x16\x06\x91\
+%\xe4\x11\xcb\xb6\xbd\x8d\xc0v\xca\x94\xcf\xee\xf7\xe9B\
+\xc8\xdf~\xdfh\xa4\xc9\x8a\xf0\xac\xf4\xf1[\x8d\xf5\x85\
+A\xdf\xc0))\x94\xde\xe8\xafw\xe2z\xffA\xfeT\
+\x93}\xbf\xa4\xc8\xd3\x9al\xf6\x8f\xa7\x13'\xadfH\
+\xb1lR?U\xebS\xbb?\xd5\xa1\x87\xb4$,\x1b\
+\xd4\xeb\xbd\xdb+\x95\xf5F\x95&a.\x0e\x1d\x87\x06\
+\x85\x8ber\xc92Jg\xb6\xd2\xa1$\xb9\x95:\x81\
+\xf4_\x86\x1e\xa8s\xfd\xc8\xd4\x98HR\x94$\xcb\x01\
+\xf3@\x10\x0c\x10\x1b-SFs&\xea\xf9c\xb0\xd0\
+`@L\x0c\x04\xcd #\x18 \x04\x8f\x00\xc2\x18\x84\
+b \x09\xc2 \xc4\x13\x10\x85\x08D\x0a\xa7\xec`\xe2\
+\x11n\x97\xae\x88\x1a=\x9d\xd32\x0c\xc7O\xc4\xfdp\
+\x81\xbe3j\xacs+\xd6\x18y\xc9O\x1aY\xb7\xb4\
+\xab\xb6\xddJ\xd1\xb1\xf8sP\xa9\x1a4f\x15\xa5\x03\
+\xbfx\xa0\x88\x1b\xa2\x93>\xe4 (\x8e\x04\x8f?B\
+I\x8bI\xb5=;\x12\x1c\xd6\xac\xd2\xcb\x9e\xf1~$\
+\xbc\xa4\x13\x0c\x1e\xfb\xbcw\xc2\x83\x92\x8c\x034\xe6\xd5\
+\x8c\xd0J\xfe\x91\x10c\xd7W\xa8(E\xba\xeaQ\x04\
+\xdc`\xc2dJ^\x92\xef\x17]\xd1\xed\x5c\xa2\xe7\xc8\
+\x16\x0e\xa9\xda\x0fIl\xe69K\xb5\xee\xf2\xdc2\xbc\
+e\xb5V\xba`r2I\x7f\x0fk\xd0O\x8d5^\
+/\x83\xfb\x1c\x86\xba*\x11\xdc\xa0\xcb\xcbf\x09\xb5\xd7\
+\x7f\x8eTM\xa5\x85\x88\xef\x88\x06\x81\xf8\x85\xcf$X\
+\xe6\xda\xd8d\x0d\x99\xa1r\xdd2zP+\x09\x97\xd8\
+\x12m\x15\x8ahn\xb5?\xc2\xdb\x94\xc5\xb5\x12\xcb\xfb\
+:<\x0c\x08B~*\x89\xd7\xf5\xdc2\x0e\x09\xc7\xbc\
+\xb9C%\x829\xf6M[Q\x5c\x04\x8c\xcb&\xd5\xf4\
+\x93\x8b\x01\xc9\x09\x88t\x0fZ?M\x89\x10u\xf6\xc2\
+g=N\xe4V\xef\xe9\x5c8\xe8\xf6\x85\xa8L*\xe5\
+q\xbe\x99#\x19\x81J\x92%\x83T\xd1:5\x93=\
+r*\xba\x92\xb0\xb6\x95\xb7~>\xa7\x8c;\xb5\xec\xb4\
+\xcb\xa2\xab\xb26\xe2}]V,\xbdI8\xd1(\x9c\
+\x80f\x15\x0dQ\xdeV\x02\x07?@\xf7\x9e\x94\xba\x97\
+\x91\xda\xe2Nz\x12\xa2\xc5\xef\xe2\xd4\x08\xecH\x1f5\
+\x0a]\xa7\x1c\x01dht\x84\xf4\xde\x84\xb30\x88\xb8\
+\xdbm\xe4%\xdf\xf3Xc'\xd0\x02S\xf9\x07;N\
+\xd0\x00G-8\x14K\xe6\xb3)\x16\xacz\x8fm*\
+\x96\x9a\xac\xbcd\x0c\x01\xf5R\x02\x8a\xa9\x0c9\xbd\x82\
+)w9I\xce\xdd\x1b\xadF\x0fY\xad\xbb\x84\xe7\x86\
+\xfd;1%\xee\xca\x10\xd8\x0b\x1d\xe8\xb0\x9fj\x18\x8a\
+qo(#`\x92\x819E\xed2\x85\xfa\xc84P\
+\x1f>\xaf\xc2\x5c\xdad\xf9\x98\x18>\x1d\xba\xfaq\x89\
+\xdf\xa6\xe5i\xf3\xd6\xe5\xea\x17ak\xb4\xc8\xd6\x22\xe1\
+;^HD$8*\xdd h\xab\xaau(=\xf5\
+\x09q6\xbc\xf7o\xc3\xfc\x1e\xcbDN\xc6\xed\xf9\xd4\
+\xf0M\x80\xa6\xdc\x03\xbfDs\xf9d@\xd0O\xe3\xbc\
+\x8e\xf5G\xc9v\x82\x1c~\xd5x\xa5,S\xcb\x1d\x0c\
+\xbd\xa3\x04\xe1\xbf\xd7>\x04l\xdb\xfc\x9ay\xa6-\x8c\
+\x0a\x03\xd0\xec\x9c\xdd\xea\xbf\x81%\xfc\xa6\xe5y\x06\xf6\
+a)\xaa\xc2\x01N\xce&\xe2.\xa3\xab::\x96\xd9\
+\x09\x0e]8\xecT(^\xfb\xd5'`?\xbb:_\
+\xb51\xfc\xb7\xd4h\xe7\xac\x0e\x13\x09\x0d\xd9\xae\xbfX\
+\x8b\xcd\x17\xed\xc1\xd6%\x12\xc0\xa6\xd4{F\xf9\xfb;\
+@\xf3\xea\x1c\x01U\xf9\xddY\xe3D\x0d\xae\xcf\xf5\x9a\
+5\x85\x14\xb20\x8dq\xdf\xffk\x5c\x0a`\xc4\xd7\x18\
+\xe3\xdc\x06}z\x11\xa0\x7fQ\x90\xd7\x0a\xe8\xf5q\xbb\
+\x04\x07\x8e$(\x15MP\x95\xafy\x96\x95Oy\xc4\
+M\x91\x02\x86.K\x90y\x82Le(\xb3\x8d\x03\xab\
+J@%\xd4f\xbd+\xd1NG\xb4p\x7fED_\
+$\xd4\x0e\xcc\xd6\x17\xd3\xc8<\xb8Xu\xdf\xaf(\xfc\
+.\xa5CH`$W\xae\xbe\xbc\xa7\xb4\x22)\xd3\x8b\
+Ze+\x9b\xce1\x12\xb2\x9a/\xb5\xd8q-\xc2u\
+\xd1\xcc28\xec\xa4\xee\xe5\xe3\x8d.\x96\xb9\xe3r\xca\
+\x89xj\xb0\x19\x1c\x01,\x97\xb87\xe8\xc4\x85W\xe7\
+d\xf1\x81I\xbb\xe9\x83\x153[\x0c\x14\xecCS\xe8\
+;\x90\xd4]#|B\xd9\xb1x\x971i\xb8\xaf\xe8\
+\xf0\xd1\xff\xb1\xad\xb6\x8c\xc7HJ\xf3\x9c\xe7\xae\xf7\x22\
+\x18\x1a\xe8\xad\xeaC\x07B[\x86Iu\xb4?F\xcb\
+8dG\x88\x81\xe2\xb7\x80Gw(\xe8\x1b\x97D\xa9\
+<\xf9\x08\x16\xcc\x84TO\xbb\x91\xc1\xd3\x94L\xd5\xe6\
+\xc6,T\x97$Lx\x94(\x17\xe4'\xc9}\xfb\xbe\
+\xe1\x81\x09\xb9\xbbC\x7f\x0a\xff{\x88Y \x8d\xeb\xb4\
+\x11\xf0\x9a{_\xa7\xa3\x90>\xafK\x90\x19\x05\xe2F\
+\x97\xa7\xe3\xc1\x1emiD\x17\x85lA\xafP`d\
+-\xcc\xb2\xb5\x82\xc4\x92R\xd8\xde$\xad\xf0L\x07\xcb\
+(\xf7\x13~\x97\x97w\xf3\xda\x08\xae{tI>\xea\
+\x81}\x93\x22\x9fk\xa2\xb6h\xca\x00\x89y\x07\x82\xde\
+\xbf\x89\xbc\xf6\xf0\x12\xa568\xc2\xd3J\xef\x9c\xa6\xa1\
+\xf9\x86>C\x8e\xeb;\x8f\xaa}`\x97F\xdb\xba\x96\
+\xb7\x82\x9d\x8eZYr\xe7\x9e\x1bt\xd4\xf0\x9e\xaf\x04\
+\xacY\xcc\xb1\xe4\xc62U\xacd\x22\x7fQRm\xc2\
+\xc6i\xb2\x81\xcd\x96 k9*\xf0\xf0i\xf3\xe0\x1b\
+\xef\x12\x02\xa0\xe5y\xa3\x08\x1ap\x82 \xe8\xbe\xc68\
+\xbd\xbe\xcf\x0bg\x8d\x22\xd3\xa4\xa2><\xf6\xd4\x7f#\
+\x8c\xfb\xcb\x1b\xb3\xbc\xa6\x97\x13\x97I[\xd2\xf4:\x80\
+\x8e=\xb5vjp\x22\x110y)\xd3\xd5\x8b\x9b7\
+\x0ei.o%\xeb\xff\x1b\xba\xd7t\xdcl\x18\x91@\
+.\x1f\xef.\x87n\x0a9k\x89M56%\xce\xc8\
+\x98tes\x18:\xa9\xeaX\x15\x0b\xf4\xe3m\xa4\x9c\
+cP\xc4\xe7\xc1#N\x8dcY,\xa1\x9f\x86\xca(\
+\x93\xa6\xb87\xc4\xacy\xc7\x5c\x9b\xbbzl=\xf8\x03\
+\x8cb<\xc6'\x9e:\x04q\x0e\xd8\xa4\xcfaG\xab\
+\xc8p\xcc\x07\xf1\xf3E\x18\xb5\xe4c\x05\x9d\x96b\xee\
+\x0b>\xe8\xbe\x09\x1dp\x1c\xc8\xc9\x0c\xc0\x95\xdd\x031\
+\x17\xbdH\x1f\x95(\xdb8\xb5\x1e\x83,\x1cy\x82\xd4\
+f\x0bt\xafa\xc3\x98&\xd6t\xbd\x92\xf8$\x01W\
+B\x22\xf5^\xf8\xc0J\x05F\xe2\x97\x847\x91['\
+\xba\xcb\x01\xfdP\x08\xba\x93&\x03\xc4\xf4k6\x91\x88\
+S/\xbe\xa9\x17\xda\xf6\xb4\x85\xc9\x5c\xa7\x9d\xb7\x02\x89\
+\x0f\x85=\xe5\xb5*\xc4AD]QA\xbb\x9e\x0a\x83\
+\xac\xc9\xa7\x88\xe0\xca1\x06\xcfNR\x0d\xe8^\x1b\xf5\
+Y?\xa1\x0eW~\x8fZ\xb3f\xe1\x03j\xbb\x87\xe0\
+Zoy\xe4\xb6}\x0eB\x18S\x86.0\xeb=\x8c\
+\x80'\x1a`A\xdf:v\x843\xc4\x0a\xa0\xcdK\xa7\
+\xa6bP\xc7\x94\x97\xcb\x9a\x90\xaa\xcf\xcf\x9d_Y\x22\
+\x05\x1a\x8f\xa4\x95i\xef5\x14\xaeD\xd2\x80\xb5\xc4\x10\
+4\x0f\xcf\xa8\x17\xdb\xd5K)\xff\x8f\x7f\xcf\x04\x82\xc0\
+\x92p\x8fT\xf6\xe0\xebb\xcc\xeb|\xb8zS\xca\x94\
+\xf8\xb3\xb5\x9fO}\x1d\xdc\x18\xb9[xL\x122j\
+m@eo\xfa\xbd\xe8\x80\xff\xab\xb6\xfe\x06\xf3j\xe1\
+\x18\xcd\xa9a)\x84\x88|~9c\xec\xf1\xe9\xa2\xdf\
+\xb1\xb3KB\xf8\x91C\xc1;H\xee\xc4\xa4)\xca\xdc\
+L\x9eH\x81|S\x12:\x03\xafN\x0fv\x11\xfe\x98\
+\x0eWK\xce$@\x07$6|\x02\xb8\xa7\xddP\xb3\
+\xe1\x06\x08@1\xe3\xe6pM\x90\x09\x0d!\xe3H1\
+yL\xcb\x11\xfa\xc0\xd9\x8a\x16\x89\xa8\x0a\xe1\xc1\x89Q\
+=\xfe\xc0\xf2\x06!\x8f\xa4(\x90)Hxb\xc1\x9e\
+\x021\xac\x14#\xf5Bd\xc0X\xca\x8a\x7f\xbf\xd3Z\
+L\x95\xc4}X\xf2\xff\x858\x13BD,t1r\
+\x90NH\xae\xe0\x0c\xbf\x9dz\x09\xf41\xebX\x1c\x83\
+\xc2E|gx`\x95<\x15x:\xbe3\xdb\xb1'\
+\xd5\x84{\xe0Z\xef\xb4\xa2=|\xd5`>\xf7\x9eR\
+s\xc1\x19\xa8\x93\xe7\xe7\xd6\xdf\xeb8\x0c\xce\x80\xf1\xc6\
+\xa3+`p\xb0\x8f\x09O\x7f\xfa\x956j\xafP8\
+\x18\x99j\xc2\x93\xc0t\x19\xba\xab7\xbc'\xd2\xe9\x01\
+\xdb\x96a\x01\x9d*\xe0\x80\xa6\xe2.\x9b\xd1\xfbe\xd8\
+\xf5\xd9B\xa0J*\xd4\x85EAB1\xccf;v\
+45\x1e\xb1\xa5e\xb0C\xcec\x12p\x89\x96&l\
+\xbe\xac\x9e\xb4^\x0b\x99kd\xb2g\x9f\xadMP+\
+IGi\x07u\x8e\xb7\xb6\xe1\xbbo\xdb\xaf\x1f\xdb\x8b\
+vx\x87\x0b#\xae\x1d\xc9\x14\x1c:\xa9\xdeD5\xa1\
+\xa88LDp\xd2\x99\xa8\x85\xc1=\x1b\x9c!\xda\xa1\
+!G\xa1\xeaP\x16\x22l\xb8\xab\xb4\xba\xcc\xa7u\x19\
+H\xff\xfa\xa8\xcb\x8d:\xccr\x0b\xb63\xa5\xce\xea\xb4\
+\x05\x10\xdd\xf3\xc3\xa9l\xa1y\xf3\x8f<\xc1\xe6\xaf\xcd\
+\xf9r]\xf6[Z\xb2\xe5[\xd6\xde\xca\x090L\xcb\
+\xd5ntk:\x9cW\xac\xd1i\xf8OM<(R\
+\xf1\xedJ\x0eU\xac\xb7W\xd8\xc3\xe0\x92\x11\x9c\xde\x87\
+e]\xc7\x80\x9f\xe3\xcc,,G+\xb0\xfaIN:\
+E}\x01\x98\xc3\xaa\x05\x1a\x9e\x8d\x1a\xc3\xd3\xabG\x0b\
+T\xea\xa1\xe0\x08\x80T\x0cj\x10\x22V\x0a\x0c\x13D\
+\xf6\xdd,\xcc\x94W\xcd&\xd8\xbaC2\x1d\xb9JJ\
+\xca\xba\x1f\xe4:\xf6a\xf6\x00C\x8c\xb8N\x1aj0\
+;\xe7}\xf3\xb89\x16\xdb lV\x01\xe4R\xf0(\
+\xbdD\x80\x8b\xa7\x1e\x05\xb3\x84\x8d\xd1t\x19\xff\xcf\x05\
+g\x1c\x902\x05r\xbcO\xb9\x96\xf5\x84\xcf\x147\xb1\
+\xc9J\xa0\x1d\x1ae-D\x22/\x9b\x81\xd7g\xac\xa1\
+\xa1\xb3\x03\x9fH\x0ch\x128\x01\xeb\xfb\x82\xed\x0f\xcf\
+\x87@\x8f\x94\xb0\xc0\x01\x84\xa0o\x02\xd1\xcc\xff\xd6e\
+-a}]5\xc1\xb88d\xa6\xb4\xa2i\xca%\xa3\
+@\x8asg\x10\x93\xa3\x0ez\xdc\xb5\xf6\xde\x15\x0c\x99\
+\xe7\xda\xe2\xd3U\xee\x1bV7\xdd8\x90U\xba\xb3Z\
+\x22|\x01\xe3\xea\xb0~\x11\xb5M\xea\xe0c\x11T8\
+\xa7\x09\xea\x11By\xad\x92L\xb9qg\xa6\xa0%\xa3\
+A.\x03\xa1+\x99\xea\xef\xd1K\x9b\x1d\xa3-s\xb6\
+\xe4\xc5\xd7\xd8E\xfa\x11`\xb0\x83huH~\xd1Y\
+UY\x90\xf9\x84}6P\x9f\xfbc\x9b>\x13qo\
+\x9e\xcfS\x14C4\x99\xe6\x8c\x9fX\x1e\x99\x9e\x94\xf5\
+Q\x94Q\xdfP\xa7\x18\xfa\x93\xea|<\xee\xc0N\xa2\
+D\x1eK\x84\x05&\x96\x84\xb4\x02\x8d_>\x03\x89S\
+\x87\xd5\xfdl\x02\x8f\xd8\x04\x8a\xb5p\xd1\x0b7\xb5u\
+\x02\xb9$\xc8\xc2m\xa2D`\x00\x8e\xc7\xd9\xc0\x02C\
+\x92\xc4\xde8\x06\xc2\xb0KN\x051vg\xdd1\x86\
+\xc4k\xa7A*\x8cG\xcc\x9b=3\x07R\xff\x8c\xbc\
+\xf1\xac^\x18k\x94\x0e\xcfqc\xdc\xc0.5{\xf0\
+D\xa6%-\xe5\xe01\x8f\x83$\xd6\xe2g\xfb|_\
+/\xd93<\xeb\x1e\x861\xca\xad\x02nO\xc6[\x1e\
+\xf6\x92\x9d\x09S\xdes\x96\x1a\x02h\x1f\xa0\x94M\x9c\
+\xfd\x9e\xf3{\x95\x08A\x08\xbf 7He^\xd0q\
+\xa9g\xe5\x08\xbdg\x06R\xf7\x0d\xb2\xfd)'\xb0\x97\
+\x81Rb.W\xfc\x0c'\x00\x1e\x04\x01?\xb1/\xc5\
+\xb4v\xa7\xfe\x84A\xc2Q\x87\xa2\xc8\x87\xb7\x03\xc0C\
+\xf0\x01r\x087\x0e$^\xfd\xd6\x0d\xacY$\x1a\xfe\
+\x195\xbc\x12o\xa6\xb6\xa1y\x88\x88\xcc\xa0\xbf\x87\xd8\
+\xc8\xff\xa2\x96\xe9\x84\xbf\xe6\xf4\xdfa\x0eA\x1e\xcbm\
+0U\x12,\xc9\x19.<\xe4N;6\xfd\xbc@\xf7\
+H\x89\xa4\xe7_\x0b\x84\xf5\xd3\xca\xb4\x83\xb8hm\xb0\
+=fo\x89\x82\x1e6\x1d\x228\xdd\xae\xfd\x0e,;\
+\x0a!\x84X.<`/\xa0\xc4\x1dz?\x8a\x08R\
+W2\x9eE\x09(\xff\x17\xbf\xd4\x03j\xd7v\xe0\x11\
+4_]\xfa\xb5v>\x9c\xfa\xe4\xb6\x8ar\xab`\xd8\
+=\xba\x86v\x1f\x06\xce\xeb\xfd\x86Q\xe2\xcd=\xc82\
+!\xfb\xb6j\x5c\x86\xd0&|\xa1\xc2\x90\xce\xd9\xb9\x94\
+\x10g\xbb\xd6`gp\x1d\xb0\x08\x0dRu\xbf\xe7\xa1\
+\xed\xcd\x83\xba\xecd0\x82\x1c\x90\x15\xfc04\x9f)\
+\x17\xdfH\xfaqf\xc0\x8a(T\xca\x81xccp\
+\x8d@\x9d\xe3u\x13xF\xed\xfcQ\xdc26\x1f,\
+N|\x85i\xbb[\x17A\xf6d\xb6\xda\x05\x85\x16\x94\
+\x7f1\xc6[\xf8!\xc2\x87\xb2\x9dA9\x09\xe5:\xf2\
+\xfe\xc2\xd4\x94A#\x9d\xf23\x9e\xc6\x02@\xd7\xb0\x0e\
+\xb0\xdcE:\x95{\x8dG\xea\x5c\x06\x02\xd7\xef:\xf2\
+Y\xdb\xa0\xa0\x8a\xe1\x19x\x8eQ\xa1\xb5\xe6\xd1\x15K\
+\xd1\xf9t\xd4TD\x16\xbb\x8e\xd9Vz\xd5\xd4\xa5\x0c\
+\xd25\xa3\xad\x99\xd3\x0a]'\xb0\x84k\xf6\x17\x18\xe6\
+\xde\xfabY \x04\xbf)Jn\xcaz\xa83\xd0\xa3\
+\xa8*\xf7ct\x07\xae\x0b\xe1?\xc4O7\xa4}\xf1\
+\xa0*\x0fVxP\x8f\xf3\x83\x15$-\xcf6\xce9\
+\x5c\x12`;o\xe5\x16\x1f\xfc\xe5\x15\x0bku(A\
+b\x09\xb58[\xf7]Q\xeb\xa7\x99,\x14\x89\xae\x13\
+'\xb3\xc3^\x13R\x18\x0d\x9a+4\xd9{\x8c\x81B\
+[\x11\x87\x1f\x06c\x10\x8b\xbf(Ie\x0bI\x00\xc3\
+\x1dd\x90U\x93C\xdbkaM\xb0D\x88J\xad\xc8\
+\xab\xb6\x15\xfc\xa0$\xfcgl\xef\xb0w\x98\x18c\x81\
+\xa2\xac\x9c\xe2\xd1B\x8ct\xbf\xbcF\xa2\x00\xbfG\x0f\
+$\xd6OZ\xd1U\x83\xc5\xf6\x8c2ZZ\xe2\xb2\xf9\
+\xe3ZJ\x9cU\x9f[S\x87\x9a\xdcM\x94\x07H{\
+E\xf4\x09\xe2_\xb8m\xedg\x80ZE\xf4\xcb\x1f\x5c\
+{\x83\xcf\xc9\xa8\xfd\x8b\xa1/\x9d\x17\x0a\x1c\x02y\x00\
+{6\xf3$A\x8f\xed]\xacN\xdd\x152+\xf3\xef\
+\x9b\xac\x8dW\xa6|\x89\xcf$\x00<t\x89r$\x14\
+\xc2t\x83*\x7f\x07Cl\x81\xdd6\xed8\x95\xc7(\
+\xb0\x03\xa7\x11\x82p\x9a\x00\xe9\x91\x8e\xbe\xa6\xc9\x98\xba\
+\x8d\x8e\x09\xfb\xa2\xc9A\xc0\xf7\xacG\xbdXr\x1ed\
+Szh\x15\x15$q|\x93\xc8\xad\x81\x0f\xaa6\xd9\
+\xf1kEk\x19&p[\xe8\x89\xb4\xb6W\x1c\xd7\x98\
+\x02\xef\xad?\xc9\x8a/n\x83^\xf2\xc6\x10Q\x1cr\
+\xec8,\x89\x8aA\xc4+\xc2\x19\xach\xed\x05T\xbd\
+Sn\x9d\x0b\xf7\x16\xae\xbc\x149K\xd6rTU\x92\
+&$e\xe077\x0b\xe8\xf2\x83\xf6\xd0\x13\xdb\x84M\
+\x10\xae\x14\x13\xd4x\x86\xa5+9\xff\xbez\xde\xa7\xa4\
+\xef\xd1\xfc4\x02hk/\xa7\xb9\xde($\x8e\xfdp\
+\x8c\x05={l1\xa1\xbd\x18\xff\x92a\x9b\x8a\x9b\xe3\
+M\xa7D\x89\x12\xbdy\xab\x16\xa2\x81\x9b\xb3\xbf2\xba\
+\x02\
+\x00\x00\x10N\
+(\
+\xb5/\xfd`\xe1\x89%\x82\x00v\x7f\xba'\xe0\xd2\xb6\
+\x01$\x9d\xecEnS\x9a\x93\x0c&\xf5<)\xa3*\
+\x92\xedZ\xac\xe2K\xc7\x18\xb1R\xb8\x03\x8aO\x8c1\
+\x0a!\xfc\x02\xb3\x00\xad\x00\xb1\x00\xf0@\xb6[\xec\x91\
+\xf2\xe3\xc0\x05\x0c\xc0\xc7.\x9f\xd3\xab\x8a\x8b>\xdb\xc5\
+\x85\xe6cQ\x06u\xb6\x8b\xf0'P\x14j\xa3\xa9X\
+\x1a\xe5\xfb\xd4\xd7\xe8D\xfe\x9a5\x9aUB\xe2~A\
+<\xe4\xae\x9d\xec8\x0d\x1a\xce\x85Z\xd0p\xde\xc2J\
+%?\xd7\xe9P\x9b\xceBk\xe7i-\x5c\x99\xe1T\
+,\x95\x05J\x06\xb3A\xd8L\x1b\x01\xe91t)i\
+:\x02\xaf1\x7f\x90\x87\xa5U6\x17\xf4X\xa3b$\
++\x90^)\xe8\x8eQ12\xb9m\x86\x13s\x90^\
+\xbc\xed\xed\x16\x86L\xd9~\xdf{\xd5\x0cz\xbd2\xa3\
+89P\xf3{\x1a\xb3\x02\x80\x83\x02\xa9\xd3Q\xd8X\
+\x14\x04$\xf7\x0e\xddj\x1e\xcdP*8\x08\x99h9\
+\xe3\xda\x091-\xfd)+\x8d\xe7\x22\xf2\x7fm\x0b\xc2\
+\x12\x83\xd6h[\xa5\x82\x99(\x19\xa6\x22a8\x17N\
+\x85\x93e\x94\xc2z%\xbe}N\x8cr~j\xd12\
+\x92k\xe7\xc9\xd2c\x86\xdf\x1b\xf4\x9f\xedV\x85\xc9l\
+\xe1\xe4\x99\x80\xe0$\xc6O?\xf3\xa0W\xa26\xdb?\
+\x11\xf3w\xd8\xa9\xcd\xd7\xef\x5c\x8f\x94\xfbq\xe2\x19y\
+e5\xe6(\x16\xbff'I\xcc\xf2\x8fC\x189\xe5\
+amhS12{_\xa3l\xfd\x99\xc1\xad4b\
+\xb2T\x5c\xc8t)\xa3d\xaf\x94\xc4\xa6\xce\x8b\xc8\x18\
+??\x0b7\x94\x11\x04\x80:\x1a@\xb5xz<\xaf\
+\x15t\x9f\x07\xd6\x1f\xcc\x10\x88\x03\x98\xb6Y\xe0`0\
+\x0a\x12\x82{\x0c/&-\xfa\xbfI\xba\xf6b@\x19\
+9\xe5\x15\xe5\xd1\x1c\xf1Z\xaf\xcb[\xf4\x99\xa9L\x94\
+\x8c#`\x0a`\xd8\xe7\x12\x11\x8b\x1e7&\x90Ce\
+N\xc3z/\xb7\xa10\x14\x02\x15\x92\x98Gc\xbf\xb3\
+\xd7r\x0db\xa8m\x8evf\x94\x02\xf9S\xfcV\x17\
+6\xc1\xd9D\xbc\xbe^\xa8\x1b\x89\xb48\x14\xf5\x1d$\
+\xbfR\xe4OM0\xd9\xe7\xe3\x13J\x9b*#\xa7\x9a\
+c\xe5\xf1\xcc\x0f\x81\x05\xf1\x8b\x1f\xe4\x11E~\x87\x15\
+\xe1\x8bf\x85\x14s\xb4\x18\xb1E,b-\xf2g\xb1\
+d\xed\x19\xa9\x196L[\xf8ZCN\x92\x94\xd2}\
+\x0d\x84\xfe\xd6\xc5\xe4\xd7\xd0~'\xd4\xd3!\xc5\xc5\x18\
+\x93\xa9\x1c\xca\xef\x9c\x0c\xe3E\xc5eCm\xa4\x17B\
+\xd4\xd0\xc5g#\xdbK\xbfSa UF\x1e\xb1l\
+\xdb[\x08l\x9fL\xf9\xec~\x9f\xee\x83\xfc\xed\xf7M\
+f\x92,\x08OK\x1f?\xa8\xb1\xbe0\xe8\x1b8\xe5\
+d\xd2\x1b\xfd\xf5J\x5c\xef?\xc8!K\xb2\xef\xd7$\
+yZ\x93\xcd\xde\xf1T\xe2$\xa8\x19V,\x9b\xd4\x90\
+\xd5\xfa\xd5\xeeOu\xf8\x99V\x84e\x83z\xbdw{\
+\xad\xb2^\x89\xd2\xa6\x8b\xa5\xa1\xd3\xa0Q\xb0T$\x99\
+%\xcb*\x9d\xd9J\x87\xd3\xe4V*%\xd2\x7f-d\
+\xfeF\xff\xf8\x91yX\xce\xa9\x98\xbcR\xdb\x1a\x9d\xab\
+\x14\x03\xd3\xa4)\x86\x0f\xa8s\xfd\xc8\xd4\x98HR\x94\
+$\xcb\x01\xf3@\x10\x0c\x10\x1a\xadRf\xf3L\xd4\xf3\
+\x01c\xb0\xc00 (\x06\x82f\x80\x11\x0c\x0e\x82G\
+\x00a\x0cB1\x94\x04a\x10\xc4\x13\x10\x85\x88D\x0a\
+\xa7\xeca\xd9\x0c\xf0\xe7\x8dR5\x14\xcc*\xaa\x13G\
+\xf1N\x167TL_E\x10\xce\x0eZ\xd0?\xc2\xb0\
+%g\xb5}9p\x1c\xc4\xac\xde\xd3\x9ey7\x04y\
+\xb9\x0bJ\x00\xfb\xbct\x22+K\x0a\x194\xe6\xd5\x19\
+YJ\xfeG\xc8g\xd7WP3E\xbaH\xd1\xd4\xdc\
+`\xeadJX\x92\xef\xff\xaf\xe8vN\xa2\xe7\xbf\x11\
+\x8e\xacZ\x1b\x92\xd8\x9cs\x96\xb6\xee\xee\xdc\xf2\xbce\
+\xb5V*`ri\x92\xb8\x04\xd6\xa0L;5\xdeo\
+\x82\xfb\x04\x87\xba\xfa\x12\xdc\xa0\xc5\xcb&\x12\xe2\xd7\x7f\
+\xaeT\xcd\xa4\x85\x10\xed\xb0\x06\xa1\xd6\xe3\x0f-X\xa6\
+\xda\xd8\xf5O\x9d\xb9s\xdd\x1bJ\xd7J\x82\x8en\xb1\
+\xb7uG4\xb7\xc2\x1a\xb9c\x0aw\xadDT\x86\x1e\
+\x01\x0d\xa2C~K\xe2\xbb\xf5\x192\x0e]\x0c\xdeP\
+CYa\xf6f\xa0\xadX\x5co\xc6u\x13\x13}\xb2\
+\xc5~\xe4\x04gZ\x83DI\xb3@ :{\x91\x96\
+\x1e\xe7x\xab/\x1a\x10\x0eZ\xef\x02\x12&\xe1r\x84\
+\xaf}WF\xa0\x99d\x11%U\xb9N\x0d;\x8f\x9c\
+\xba\xae\xe4\xaem\xe5\xad\x9f\xcf)\xe3\x96\x96\x9d\xec\x82\
+\xed\xaa3\x8c@^\x86\x15Kk\x02J\x12\x94\x5c \
+Q\xe5\x90\x18l+Q\x83\xdf\x97=a\xa5Na\xd6\
+\xb6\xb8\x93\xfa\x9bh\x0d\x7fq`\x824\xd2\x07\xeb\x22\
+\xd7)7\x132\x94+\xfax/\x1eX\x18\xbc\xe3\xd6\
+1r\xfa\xef\xe9\xaf\xb1\x83i\x81\xa0\xfe\x81\x00\x07l\
+\x80!\x8b\x0f\x8a%\xfb\xd9\x05\x0bZ=\xc6v\x15K\
+-+\xaf2\xa6\x80z\x91\x80RZ\x86\x9c[\xa1\x9c\
+\xbb\x1c%\xdf\xeb\x8dV\xd5CV\xeb]\xcfsK\xed\
+\x9d\xc8\x82\xb8r\xe4\xfa\xe5\x863\x0cN5\xdc\x8a\x85\
+4\x94N0I\xcb\xa0\x22|y\x85\x12\xc2\x1b\xe8\x1a\
+\x9fCq_ B|x\x0d&\x1dl\xfe8\xb8\xbf\
+\xa5\xe9\xb7}\xeb\xe4\xfe\x9bh\x0b\xda$\xd6\x22\xf1\x9d\
+]H\x14$\xb4\x952\x11\xf4:\xbcuH\x83\xfc\x16\
+C6\xbc\xe3oK~\x83e\x22]&\xfb\xe4T\xa1\
+&\x83J\xee\x01\xbe\x98ry%\xa0\xef\xa7q\x8e\xc7\
+\xfa\xa3\x04;\xe1\x0f?k\xbc\x92\xcb\xd42\x0ej\xd7\
+}\xc2\xf8\x9fS\x1f\x82\xb0}\xfe\xc7\xbc\xe5\xee\xd3\x86\
+\x01,y\x8e\xa2\xfb_\xc76|\xdb\xf2\x8c,\xfb\xb0\
+\xadjv\xbe'%3\xb8\xcb\xeb\xaa\xee\x8f\x1dy\x02\
+M\x17\x0d3\xd5\x8d\x9f~\xbd\xe9\xb6\xfb.\xcb\xd7\x19\
+\x14\xff-\x0d\xba1\xcbP7BD\xbe\x9b*\xd6b\
+\x81E\xef`\xba\xf6\xc4\xd1\x94z\xf8(\xf2\x7f\xbf\xe9\
+U\x9dC\xa1-\x7f:q\x9c.\xc1\xa5\xe3\xbd\x8c\xa6\
+\xdc>)\xdd\x84\x1b\xfd\xb3e\xc2\x00\x13J\x8f\x99\xc8\
+mP\xd2\x8b\x1a\xf4A\x0a\xb2W\x01P\x1e\xb7\xb3\xe4\
+\xc0y\x04\xa5\xafI\xae\xd2\xf4\xcb\xf2\xfb\x94\xf7p\xd3\
+T\x80\xdde\xd1\x99\x87\xac)\x0e\xc5\xd8\xe0a\x95\x05\
+\xd4\x83\xda\xec\xb8\x82\xeb*M+\xf4+]\x14\x91\x5c\
+\xef;-\xb28\x80\xccPl\xaa\xbb\xbb\xa2p\xca/\
+P\xe4\xa8\xa2\xb8\xe4\xea\xde\xbd\x99Vh0\xd0\xa8\xad\
+Y\xd9tn\xa2v\xab\xd9\xaa\x16\xaf\xd8\xef\xb8.\xe2\
+,\x83C\xad\xd4]\xbe+\xd7)\x99s\x5c\xac\x9c\x89\
+G\x17f\xc0a\xd4r\x89S\x83\xde.\xbcp\xee\x14\
+\x1f\x18\xda\x09>X\xb1\xb3\xc5\x84\xa0L\xe8\x85\x06&\
+Im\x7f\x84O\xc6\x1dH\xdeE&U\xf7Q\x1c\xfe\
+\xd5?\xa6\xdd\x16\x8d\x19Ai\x9es\xdd\x9e^\x04C\
+\x03\xbd\xb5>\xf4\xc0\xb7\x19\x982D\xfbC]\x19w\
+\xb3\x081^~\xeb\x01tGF7u\xc9\x92\xca\x97\
+\xcdc\xd9L\x00\xf5\x8b\x9b36L\xf1Q\x8dm&\
+CuN\x82\x8b\x7f\x89\xfeBt\x92\xdc\xf7\xf6\xad\x03\
+L\xc8\x8a\x1d*V\xb8\xbe\xdf\x9b\x05klN\x1b\x02\
+s\xbd\xebJ\x1d\x05\xe7\xbcu\x82lR\xe83\x1e=\
+\xe9\x1e\xec|K!B(\xac\x0ck\x85\x17\x03j\x81\
+\x944\x15^V\x9a\xc2\xf1\xe6\xbd\xc2\x1d\x1dh\xa3\x5c\
+M0_f\xbb\x19\xc9Fh\xdd\xa3\xfd\xe5\xa3\xee\x86\
+7\xd9\xe4s,\x10\x16\xe0\x0cXq\xe0\xe0\xe8\x056\
+\xb1\xd1\x06]Bi+Gx\x0ayg\xcfT\x99\xcf\
+\xf93\xb4\xba\xb8y\x94\xaa\x0f`\xd2\x80\xa7ke\x8b\
+\xbd\xd3\xe9(\xf1w\xc8I\x83\xcew^\xea\xca\xd55\
+\xd7\x1c5n\xc2Z\xd0&c\xfe\x95\xadj\x17\xde\xa7\
+\xf5\x0d\x14\xb2\x04\xb1\x96w\x81\x17K\xbb\x1e\xdf\x09\x95\
+H\x00-O\x1dl\xd05\x13|@.4\xc6\xe2\x15\
+J\xdec\xa6\x0e\x99\xbaX\xd4cc\x07x\x0f\x82\x91\
+\x97\xbd4\xe55S8\xa1I\xda_\x9a\xde~\xd0\x09\
+\xae\xb5\xb9V \x12\x98\x921e\xbat\xe9s\xce!\
+P\xe5\xc9\xe4\xc7\x7f\xcb\xee\x9fn\xcd\x06\x1e\x89\xf4\xc2\
+\xf7\x1e\xe6\x18VH\x0e\x97\xf8Tc\xe3\xff\x5c\x18#\
+1\x9b\x9c\xa0R\xa7\xce\xb5\xaeA\x9b\xd8E\xc5\x9c+\
+\x9d\x7f\xd6a\xe0\xca8w\xbb\x17Z\x05[\xc5\xbc4\
+]|\xe3\xcc\xbbw\x9e\xdal\xae\x01\x9c\x0c7\x85\xc6\
+S\x7f\xf2M\xa7\x84sb\x9b\x86I\xeb\x18\x89\xac\xc6\
+|\x8a~\xac\xc8\xb8Z|\x1e \xdf\x12s1\xd9\x07\
+/#\xa9C\x8fCS\x22\x00\xac\xb2\xfb\x17c\xf7E\
+\xb2W`\xe3\x8e\xb2\xa66\x0ca\x99&(\xed\xb8\xe0\
+\xf5\x1a\x15&\xc8\xc4\x80\xfe\x07\x89\xeb\x12S%\xa0\xad\
+\x1e\xc3\xcfV\x8a`$^$\xbc\x95\xdc\x22\xd1\xb2\x04\
+h\x5cK\xd0\x046\x19\xd0&\xe1f\x7f\x80\x9c\xea\xe2\
+S\xbd\xd0\xd6g.l\xee\x02v\x81\x15F|(\xec\
+)\xafU!\x0d\xa2P\x8c\x0a\xd6\xf5N\x18\xd8M>\
+\xc5\x1fWX7xB\x92\x9aE\x87\x12|O\xee'\
+h\xe1\xb4\xf7\xe86k\xe6\x1c\xe4\xb4{\xf0\xab\xf5\x86\
+F>\xde\xe7\xda\x821E{\x01tOa\x04\xd1\xa3\
+\x01\x0b\xba\xda\xd9E\x88!u\x00\x87/\xac5\xd5$\
+\xba\xa7\xbct\xd6\x02T\xd3\xfc\xf4\xf9U:*\xa0\xf1\
+$-\x99&\xaf\xa1q\xc5\x95\x06\xdeCC\xc0\xea\xf0\
+\x84\x5c\x9c\xd1^\x86\xf8\x1f\xf2\x97\x1a\x98\x05~\xc3}\
+MY\x0a_\xcd1O\xfa\x83\xe2\xedS\xa6\xc1\x9f\x95\
+\xfa\x89\xe1\xebE\x17\xe6n\xf7\xb3L\x98\xaf\xb5\x81\x86\
+{\xd3\xf6\xa2\xf6\xf8\x95\xb5\x8d&XQ\x8bAT\xe0\
+\x86%D\x22\xba\xf9\xe5\x8c\xc3\xca'\xfc~\xd7e\xd7\
+\xf6\xe1Gx\x05j\xd0r\x13\xb3\xec(A\x99\x00\x91\
+\xeay\xa0r4\x0a\x1e\x81\xfe`E\xd8\xab\x0e\xf7\x94\
+L\x04\x84\x0e\x1c\xa6\x7f\x02\xb6\xc3\xf9P\x81\xc3[\xc8\
+K\xf1\xef\xe6|M\xc0\x84\x86\x83\xb1A1\x07\xa6]\
+\x08\xfc\xe1JH\x8b\xe4\x0e\x85\x9a\xe0\xc4x\x8f?\x88\
+x\x83\xb3#\xe9\x95d\x8a(?\xb1`K\xb1\x1e\x96\
+\xc5\xd0\xbe\xd05\xd07e\x85\xf3\xdfIDS%\xf1\
+\xf8,\xb99!>\x87U\x22\xee_\xf6\x1d$cI\
+\xe19\xc3\x87O\xad'},2\x16\xc9p\xbc\xf8\xdd\
+g\x15\xd8^\x0f\x0ex6\xdfYz\xac\x9e\x8a\x1f=\
+\xa4\xd6\x9b\xad\xb1\x1e~.\x98\x91\xbdPi\xdf\xeb\x06\
+\x9e\xe6\x99\xb9u;:\x9e\xc1\x18 Q\xe3\xf8\x0a\x18\
+l\xdbG\xcb\xd3d\xbf(\xbb\xecu\x1e\xe6\x8d,E\
+\x88]`&'~\xc5\xad\xb1\xf4\xbbhA\xd1*/\
+\xa0\x03\x05\x1c\x00U\xdcD3\xe5~\xd9\xa6>%\x08\
+\xf4x\x852dA\x9dPR\xdfl\xe7\x8e&\x80\x22\
+\x1b\xe9\x0e\xec\xe8y\xb7\x04\xbc\xdd\xa5I\x99\x10[>\
+\xad#!+u\xb2\xef\xe9\xb3\x81\x08\xfaJR.\xed\
+\x99N\xbe\x88\xed\xf5\xaey\x1b\xf2cV\xd1\xbe\xde\x15\
+\xc7\x88k\x08Y\x86\x1b \xd5VT4\x88$\xa6\x84\
+\x09\x9ct(k\xe1\xad?\x18g|;t\xfaQ\xa8\
+\xfac!\xb4\x0f\x1bk\x22,\xf3\xa9R\x06R\xb6\xef\
+\xbd\xdc$\x85Y.};\xc8\xab\x80\xcet\x03:>\
+.\x1c\xc4&1o\xa4\xb1\x09ll\xb59\xdf\xbd\xcb\
+\x1c\xa6\xa5\xbe\xf4\x875#9\x14\xf3y\xb9\x7f\xb9\xec\
+\xca\x0bw\x8b\x5c:\xa5\xfd\xa9\x896G\xea\xb5]\xd0\
+P\x17\xf26\x86\xdd\x0cR=\x02\xe8\xfb\xb0\xdb\xeb\x18\
+\xfb9\x9e\x98\xbc\xe5\xb0\x06&=\xc9i\xa7H\x17\xe0\
+9(\xb5\x5c\x83k\x8ba xulA\x9dv\x0a\
+/\x81w\xc5\x5c\x05!ye\xc60ae_\xcd\x02\
+\xa7\xbc\xd3l\x82\xad;\x98S\xec\xab\x04\xa4\xac\xc7D\
+.\xb4\x0f\xf3\x0d\x0c1\x9b{fT\x83\xcby\xb5\x9b\
+\x0f\xcd\xb1\xe0\x00a\x93\x0b\xb0/\x05\xb7\xe0\xf7\x0f\xb8\
+r:)hK`hM\x1f\xf9\xd1]\x12\x03\x08\x92\
+0 \x07wbo9C\xd8\xa3\xb8\xb9\xcdR\xe2\xed\
+\xd04\xab!\x12\xd9\xd8\x0c\xac>c=\x0d\x9d\x1d\xf8\
+Dd\xc8\x9e\xc0\x09X\xdf\x17l\x7fx>\x04z\xa4\
+\xa4>\x0e \xa2x\xf3\x1cM\x9d\xb7\x8e\xd7j\xea\xcb\
+W#\x1c\x9cCf\xa4B\x9av*u\x8bz\x9c{\
+\x06\xb1\x08\xbd\xaa\xc7]3\xf7\xae\xd4\x90\xe9\xd4\x16a\
+\xaeww\xb0\xea\xef\xca\x81\xbc\xd2]\xe4\x12Q\x04\x18\
+G\x87\x15\x0b\xf5l2\x06\x1fKU\xe1\xde-\xa8\x17\
+\x08\xd4\xb5\xea5\xe5\xde;3\x84\x96\xdc\x06\xb9\xd5\x09\
+]\x05\xac\xbf\x17/m^\x8c\xb6L\xd8R0\x0e\x8d\
+\x0bIK\x80A\x0c\xba\xb6CjQg1`\xbd\xe6\
+\x0b\xf6\x95@*\xdcG\xc4\xf4I\x8a{\x9b>\x5c\xd1\
+\x18\xb2gBgPb\xab\xd1`RDF\xb1D\xb4\
+\xc3?\x91\xd17+\x9e\xe3\xe5\x02\xdb\xd0\xc2\xffq!\
+\x041A#\xa4\xdah\xf4\xf5YI\xc4;\xd4\xdbo\
+\x15x\xdb\x13(R\x81\x8bt\xdcL\xac+H9\xb1\
+\x09Z\x137\x81;8Zf\x03;\x8c\x97\x9c\xc7F\
+\x1e\xd1\x8c]\xd6\xd4\x82\xb1?\xca\x8e\xf1$~;\x0d\
+Qa<B\xde\xa433\x90\xc3\xe7\x87\x8dg\xf5\xc2\
+\xd8\xa3\xe4;\xc7\x1a#\xa9v\xa9\xa8CK2-k\
+\x09{\x8f\x9d\x03\x92\xfc\x96(\xec\x93\xfdz\xd5\x9e\x01\
+Jw\x0dc\xfc\xee\x18 c2\xd42\xd7\xa3\xecL\
+\x98b\x97\x93\xd4P@\x7f\x80\x8bl\xea\xe6w\x8b\xdf\
+H\xc2\x93H\xf8\xf0\xdc\xc0!s\xb1\x8eK=\xabG\
+\xe8530\xdc7\xa8\xed'\x9d\xa8_\x1a\x94'F\
+_A4$\x01|\xde\x05\xe6\xc7\xce\x153\xff\x1d\x9c\
+\x93\x82\x843\x1d\xca\x22\x1f\x1e\x0e$\x0c\xc1\x9a\xc8\xb1\
+\xd9\xa0\x9ex\xf5[\x07\xb06\x91\xab\xfc3\xc7\xf0J\
+\xa03\x06\x86\xe6\xc1%B\x86\xfe\xc2\xe2\x82\xffU\xa0\
+\xa6\x13\x80\xcc\xe9\xffn\x0e\xb2<l\xb6a\xa3\xdc\xb1\
+\xc44\xdc<\xe4z\xed0\xf8\x14\x81\xee!'R\x94\
+\x9f)\x10\xf6N-\xd0\x0e\xe2\xa2-\xc6\xd6\x99\xfd\x10\
+\x05\x1d\xd8:\x88\xe0~\xdb\xd8;\xb0v\x0a\x84 b\
+\xc5y\x07/ \xcf\xbb\xd1\xbd\x0b\x11\x04\x97dp\x0b\
+'0\xea\xdf\xc2R\x0f\xbc\x15\xcc\x81\x872\x03\xb9\xf4\
+\xe3\xdfy:\xf5i\xd1*\xd6\xad\xb1a\x0ft\x0d\xe7\
+\xbe\x1a\x9cW\xff\x0d\xa3\xc4\x9b\xfb\x90\xf5A\x9e\xb6\xda\
+\xb8\x14\xa4M\xf8\x82\x91!\xf7S\xe7\xc6 N\xed\x19\
+\x83\xdb`\xf6\xc0\xa2\x22H\xf5\xfc\x9e\x17\xb2W\x1d\xee\
+\xb2\xa7\xc1SqP\x14DBy>\xa8\xfc\x07#\xe9\
+\x91\xccp+r\xa8\x8c#\xed\xfd\xc7\xd87\xa4t\x8e\
+\xeb&\xe2Y\xe7\xf3G\xaee\x0c=\xf8:\xe6\x8a\xf0\
+v\x15\x16tL\xf8l\xa5\x0bJD\xa8qb\xfa;\
+\xfb\x01\x84Ee6\x83\xa0\x0aEx&\xfe\x82\xa8*\
+AC\x9d\x08e\xfc\x8f\x05HW\x87:\x90\xb8\xbbt\
+\x0av\x1d\x8f\x04\xbb\x8c\x00\xaekuD\xb7\xb6\xf1A\
+\xb5\xed9y\xce\x9cB)\xe4\xd1\x17-\xf5\xfaT\xf1\
+\xd4;,f\x8f\x19\xac\xb4U\xf9\xa5N\xa41\xa3\xac\
+\x99\xdb\x0a]g\xa8\xc4j\xde\xeb\x01\xf3\xd8\xa8ci\
+\x22\xc4\xf1\x14\xc5ney(\x16\x00Ca(\xbfd\
+\xf4\x05\xae,\xc2\x07\x8f\x1fkHn\xf1\x88+\x0fB\
+\x94SO\xff\x1b)h8\x9e\xad\x93s\x18\x11`;\
+\x0f\xc91>\xec\xcb3\x0b\xbf\xeap\x88\xc4\xffh\xd1\
+\xb4\xad\xb9\xb9\xa6\x9dn\x87*\xaa\xa2\xa7\x1a\xb3\xa3\xbc\
+\x06\x1e\xb1\x05575\x99\x95\x8d\xe1G\x9b\x1c\x87j\
+\x8ca,)~4\xe1b\xabl@4\x1ed%\xab\
+\xc0C\xdb5\xc2:p\xba\x10\x95\xd2\x93\x9563\xb4\
+X!\xfc\xa7\xda\xdeA\xcf0mc\x81b\xae\x9cr\
+\xb7\x85\x98a\x1f\xbaF\x86\x00\x97.\x0f*l_z\
+\xe8\xd5\x83\x05\xf1\xf44\x82Z{\xd9\xcc\x82\xfa \xae\
+\x1e\x9f\x93Uw\xac\xdc\xb5\x90'H{\xfc\xf4\xe9\xf3\
+\xef\xb8\xad\xe77\x84JH4\x91?l{-\xcf\x19\
+R3\x91\xa1)\x91\x17\x7f\x1d\xd2\xf7\x80jl\xcc$\
+\xb7\x8f\xbd\xb8\x98\x9d\x1e(\x00(\xf3\xe4\xef\x8d\xbd\xae\
+\xd4\xff\x92\xc3$Lx\xec\x12\xe5D\xc8\x9c\xe9\x06P\
+\xbe\x0f\x86@\x04\xf7\xb6\xdaq\x1e\x0f``\x0f\xe7\x22\
+\xa4o\x9a~\xe8Z:\xb4f\xc8\x98z\x88\x8e\xb9\xf6\
+5\xcbA\xfe\xf7|\x08\x9eXn\x1e\xd8Z:\xd7\xaa\
+4\xd0qL&\xd1\xa5O\x1f\xc45\xa9\xf7k\x97\xd6\
+2[\xe0\x9f\xd0$iD\xad\xc8\x9c1\x05\xdd\xd6\xb8\
+\x84\x83\xaf\x10\x83^\x92\xd2\x10A\x1cr\xec8X\x12\
+\xb2A\xc4\x05\xe1\x9a\xaehu\x04\x94\x8dS\x8e\x97\x0b\
+\xf7\x16\xae\xb8\x94>\xbbnYW#\x12K$M\xe0\
+43\x0c\xe8\xf0\x9d\xf6\xfc\x89\x8d\x85\xcd\x0f\xae\xb4\x93\
+\xd7q\x14Ko9\xc3\xf9T\x1e\xcb\x92H\xc3\xf98\
+B\xe2\xd6\xce&\xeez\xf3H\xf2\xfd\x7fL\x19z\xb6\
+g\xcdF{!~\x0e\xc36\x157\xe7\x9bJ\x89\x12\
+%z\xf3V-@\x036g\xdbet\x05\
+\x00\x00\x10\x96\
+(\
+\xb5/\xfd`&\x8ae\x84\x00*CP\x0c'\xe0\xb2\
+\xb8\x01$\x0ey:\x93$\x83\x9f\xfd\x08\xdb\xc0C\x89\
+J\x0d\xbb\x85.\x84\xeb\x10\x86\xfd\x09\xe1\x0eH\x05b\
+\x8cq\xc3\xcc\x0b\xbf\x00\xb7\x00\xbd\x00\xaf\xef@\xb6_\
+\xdc\x91\xf2\xe3\x80\x0a\x18\x80\xafe>\xa7[\x13\x15}\
+\xba\x0b\xf5\x99\x8fA\x1b\xd4\xd9.\xc2_e4\x08\x12\
+&\x14\xa7K\xa3|\x9f\xfa\x1aWR\x14\xc8_\xb3F\
+\xb3JT\x8cH\xa8_\x10\xffP\xd9N\xa6*L\xc6\
+\x82\x99\x164\x9cL\x06\xe1-\xb4T\xf2\xa34\x08\x18\
+K\xc5\xb5\xf3\xbc\x16\xae\xdcL\x0c\x14\x86\x06\xce\xc6\x82\
+\xa9\x5c.\x16\x81\xe81t\x19q\xa6\xca\xa4\xa1\x08\xbc\
+\xd6\xfc1\x8fK\xadm.\xf6X\xa3bd+\x88^\
++\xe8\x8eQ1\x22Q\xdb\x0c\xa7\xe6\x98f\xbc\xedM\
+-\x0c\x99\xd2\xfd\xbew\xab\x19{\xcd6\xa1(QX\
+\xf3{\x1a\xb7\x02\x80\x83\x82\xa8\xaa&\x04\x05\x8a@D\
+\xbdC\xbf\x9cG3\x8c\x0a\x0e\x02\xfe\xd7\xc5\xe4\xc7\xe0\
+~'\xd4\x0d\xb4\x9c\x91\xed\x84\x98\x97\xfe\x94\x96B\xe7\
+\x02\xf2\x7fu\x0b\xc2R\x83Wh\xdd4e$\xca\x96\
+\x99\xa2\x06\x0b\xc5\x82\xb0m\xb4\xd2z%\xbe}N\xad\
+r~j\xe16\x11\xd5\xce\x93\xa5\xc7\x0d\xbf;\xe8?\
+\xdb/K\x93\xdb\xc2\xc9\x13c\xa1\xa4\xc6O\x7f\xf3\xa0\
+[ 7\xdb=Q\xf3w\xd8\xa9\xcd\xd9\xef\xdc\x8e\x94\
+\xfbq\xd2\x09\xb9u\xb5FQ.~\xcdT$\xb5\xcb\
+=\x94%\xe4\x95\xc7\xb5\x9f\x85\x8a\x91\xd9\xfb\x1ae\xeb\
+\xcf\x0d\xae\xa5\x11Re\xa2B\xa6o\xa2\x8d\xb2\xbdV\
+R\x9b:/\x22c\xfc\xf4,\x9c\x1f\x8c\xf7\xb3\x11\x04\
+`\x1d\x0d\xa0^<;\x9dW\x0b\xba\xcf\x83\xeb\x0f<\
+\x02\xd1?~l\x1e\x97s*&\xaf\xd5\xb6F\x8a\xb2\
+\x14#\xe3\x22)\xe3.\x95F\x81\xa3\x89, N=\
+\x86\x17\x13\x17\xfd\x9f\x14e{1\xa0\x84\xbcr\xab\xf2\
+h\x8ex\xadY\xe6.\xfa\xdcL\x12e\xe3\x08\x90\x02\
+\x12\xf6\xb9D\xd4\xa2\xc7\x0d\x09s\xa8\xccqZoF\
+) d0\x96\xcbGj\x1e\xad\xfd\xce\xde\x8bj\x8c\
+\xa1\xba\x19\xda\xb9\xd1\x0a\xf3\xa7\xf8\xb52m\x82\xb3\x10\
+\xf1\xfaz\xa1.H\xe4\xc5\x9f\xa8\xef \xf9\x95 \xff\
+*\xb3y<>\xa18i\x0ay\xd5\x1c\xadNg~\
+\x08,\x88g\xfcX\x07\x14\xf9\x1dV\x84/\x9a\x15R\
+\xcc\xd0bD\x17\xb5\xa85\xc8_\xa5\xb2\xb5o\xa2f\
+\xe82n\xe1k\xfdPQ\xa4\x95\xee+@\x18#o\
+\x1f\xb2zz\xf71)5\x0a\x10H\x97\x894\x91\x06\
+,\xec#\xff%\xf7\xad\x06-\xd8\x11\xb8L\x87\x14\x19\
+cL\xa6r(;'\xc3x\xd9\x8f\x0bif\x89\xfa\
+\xb9\xf0ll\x9b\xe97T\x18DS\xc8\xa3\x16\xb5m\
+\xdb]\x08l\x9fL\xf9,Q\xd2\xef\xd3}\x90\xbf\xfd\
+\xbe\xb0\x91$\x0b\xc2\xf3\xd2\xc7\x8f\xb5\xd6\x99\x06}\x01\
+N9\x99\xf4F\x7f\xbd\x12\xaa\xf7\x1f\xe4\xcf%\xd9\xf7\
+L\x8a:\xce\xc9f\xefx*\xa1$\xd6\x0c-\x96N\
+\xea\xe7j}k\xf7\xa7:\xf4H+\xc2\xd2A\xcd\xde\
+\xdb\xbdZ[oDq\xd2\xa5\xa2aP\xd0\x5c&I\
+e\xdb,\x9d+\x1dJ\x12\xb5R+\x90\xfes!\xf3\
+7\x86\x16\xa8s\xfd\xc8\xd4\x98HR\x94$\xcb\x01\xe3\
+@\x10\x0c\x10\x1b\xabR\x86\xf3H\x95\xf5\x01S\xa0\xc0\
+P\x90\x18\x1a\x85\x05\xc1$8\x0c\x04\x0da0\x04\xc1\
+\x18N\x82 \x08\xce\x08\x08CD\x9asCv \xf1\
+\xac\x1a\xbe\xeb\x96F\xc1sF\x86r|D\xdcx\x5c\
+\xa8V\x86\xcdw>\x95\x01\xc6\x17\xe5\x09\xb5\xac\x12^\
+\x95\xbc\xeb\x13\x9dVvV\x170\xc3\xdal\xa1\x96\xe1\
+\x17\xaf\xdcL\x83\xa2\xf0)\xf6\xa0\xd9\x86\xdaT\x0d\xa1\
+\x8c\x15\xe2\xde\xfaq\xd8\x9c'\x9b\xf0p#\xfbEl\
+\xce\x1a\x81\x90O\xcb\x8fN\xb0\x94$\x9f\x90\x80\xfct\
+\x86\xf7\xc4#\x12\xcf\xab\xf3\x0dUf\x80n0*\xdb\
+\x04F\xadK\xf6<\xea%n\x92\xdc\xe1\x98y\xb1\xb6\
+X\x97\xea\xc0p\xc0~~da\xe0\xca\xa0k1\x1d\
+\xcf\x06\xab\x13]\x92(\x09(\xc8\xbe\xa0\x96\xda\xba]\
+\xd0\xbf\xfeh\xa8{\x13M\x0cZ\xfcXq\xf2\xb7\xfd\
+d\x1a\xd4\x85)\x9fU\x8c\xb9\x9a\xce\xd3\x0f\xb0\xb6\xf1\
+\x184\x19\x87\x81\x8d\x8b\x06&\xa7\xf5\xbcA:\xd2D\
+\xa0/\x22&[\xaf\x22\xe2Z\xd2\x8e\xc0\x99RhA\
+\xc4\xb8\xf1c\x86\xc9[c\xd7\xf6.t'\x83\x0c\x17\
+\x11\x1e\xebS\x19\x5c\x1e`\xac\xac,\xee=\xc4\xf1L\
+P\xbf\x978P'\x01\x93\xf6@k\x9e\xa9\x08\xc8\x0a\
+]\xb6\xa5\xc5\x09\x8et\xaaV\x0f\xeb\xcch\x81\xa4\xe4\
+D\x9e\xe2\xcd\x94\xc2\x0b\xa8\x9d\x5c\xe1\x90\xb9\xa0A=\
+\x11(W\x956\xcc\xca8d^j\x89\x1dI&\xe2\
+\x1d\xf0\xa7\x9e1\x22\x9f*\xa1\xde\xa7I\x9b\x22\x8a'\
+\xc0\xb1\x0aC\xbc\x1aW\xaa\x92\xbe\xedm`\x8bN\xcc\
+0\xd4\xfa\xd15\x8b\x96\xf3\xf9&\x89\xf0TyO\xa9\
+x\xd1\xc6\xe1\xe7\x01A\xf5B\xbcq0\x11\x14Y\xd7\
+\x9e\xc5\xf9\x9c\xe7\xef\xa6\xb3m\xff\x89\x14\xee\xa0\x82\xe7\
+w\xb0hC\x8a$\xbc\xfdt\xf1\xd5\x0fV\x11\xad\xa8\
+\x87Jy\x86R\xa2\xab\x14(:\x91\xc7w+\x080\
+K\x94d+f\xcaZ\x87\xe6U\xea\x0dl\xb89g\
+\x13\xb3\xdc\x5c\x17\xf9_\xa6\xf1\x0e\xd6\x8e\x93\xc9b\x0a\
+\x93\xc9\x0b*\xf2\x18M\xa4\xa9\xc4\xa1@\x12\x06\xa1\x8d\
+\xcf,\x81KL2\x1e\xc8@\xef\xc3\xa9\xa9\x92\xe0\xb7\
+\xe9\xf5\x8e\xc9\xf3\xd9\x7f\x8bV\xe2\xe4\x94\x14\x99|\xdc\
+\xee\x88x\x04\x0d%\xd5\x03\xff\xbf\x1f\x16\xda\x8c\xd5\xdc\
+\xd3\x86\xb3\xc4\xf6&GN>\xd4X\xc2\xaa\x97rl\
+k\x90Ch\xe8^\x90u<\x1f\x98e]$\xa4\xdb\
+|\x7fD$\x84\xd5}\x97\x90\x17\x17?{.\xc8\xdf\
+\xa1\x84\xb3_\xbcdA\xa5Y\xffT\xbc\xf3\xbd#\xf2\
+\x02\xd2\xcb\xd9\xdf\x08\x87a\x22\xbauq\xea\x0f\xb4\xaf\
+6U\x9c$\x13[#\xb0\x0b\xffK\xdd\x14\x83W\x04\
+Z\x7f\x05\xb3U\x8e\x03\xbd\xbe\x94\xda\xe7\x5c\xdd\xeb\x01\
+\xf4\xec\x01\x9d\xeebE\x86{\xd0y\xd7\x81\xf9\x15\xb0\
++\xd1\x8f\x93\x14\xb4\xc8\xecQ\xe1\x14\xca\xfc\xdc5\x1a\
+1s$\xc8\xc9\x09N\x8e\xbf\xc4\xdb\xda\xd1o\x1aL\
+T\xef(\xbaYW\xf1\x97ME\xf2\x8dW\x87\xdd\xf9\
+\xcc\xcf\xdd\x0b+\xf4\xdb\xe8\xa1\xa7\x00\xfd^\xb1\xd3\xf4\
+\xbc\xbds\x92\xcc\xa515\xe8p\x95R\xd4st)\
+\xed\xfe\xe2\xbej\xc8\x9f=\xea\xf8h\xae\xcd\xb3\xa9\x03\
+\xe8;5Y'%\x9c\xb3'K\x0eV/\xb4\x89\xe8\
+{u+\x0dN\x1aY\x06We\x1f_AwY\x8a\
+\x02\xc1\xc2o\xcb\xd3?\xbc&Fd,\xc1\x88=g\
+e\xc0\xc9\x82\x88\xc9\xe4\x92%\xaeu\xa7\xe0\xae\x10l\
+\x91\x1btdt\xdcCf\x1c\x01\xe7f\xc97\xcfn\
+\xc5\xab\xe3\xc6Q\x8b\xc5-\xfd\xd56\xec\xa2\xb6e\xf5\
+/\x82N\xda,bG\x12K\xc0\xf5\xe6\x0e\xfa\x06z\
+\xfa\xe4\x91:\x917d\xd5\xf5Nm\xe2w\xf8~-\
+\x19s\x06\xcb\x95!\x06t\xcbml'\x8f\xe1P\x88\
+\xce:\xd4\xe7sMZ\xda:\xb2\x1f\x84+\xdc\x9a\xc6\
+\x80\xb1\x05\xb7\xc4\xa3:\xe2\xe6o\x16\xa5)KN\xad\
+bu\x83\x8b\x9ah*L\xce\x09\x93iK\x13!\xa7\
+K\x11g|F\xf4\xf9G\xd8B\xf6\x16\xf1\xb5\x05\x13\
+\xd2.Cc\x0a\x1fd\xf7@DFQ\x9b\x8d\x15\x15\
+\x95Z\xee\xa2\xa0\x9f\x0e#\x8f\x1d\x0a\xa42`\xcfU\
+\xdf\xf5\x15\x0aF\xc4\xa0\xe0\x16B\x05\x05\x0c\x88\x05\x99\
+\xa4\xac\x90\xac\x14\x05\xf6\xbb\xbd\x0a({[\x8e\xf6\x09\
+\xfe\xb2\x11\xefZm\x04\xa5\x8f\x0e\xc9G\x0d\xd87\x09\
+\xf7Y!\xd4b2\x03k\xcc;H\xed=\x9b\x08h\
+\x91/\x91\xb1_,<\xad\xb2S1\x85\xcdw\xf7\x13\
+\xba\xae\x5cC\xd4\xd5\xa1@i\x0a\xc8\xb5eK\x0c\xa6\
+\xd3+\xd7\xee\xd8\x89\x85N&\xafp\x95vMn\xce\
+*7\x03\xe0='\xd3\xfc\xa5Eu\x0d\xf1Sk\x83\
+\xb1.A\xab\xcb{\xf0.O{\xb6oe\x96`8\
+\x96\x03G\x0dz\x18\x82\x1fX\xbe\xc5\x98^U\xf2\x9d\
+\xf1p\x8fr\xa9\x93E=\x88\x1d\x80\xbfD\xc0\xe9\x84\
+\x17\xb2\xac1\x12' \x5c\xf6\xe4\x05s\xbes\xb3r\
+5\xa3Q>\x02\x88\xe4J9\xbd{\xb9|<\x94<\
+\xf9%\xf9\xea\xbd\xc9\x9bD\x17n\x83\x86\xc4\xd5\x85s\
+\xaf9B\x15b\x96%\xdep\xd5\xf8B\x1d\xc7\xd0a\
+s\x1f\x9b\x5c_\x07T\xe3@\xdb\x97W\xe1\x1c\x18\xcd\
+\xfa\xec\xafFmq\xe06\x1eZ\xd8\xab\x8e\xdbK\xb5\
+\xde\xbc3P\xed$>\x96#O\xb87}\xb2h\x84\
+G|\xa6\x9e\x8e\xd7r\xdc6\xc7\xa4w\x0e:&\xc1\
+|*~\xae\x08Y\x01?oh\xd3\x86p\xc3\xa4\x0d\
+ff)\x90\xdd\xf0\x94n\x01\x99\xfa\xb7_\x9c\xaa(\
+uu\x85k\x94\xb4G\x85\xc5\x8d\xcc\x81JK\x08d\
+P\xa3\xf9\x17\x888\xe7\x0eAL\xc1Hs\xcf\xdf\xd4\
+O\xf0\x19\xcaq\xfa\x88=\xfd\x1b@>\x0a\xe6F\x17\
+GC`}nB2m\x9b\xfcJ\x0f2\xc8T\x88\
+\xc3\xf6B\x9dg+,\x83\x8b\xb2\xd7,\x0a\xd4\x85|\
+\x9a\xe2\xda*H\xedF'I\xb0k\xb7t\x81\xd1$\
+R\x9c\xa1\x15&d'()4t\xae|\x9f\xcb&\
+d\xe1$\xf2x\xf8/;84\xc4y4\x19\xf1\x0e\
+=Nl\xe6\xcee&\xe5}\x81\xa5Gc\x04j\x8e\
+\xc1\x97\x15\xfc\xae\xf8`\x0b\xb9\xeb\x1f\xfc\x050\xa8\x8e\
+\xba~\xf3r\xab\xd56\xf5\xe4\xd3\xe7WP\x8cb\xe2\
+\xebj\x09-\xa0\x0d\xeb\x8a5\x0c\xbe\xe0\x03\xe1\xc3\xe1\
+y\xc3\x18/\xee\x12\xdf\xfe\xd6\xbd\x1e@op3\xec\
+AeD\xbdF\x87<\x94\x07>\xcc\xc8\xe6\xe8\x0f\xd0\
+\xf3{\xf5\xa6\xaee\xdc\xf0gX0\xaa\xa1\x81\xb0f\
+\x13I\x11\xdd\xf8og3\x1b\xcc/\x0b\xc7\xe7L\xbc\
+J\x03 \xe2\x02\xd1[l}\x9e\xdbw'HW\xa2\
+\xf0#\x0e\x05\x9eE\x19\xee\x922(q3}\x22\x19\
+\xf3M\x81\xe8\x17^o\xf4\x9fi`(\xe9\x90U\xc9\
+\x01I\xcd\x01\xc1l\x92\x90\xd6u\x07T\xf9\xf8\x01\xc8\
+S\xe2\x22r\xe4H0m\x06\x8dqT\x98\xc4\xa3%\
+\x04\xd3p'$;\x12\x87B}A\xc2h\x8c?\xba\
+\x9f\x06\xc1\x8a\xa4\xeb\xf6D\x09\x9fL\xd0R@{\xd5\
+\x19\x1dDa\x19t\x1b)E\xd8\xa7\x93\xb5L\x81D\
+\xf0\xc2\xb8\x88\x1a~\x80\x0e\x00V]>=Gi#\
+\xfbq\x83_\x97\xba\xa3=.\x8e%d\x18/&\xb7\
+\xa6\xc0:=\x02\xe6\xcc\xae\xb3\xdd\xb13<\xfd\x09\xdc\
+\xb4\xdel\xc5\xe2\xb0Ex\xd9\xb4wP\x12]\x80\x81\
+Qwf\xb2\xfe\xde\x8e\x99@\x00\xb4\x8f\x80W\xb8\xc0\
+~\x1fC=]\xf6+\xd8\xa8^\xb1c\x89\x90\xa9\x10\
+\xdd\x00+d\x1c\xde\xde\x02\x82\xb6\xe3\x10\xecZ\x0e\x00\
+t\xaa\xe1\x05\x86\xe3-C3\xdaGYB}~h\
+Oz\x0dJh\x81QP\xd0m\xa5#\xe0\xa6\xc7#\
+\x9bT\xf09\xa9\x9c\x93\x898\xb9\x939\xcd;\xcb[\
+k\xe0\xcb\x8eDf\xf5L\xb3E\x06i\x13\xf9\xb1\xd3\
+\xafsBj\xfb\xdeyn\x0fV\x8c9\xb3\xe5\xbb=\
+\x8c\xa4\x96\x9f\x99\xb8}k\xba\x17\x95\x0d\x89D\x221\
+\x83o\xeeL\x19\x1c\xb0\xe7G3j;tQ\x14\xaa\
+v\xb1\x10\xf7\xc3?\x15%\x97\xd14o)Q\xd9\xdb\
+>mha\x8d\xbb\xdf\xce'\xd5\xeb\xa4<`\xe1\xed\
+\x90\x88l\xa9z\x13\x8f@`\xa3\xab\x8d\xf7\xd6I6\
+\xa4J')`\x9d\xac\x5c\x91\xad\x80\xcb\xd8\xf0\xac\x91\
+q]\x91RS\xde?\x15\xf1\xdaCE\x92\x8b\x14*\
+\x0e7\x1e\xbe?P\xc7\x06\xae\xc7\xbc\xee@\xa3\xe6\xdd\
+\xf8\x98\xfd\xb6a\x83\xeam\xe2:\xbbAW`kH\
+\xe8\x01C$\x9bgA\xdem\x92\x82\x9fR\x09a\x80\
+\x06\xa1dq\xdbAJg\x01!B\x8a~\x03\x85\x99\
+\xde\x11\xb1\x08~o\xa8I\xc0\xa8H\xaa\x94\xee\x01k\
+a~\xf0bm\x01f\xffG\x0d\x18J\xe7L+W\
+\x0e\xc7b\x88Y\xd7\xff\x87\x86\x08\xe8\xf4\xf9\x03\x0en\
+\x1aT`>P#\xe4<\xe3ws\x1d\x18Q\x084\
+\xd8\x9b\xad\xa7\xe1\xc9\x7f!\x80m[[\x03\x09\xe1@\
+\xcf\xb2\x16E\x14\x0a\x19\xe3\x94!M{\xc53\x96\x80\
+\x0a\xc7&\x00\x82\xb1\xe8+ <\x98m\x7f6\x8c\x90\
+\x08\xef\x0e\x8a\xca\x04#\x9a\x99\xa8&\x8f\xe5\xba\x0d\x9e\
+\xaaw+V\x0c\x0b\x95\x0b\xb48)\x12\xbf7\xc5\x1f\
+\xc1\xc2\xd3\xd8>q\xf1\xe4\xb8T\x7f\xf9\x16)B8\
+\xe7\xdb\xfe\xd4\xb8\x8b\x03UW\xf6\x81\x99\x90\x09\xa7\xc8\
+\x0aO[\xe1\xebHHbb\x90\xe5\xed\xad4}\xf1\
+\x11P\xac\x19\x9d\x8c\xd2f\xadt\xd24\xc4\xe5J\xb9\
+*\x8f\xf4\xf5\xfdg\x03`T%\xbc/\xa5\xa8m|\
+\xa44A\x06O\xe0\xb9\xc3Q\x8bP\xabyf\xeb\xfd\
+\x1a\x1f\x09\xa4f>\xe2\x08\xdf\x9487\xeb\xd3\x8a\xe6\
+P\xbe\x13:c\x86E\xa3\xb0A9u&Z\xc4\x0f\
+\xf2\xd4\x9ewW\xd8\xbd3\xc3Zs\xd1_\xdc\x07\x85\
+F,\x11R!\x16\x19\x9d3\x0e\x0f\x85B\xf2I\xdf\
+\xdeo\x22\xe2\xce?q\x053qU\xe0\xf8L\xc35\
+\xec\xd0J\xb8\x17\x8c\xc9\xcd\x80\x18\x13 \xc9q\xd1\x06\
+\xc2h\x95w\x1a)\xbe\xce\x5c\xc6\xf8\x0d5SF#\
+a4\x0e_\x8cL<\x8ei\xf3\xab\x87\x93z\xc1\xab\
+I\xa2\x07\xc6)\x8b\x9d\x99\x9e\xa2\x0e/\x8f\xf4\x8d\xa5\
+8\x1b\x03\xe2HM,Qj\x07\xe3\xe9\xc9\x9e\xc1X\
+\xb7\xa4\x8d\x91\xdc\x1f\x00Jd\xa0\xf2\xb8\xf7\xae\x93\x9c\
+2\x9f\x93\x8a\xc6\x19\xf4\x06\xe0H\xa6\x11\xb7\x1b\xf9[\
+K\x10\xcc\xbe^V\x0b\xa6\x90\x99\xac\xe3(\xc2*L\
+\xbd\xea\x07\x14\xdd7\x00\xf9\xd7*4d\xee\x94\x839\
+Y\x11\xdf\xd5\xd0\xf6\xe6\x04]\xc5\xf6WL{vZ\
+O\xfd\xb6\x1b\xfbP<\x89\xee\x9b\x81\xcf\xd77\x07\xd9\
+\xd0l\xbc\x7f\xaeP\xe9\x18\xd7\x03\xa9\x99cV\x0dW\
+D\x94\xb16\xf4\x0e\x9c\x10\x02\xaaW\x10S\x1e\xaf\xd7\
+2\x87\xa0kn\xfe\x945\x1c\xc4\x01i\x191\x90\x06\
+G\xe1\x05!1\xe6\xf2F\xb3\x1fOpz\x187\x12\
+q\xf7\x12A\x1e\xd0\xe0;\xf0\xa8X&\xb3\x02\x19\xac\
+\x14p\xbf\x0b\x82\x00C\xb5\xd8\xfc\xffBw\xff\x87\xc0\
+\xd5\xa5\x1b\xd3\xf6C\xdb\xc4`b5\x1f_\x829Y\
+\x15@\x97}lT\x1d?v1\xb7\x1c \x19UF\
+\xdf\x85\xee\x92yO\x8bP'\xab>\x05\x07\xc4\xcc\xd8\
+l\xc0@x=\x7f1\x8a;=\xa3{*d+V\
+\xb4H\x10\xb6\xfd,\x84\x09\xa1j`\xdd_\xe2Gw\
+\x0f\xb0:,\xeb\xea\xc2`\xd4\xfe\x0d\x0fC\xef0 \
+\xed\xecl\xee\x87\xc0\x15$\x86[\xe61\xca\xf7>\x92\
+\x1e\x9c\xf6c\x85\x11\xaa\xc11\xf2^\x0c\xb0_\xd6p\
+\xa4\x9b\xb1\x98]\x11\x9fVm\xc6\xf3\x8c\x1d\xf9\x0e\x8e\
+\xea\xf6\xee\x11\x7f\xcd\xc6\xbaY*;\xf5\x81\xba8\x86\
+\xbd\xb3\x0e\x11\x1e*\x15\x01\xaa\x1b)\xb4\xe7\xe4\x5c\x04\
+\xab\xd9\x01\xdb\xa7\xe6\xee~0\x00\xc4\xcbG(V\x9c\
+\xd3q\xd0\x1d.\x11\x11.\x86\xe7\xe8\x83\x88\xc8\xd8g\
+\xf8\x9f.+\xe3\x08'\x03\xcf\x09\x0b\xfa\xe8\xa2\xa4&\
+\xfd\xb8)\x9d\x82\xb3`\xae\x1f\x9d\xa9\x83\xb4\xb2\xd1a\
+\xa8\xf7\xe5L!~S\xd5@f\xb3B\xcb\xa8\xe6{\
+\x95\xb2\x0d\xbekOj\xa3m<\x01\x803\xd1*\xf9\
+\xd5X\xdfh\x01\xe7\x1eV|$h\xd4\x1c\x87\x98u\
+\xca\x13\xdcv\xe8O\xdc\x0f\xfa[\x16\xaa\xdf\xa8\xf0\x01\
+s&g\x1a~\xc8\xb9\xc3\x04\xb1\x8a\xb0\x8b\xa1\xcaA\
+\xfc\xd9\x91\x11M\x1b\x9a\xda.\x1c\x1at&\x17\xa0C\
+TS\xc9\x98\xf8\x88\xeb\xda\x18`\xbbH\xad\xe6\xc7!\
+\x0c3\x98\xc8\xd8\xf7M\xccci\x03\x10\xc9\xc1|\xd4\
+T\xc1\xd0FA\x98S\x98.\x84\xa2\xe8\xe3j\xfb\x1e\
+b]7\xf1k\xb6lh\xb9\x95j1<u\xa7x\
+\x82\xae\xf5\xd7}\x7f\x9b\xc5\xd2\xfe\x8eW\x0d$\xd6\xc6\
+\xb9\xffi\xfe\xab\xa6yK\xfc\xf2\xffR)d\x9d\x00\
+n\xac\x0c\xf7\x93\x1c\x13A'\x05;\xae\xf0T\xd2{\
+$>\x88\xd84\xfa\xd5i\x1eP.}\xb9\xe6\xea\x88\
+\xfb\x99\x16\x93\x0c\xe7\xcd\xe9Bu(U\x02\x1a4\xc3\
+\x92\x8aO\xc5W\x0c\x9c\x0c+$Sf\xf0\x07C\x1b\
+\xa6\x1c\xff\xd2KR\x82\xef<\x12\xe4\xaa0KL6\
+\xa2\xfd\x04\x86\xa4\x01\xfba\xf97\x95\xf3\x1a\xf8\xb8A\
+\x84\x06\xa21\x8aJ:\x87\xd5\x0c\xc6\xd2u\xe9\xd8e\
+\xdf\xc2\x0cT\xb6\xdf\x10L\xb0\xd2\xcf\x87\xcec\xa8\xb8\
+\x83\x8b\xc7\xbc\x0f\xe5\xd2\x92:T11\x96\xd2\xfaV\
+L\xfe7\xf3\xf3\xd9\x99\x9e\x89\xb20\x9e\xb0\x93\xd5\x11\
+\x81\xda\x93L\x0a\x97X\x8f\xe1U[\x8f\x9c\x94\xd3\x13\
+\x12\x1e\xdd\x80\x95\xa8\x13\x81\xca\xf1\x94\x98r\x09h\xe1\
+\xaa\x94\xfaL\xb3\xb6\x9dJ\x22\xa1\x94E6;Lk\
+P\xc5w\xb8G\x16\x13\xb0\x87\xbf\xe3`\x93f8'\
+\xbeA^EI,\x00\x1e\x0eB\x0fk\xdb\x1c\xc0`\
+#Z\x12\xf5\x01O\xe6\xa48{[\xf4\xd0^\xdd\xe2\
+\x8f\xe4\xca!\x9e\xee\x12\xa5\x1bt0\xb7*\x15j\xb4\
+9\xdb\xce\xae+\
+\x00\x00\x00\xb9\
+/\
+* link-color:  *\
+/\x0aQWidget{font-s\
+ize:50px}QLabel#\
+title_label{colo\
+r:blue}QLabel#de\
+scription_label{\
+color:rgb(0,0,50\
+)}QPushButton#pa\
+ss_button{color:\
+green}QPushButto\
+n#fail_button{co\
+lor:red}\
 \x00\x00\x0a\xb4\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
@@ -2216,36 +3297,34 @@ gy\xa2\x0e\xa6o\xba\xbb\xf7\xb8\x11\xaft\x98\x184\
 \x90\x1f\xfcp\xd0\xc4\x0e\xaf\x8c\x18\xd7\xff\x9eM\xe9\x07\
 \xfd\xe7\xb7\xfe\xff\x01\xab\x9dl\xe3!\xd6\x86#\x00\x00\
 \x00\x00IEND\xaeB`\x82\
-\x00\x00\x00\x1c\
+\x00\x00\x00\x19\
 /\
-*\x0d\x0aNo style appl\
-ied.\x0d\x0a */\x0d\x0a\
-\x00\x00\x01r\
+*\x0aNo style appli\
+ed.\x0a */\x0a\
+\x00\x00\x01X\
 /\
-*\x0d\x0aDefault style\
-.\x0d\x0a */\x0d\x0a\x0d\x0a/* Def\
-ault for all wid\
-gets */\x0d\x0aQWidget\
- {\x0d\x0a    font-siz\
-e: 50px;\x0d\x0a}\x0d\x0a\x0d\x0aQ\
-Label#title_labe\
-l {\x0d\x0a    color: \
-blue;\x0d\x0a}\x0d\x0a\x0d\x0aQLab\
-el#description_l\
-abel {\x0d\x0a    colo\
-r: rgb(0, 0, 50)\
-;\x0d\x0a}\x0d\x0a\x0d\x0aQPushBut\
-ton#pass_button \
-{\x0d\x0a    color : g\
-reen;\x0d\x0a    /*bac\
-kground-color : \
-gray;*/\x0d\x0a}\x0d\x0a\x0d\x0aQP\
-ushButton#fail_b\
-utton {\x0d\x0a    col\
-or : red;\x0d\x0a    /\
-*background-colo\
-r : green;*/\x0d\x0a}\x0d\
-\x0a\
+*\x0aDefault style.\
+\x0a */\x0a\x0a/* Default\
+ for all widgets\
+ */\x0aQWidget {\x0a  \
+  font-size: 50p\
+x;\x0a}\x0a\x0aQLabel#tit\
+le_label {\x0a    c\
+olor: blue;\x0a}\x0a\x0aQ\
+Label#descriptio\
+n_label {\x0a    co\
+lor: rgb(0, 0, 5\
+0);\x0a}\x0a\x0aQPushButt\
+on#pass_button {\
+\x0a    color : gre\
+en;\x0a    /*backgr\
+ound-color : gra\
+y;*/\x0a}\x0a\x0aQPushBut\
+ton#fail_button \
+{\x0a    color : re\
+d;\x0a    /*backgro\
+und-color : gree\
+n;*/\x0a}\x0a\
 "
 
 qt_resource_name = b"\
@@ -2261,6 +3340,40 @@ qt_resource_name = b"\
 \x07\x03}\xc3\
 \x00i\
 \x00m\x00a\x00g\x00e\x00s\
+\x00\x0b\
+\x0b\x93\xa2C\
+\x00t\
+\x00h\x00e\x00m\x00e\x00_\x00p\x00a\x00c\x00k\x00s\
+\x00\x11\
+\x0e\xcey\x83\
+\x00d\
+\x00a\x00r\x00k\x00_\x00s\x00t\x00y\x00l\x00e\x00_\x000\x001\x00.\x00q\x00s\x00s\
+\
+\x00\x13\
+\x03Q\xee\xc3\
+\x00s\
+\x00y\x00s\x00t\x00e\x00m\x00_\x00s\x00t\x00y\x00l\x00e\x00_\x000\x001\x00.\x00q\
+\x00s\x00s\
+\x00\x12\
+\x03\xdd\xa3c\
+\x00l\
+\x00i\x00g\x00h\x00t\x00_\x00s\x00t\x00y\x00l\x00e\x00_\x000\x002\x00.\x00q\x00s\
+\x00s\
+\x00\x12\
+\x03\xdc\xa3c\
+\x00l\
+\x00i\x00g\x00h\x00t\x00_\x00s\x00t\x00y\x00l\x00e\x00_\x000\x001\x00.\x00q\x00s\
+\x00s\
+\x00\x11\
+\x0e\xcby\x83\
+\x00d\
+\x00a\x00r\x00k\x00_\x00s\x00t\x00y\x00l\x00e\x00_\x000\x002\x00.\x00q\x00s\x00s\
+\
+\x00\x13\
+\x03H\xee\xc3\
+\x00s\
+\x00y\x00s\x00t\x00e\x00m\x00_\x00s\x00t\x00y\x00l\x00e\x00_\x000\x002\x00.\x00q\
+\x00s\x00s\
 \x00\x0d\
 \x03a\x1d\x07\
 \x00f\
@@ -2296,30 +3409,44 @@ qt_resource_name = b"\
 "
 
 qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x91\xf8)N\x9b\
-\x00\x00\x002\x00\x02\x00\x00\x00\x06\x00\x00\x00\x06\
+\x00\x00\x01\x95\xd9\x88;\xf8\
+\x00\x00\x002\x00\x02\x00\x00\x00\x06\x00\x00\x00\x0d\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00D\x00\x02\x00\x00\x00\x06\x00\x00\x00\x07\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x16\x00\x02\x00\x00\x00\x02\x00\x00\x00\x04\
+\x00\x00\x00\x16\x00\x02\x00\x00\x00\x02\x00\x00\x00\x05\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x01\x08\x00\x00\x00\x00\x00\x01\x00\x00\x892\
-\x00\x00\x01\x91O:\xf8\x82\
-\x00\x00\x01&\x00\x00\x00\x00\x00\x01\x00\x00\x89R\
-\x00\x00\x01\x91\x92\x18\xf5\x86\
-\x00\x00\x00\xa4\x00\x00\x00\x00\x00\x01\x00\x00J#\
-\x00\x00\x01\x90\xf5 0\xe1\
-\x00\x00\x00D\x00\x00\x00\x00\x00\x01\x00\x00\x00\x5c\
-\x00\x00\x01\x90\xf5 0\xe0\
-\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x004u\
-\x00\x00\x01\x90\xf5 0\xe1\
-\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x00\x5cS\
-\x00\x00\x01\x91\x0a\xd67\x98\
-\x00\x00\x00\xc8\x00\x00\x00\x00\x00\x01\x00\x00U\xf7\
-\x00\x00\x01\x91/\x13`\xb2\
-\x00\x00\x00d\x00\x00\x00\x00\x00\x01\x00\x00\x0b\x14\
-\x00\x00\x01\x91\x0a\xd67\x98\
+\x00\x00\x02 \x00\x00\x00\x00\x00\x01\x00\x00\xcb\xd9\
+\x00\x00\x01\x95\xd9\x88;\xf8\
+\x00\x00\x02>\x00\x00\x00\x00\x00\x01\x00\x00\xcb\xf6\
+\x00\x00\x01\x95\xd9\x88;\xf8\
+\x00\x00\x010\x00\x00\x00\x00\x00\x01\x00\x00BF\
+\x00\x00\x01\xa1Ox\xedX\
+\x00\x00\x00\x88\x00\x00\x00\x00\x00\x01\x00\x00\x10\xad\
+\x00\x00\x01\xa1Ox\xedJ\
+\x00\x00\x00\xde\x00\x04\x00\x00\x00\x01\x00\x00!Z\
+\x00\x00\x01\xa1Ox\xedE\
+\x00\x00\x00\xb4\x00\x04\x00\x00\x00\x01\x00\x00\x10\xc4\
+\x00\x00\x01\xa1Ox\xedP\
+\x00\x00\x01\x08\x00\x04\x00\x00\x00\x01\x00\x001\xac\
+\x00\x00\x01\xa1Ox\xedW\
+\x00\x00\x00`\x00\x04\x00\x00\x00\x01\x00\x00\x00V\
+\x00\x00\x01\xa1Ox\xedJ\
+\x00\x00\x01\xbc\x00\x00\x00\x00\x00\x01\x00\x00\x8c\xca\
+\x00\x00\x01\x95\xd9\x88;\xf8\
+\x00\x00\x01\x5c\x00\x00\x00\x00\x00\x01\x00\x00C\x03\
+\x00\x00\x01\x95\xd9\x88;\xf8\
+\x00\x00\x01\x9c\x00\x00\x00\x00\x00\x01\x00\x00w\x1c\
+\x00\x00\x01\x95\xd9\x88;\xf8\
+\x00\x00\x02\x00\x00\x00\x00\x00\x00\x01\x00\x00\x9e\xfa\
+\x00\x00\x01\x95\xd9\x88;\xf8\
+\x00\x00\x01\xe0\x00\x00\x00\x00\x00\x01\x00\x00\x98\x9e\
+\x00\x00\x01\x95\xd9\x88;\xf8\
+\x00\x00\x01|\x00\x00\x00\x00\x00\x01\x00\x00M\xbb\
+\x00\x00\x01\x95\xd9\x88;\xf8\
 "
 
 def qInitResources():
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'timeout.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QHBoxLayout, QProgressBar, QPushButton,
+    QSizePolicy, QWidget)
+from .. import resources
+
+class Ui_Timeout(object):
+    def setupUi(self, Timeout):
+        if not Timeout.objectName():
+            Timeout.setObjectName(u"Timeout")
+        Timeout.resize(679, 60)
+        self.timeout_h_layout = QHBoxLayout(Timeout)
+        self.timeout_h_layout.setObjectName(u"timeout_h_layout")
+        self.timeout_h_layout.setContentsMargins(0, 0, 0, 0)
+        self.timeout_progress_bar = QProgressBar(Timeout)
+        self.timeout_progress_bar.setObjectName(u"timeout_progress_bar")
+        self.timeout_progress_bar.setSizeIncrement(QSize(0, 0))
+        self.timeout_progress_bar.setBaseSize(QSize(0, 0))
+        font = QFont()
+        font.setFamilies([u"Arial"])
+        font.setPointSize(20)
+        font.setBold(False)
+        font.setKerning(True)
+        self.timeout_progress_bar.setFont(font)
+        self.timeout_progress_bar.setValue(24)
+        self.timeout_progress_bar.setTextVisible(True)
+
+        self.timeout_h_layout.addWidget(self.timeout_progress_bar)
+
+        self.timeout_increase_button = QPushButton(Timeout)
+        self.timeout_increase_button.setObjectName(u"timeout_increase_button")
+        self.timeout_increase_button.setMaximumSize(QSize(50, 50))
+        font1 = QFont()
+        font1.setFamilies([u"Arial"])
+        font1.setPointSize(30)
+        font1.setKerning(True)
+        self.timeout_increase_button.setFont(font1)
+        icon = QIcon()
+        icon.addFile(u":/images/plus_icon.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.timeout_increase_button.setIcon(icon)
+
+        self.timeout_h_layout.addWidget(self.timeout_increase_button)
+
+
+        self.retranslateUi(Timeout)
+
+        QMetaObject.connectSlotsByName(Timeout)
+    # setupUi
+
+    def retranslateUi(self, Timeout):
+        self.timeout_increase_button.setText("")
+        pass
+    # retranslateUi
+
@@ -0,0 +1,29 @@
+"""
+Call functions in the GUI thread from other threads, ex to show dialogs from worker threads.
+"""
+
+from typing import Callable
+
+from PySide6.QtCore import QObject, Signal
+
+
+class Invoker(QObject):
+    """Calls functions in the thread the invoker was created in, usually the GUI thread."""
+
+    called = Signal(object)
+    """Function to call, emitted in any thread and called in the invoker's thread."""
+
+    def __init__(self):
+        super().__init__()
+        self.called.connect(self._call)
+
+    def call(self, function: Callable[[], None]):
+        """
+        Call ``function`` in the invoker's thread. Thread safe.
+
+        Called right away if already in the invoker's thread, otherwise queued in its event loop.
+        """
+        self.called.emit(function)
+
+    def _call(self, function: Callable[[], None]):
+        function()
@@ -0,0 +1,29 @@
+"""
+Qt resources (images, stylesheets, etc.), registered when this module is imported.
+
+Resources are registered from the binary resource file ``forms/resources.rcc``, which Qt memory
+maps, so the data is not loaded into Python nor copied. If that file is not available, the
+resources are registered from the Python module ``forms/resources_rc.py``, where they are a bytes
+literal.
+
+Both files are generated from ``assets/resources.qrc`` with ``inv ui.rc``.
+"""
+
+import logging
+from pathlib import Path
+
+from PySide6.QtCore import QResource
+
+RESOURCES_FILE = Path(__file__).parent / 'forms' / 'resources.rcc'
+"""Binary resource file."""
+
+
+def _register_resources():
+    if QResource.registerResource(str(RESOURCES_FILE)):
+        logging.debug(f'Qt resources registered from {RESOURCES_FILE}')
+    else:
+        logging.debug(f'Qt resources not found in {RESOURCES_FILE}, using `resources_rc.py`.')
+        from .forms import resources_rc  # noqa: F401
+
+
+_register_resources()
@@ -1,72 +1,212 @@
 import logging
 import threading
 import time
+from typing import TYPE_CHECKING
 
-import markdown
-import qdarkstyle
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QIcon, QKeySequence, QShortcut
-from PySide6.QtWidgets import QApplication, QDialog
-from qdarkstyle.dark.palette import DarkPalette
-from qdarkstyle.light.palette import LightPalette
+from PySide6.QtWidgets import QApplication, QDialog, QProgressBar, QPushButton, QWidget
 
-from ..exit_code import ExitCode
-from ..inputs import Buttons, Inputs, Theme
+from ..answers import Answers
+from ..exit_code import ExitCode, ExitSource
+from ..inputs import Buttons, Inputs
 from ..ipc.ipc_params import IpcParams
 from ..ipc.message import Message, MessageType
 from ..ipc.server import IpcServer
-from ..utils_qt import set_layout_visibility
+from ..markdown_renderer import markdown_renderer
+from ..recording import record_dialog
+from ..startup_trace import startup_trace
+from ..style import Style
 from .forms.ui_show_dialog import Ui_ShowDialog
+from .stylesheet import AppStylesheet, load_theme_pack, stylesheet_cache
+
+if TYPE_CHECKING:
+    from .forms.ui_timeout import Ui_Timeout
+
+REVEAL_INPUTS_FIELDS = frozenset(
+    [
+        'dialog_title',
+        'title',
+        'description',
+        'description_md',
+        'description_md_nl2br',
+        'pass_button_text',
+        'fail_button_text',
+    ]
+)
+"""
+Fields of ``Inputs`` that can be changed when showing a dialog that was started hidden.
+
+Other fields change which widgets are created or the stylesheet, so they're set when starting.
+"""
+
+FAIL_ICON = ':/images/fail_icon.png'
 
 
 class ShowDialog(QDialog, Ui_ShowDialog):
+    ipc_message_received = Signal(object)
+    """IPC message, emitted in the IPC server thread and handled in the GUI thread."""
+    exited = Signal(object)
+    """Exit code, emitted when the dialog exits, before closing."""
+
     def __init__(
         self,
         app: QApplication,
         inputs: Inputs,
         *,
         stylesheet: str | None = None,
+        style: Style | None = None,
         ipc_params: IpcParams | None = None,
+        quit_app: bool = True,
+        keep_open: bool = False,
+        answers: Answers | None = None,
+        style_app: bool = True,
     ):
+        """
+        :param quit_app: Whether to exit the app's event loop with the exit code when the dialog
+            exits. If ``False``, the dialog closes with ``done(exit_code)`` instead, which emits
+            ``finished(exit_code)`` and leaves the app running, ex when running as a daemon.
+        :param keep_open: Keep the dialog open when it exits, ex to show the next step of a
+            sequence with ``reconfigure()``. The exit is only signaled with ``exited`` and
+            ``quit_app`` is ignored.
+        :param answers: Answer the dialog when shown, instead of a person.
+        :param style_app: Set the theme and style in the app, shared by all the dialogs. If
+            ``False``, they're set in this dialog only, ex in the daemon, where dialogs requested
+            by different launchers are open at the same time, with different themes and styles.
+            Slower, as the stylesheet is parsed for each dialog.
+        """
         super().__init__()
         self.app = app
         self.stylesheet = stylesheet
-        self.setupUi(self)
+        self.app_style = style
+        self.quit_app = quit_app
+        self.style_app = style_app
+        self.keep_open = keep_open
+        self.answers = answers
+        self._answer_id = 0
+        """Incremented for each answer, so that pending answers to previous inputs are ignored."""
+        self.exit_code: ExitCode | None = None
+        """Set when the dialog exits."""
+        self.exit_source: ExitSource | None = None
+        """What made the dialog exit, set with ``exit_code``."""
+        self._shown_at = time.perf_counter()
+        """When the dialog was shown or reconfigured, to record the time to answer."""
+        self._started = False
+        """Whether the timeout and the answer were started for the current inputs."""
+        with startup_trace.phase('show_dialog.setup_ui'):
+            self.setupUi(self)
         self.inputs = inputs
         self.ipc_params = ipc_params
-        self.timer = None
+        self.timer: QTimer | None = None
+        # Optional widgets, only created if needed
+        self.fail_button: QPushButton | None = None
+        self.timeout_widget: QWidget | None = None
+        self.timeout_progress_bar: QProgressBar | None = None
+        self.timeout_increase_button: QPushButton | None = None
+        # Set in the form, restored when reconfiguring
+        self._form_size = self.size()
+        self._form_window_title = self.windowTitle()
+        self._form_pass_icon = self.pass_button.icon()
+        self._local_stylesheet: str | None = None
 
         # UI adjustments
+        self._apply_inputs(None)
+
+        # UI bindings
+        self.pass_button.clicked.connect(lambda: self.pass_clicked())
+        self.exit_shortcut = QShortcut(QKeySequence('Ctrl+Q'), self)
+        self.exit_shortcut.activated.connect(
+            lambda: self.fail_clicked(ExitCode.Cancel, ExitSource.SHORTCUT)
+        )
+        self.pass_shortcut = QShortcut(QKeySequence('Ctrl+P'), self)
+        self.pass_shortcut.activated.connect(lambda: self.pass_clicked(ExitSource.SHORTCUT))
+
+        # Inter-Process Communication server
+        self.ipc_server = self.ipc_thread = None
+        self.ipc_message_received.connect(self._handle_ipc_message)
+        if self.ipc_params is not None:
+            self.ipc_server = IpcServer(self.ipc_params, self.process_ipc_message)
+            self.ipc_thread = threading.Thread(
+                target=self.ipc_server.start, name='show_dialog_ipc_server'
+            )
+            with startup_trace.phase('show_dialog.ipc_thread'):
+                self.ipc_thread.start()
+
+    def reconfigure(self, inputs: Inputs):
+        """
+        Change the inputs, to show the dialog again instead of creating a new one.
+
+        Only the widgets that depend on inputs that changed are updated. The timeout and the exit
+        code are reset, the timer starts if the dialog is visible. The IPC server, if any, is not
+        restarted.
+
+        :param inputs: New inputs to the dialog.
+        """
+        previous_inputs, self.inputs = self.inputs, inputs
+        self.exit_code = self.exit_source = None
+        self._started = False
+        self._answer_id += 1
+        self.resize(self._form_size)
+        self._apply_inputs(previous_inputs)
+        if self.isVisible():
+            self._start()
+
+    def _apply_inputs(self, previous_inputs: Inputs | None):
+        """
+        Update the widgets from the inputs.
+
+        :param previous_inputs: Inputs the widgets were set with, to only update what changed.
+            ``None`` to set everything, ie, when creating the dialog.
+        """
+
+        def changed(*fields: str) -> bool:
+            return previous_inputs is None or any(
+                getattr(previous_inputs, field) != getattr(self.inputs, field) for field in fields
+            )
+
+        # Texts override the buttons defaults, which are restored when the texts are removed
+        buttons_changed = changed(
+            'buttons',
+            'pass_button_text',
+            'fail_button_text',
+            'pass_button_icon',
+            'fail_button_icon',
+        )
+        if buttons_changed:
+            self._set_buttons()
+        if buttons_changed or changed(*REVEAL_INPUTS_FIELDS):
+            self._set_texts()
+        self._set_timeout()
+
+        # Stylesheet
         local_stylesheet = ''
         """Stylesheet modifications that depend on inputs."""
+        if self.inputs.buttons == Buttons.OK:
+            local_stylesheet += 'QPushButton#pass_button { color : black; }'
+        if changed('theme') or local_stylesheet != self._local_stylesheet:
+            with startup_trace.phase('show_dialog.stylesheet'):
+                self._set_stylesheet(local_stylesheet)
 
-        self.title_label.setText(self.inputs.title)
-        if self.inputs.description_md:
-            if self.inputs.description_md_nl2br:
-                description = markdown.markdown(self.inputs.description, extensions=['nl2br'])
-            else:
-                description = markdown.markdown(self.inputs.description)
-            logging.debug(f'Description converted to HTML:\n{description}')
-        else:
-            description = self.inputs.description
-        self.description_label.setText(description)
-        if self.inputs.dialog_title:
-            self.setWindowTitle(self.inputs.dialog_title)
-
-        # Buttons
-        if inputs.buttons == Buttons.OK:
-            # These settings may be overridden further below from `inputs`
-            self.fail_button.setVisible(False)
+    def _set_buttons(self):
+        """Set the buttons, creating or deleting the fail button, and their icons."""
+        if self.inputs.buttons == Buttons.OK:
+            # These settings may be overridden from `inputs` in `_set_texts`
             self.pass_button.setText(Buttons.OK)
             self.pass_button.setIcon(QIcon())
-            local_stylesheet += 'QPushButton#pass_button { color : black; }'
+            if self.fail_button:
+                self.fail_button.setParent(None)
+                self.fail_button.deleteLater()
+                self.fail_button = None
         else:
-            pass_text, fail_text = inputs.buttons.split('/')
+            pass_text, fail_text = self.inputs.buttons.split('/')
             self.pass_button.setText(pass_text)
-            self.fail_button.setText(fail_text)
+            self.pass_button.setIcon(self._form_pass_icon)
+            if self.fail_button:
+                self.fail_button.setText(fail_text)
+                self.fail_button.setIcon(QIcon(FAIL_ICON))
+            else:
+                self.fail_button = self._create_fail_button(fail_text)
 
-        if self.inputs.pass_button_text:
-            self.pass_button.setText(self.inputs.pass_button_text)
         if self.inputs.pass_button_icon:
             icon = QIcon(self.inputs.pass_button_icon)
             if not icon:
@@ -74,9 +214,7 @@ class ShowDialog(QDialog, Ui_ShowDialog):
                     f'Icon image for PASS button not found: {self.inputs.pass_button_icon}'
                 )
             self.pass_button.setIcon(icon)
-        if self.inputs.fail_button_text:
-            self.fail_button.setText(self.inputs.fail_button_text)
-        if self.inputs.fail_button_icon:
+        if self.fail_button and self.inputs.fail_button_icon:
             icon = QIcon(self.inputs.fail_button_icon)
             if not icon:
                 logging.warning(
@@ -84,68 +222,166 @@ class ShowDialog(QDialog, Ui_ShowDialog):
                 )
             self.fail_button.setIcon(icon)
 
-        # Timeout
-        if self.inputs.timeout:
+    def _set_texts(self):
+        """Set the texts from the inputs. Buttons must be set first."""
+        self.title_label.setText(self.inputs.title)
+        if self.inputs.description_md:
+            with startup_trace.phase('show_dialog.markdown'):
+                extensions = ['nl2br'] if self.inputs.description_md_nl2br else []
+                description = markdown_renderer.render(self.inputs.description, extensions)
+            logging.debug(f'Description converted to HTML:\n{description}')
+        else:
+            description = self.inputs.description
+        self.description_label.setText(description)
+        self.setWindowTitle(self.inputs.dialog_title or self._form_window_title)
+        if self.inputs.pass_button_text:
+            self.pass_button.setText(self.inputs.pass_button_text)
+        if self.fail_button and self.inputs.fail_button_text:
+            self.fail_button.setText(self.inputs.fail_button_text)
+
+    def _set_timeout(self):
+        """Set the timeout widgets, creating them if needed, and reset the timer."""
+        if not self.inputs.timeout:
+            if self.timeout_widget:
+                self.timer.stop()
+                self.timeout_widget.hide()
+                self.timeout_shortcut.setEnabled(False)
+            return
+
+        if self.timeout_widget is None:
+            timeout_ui = self._create_timeout_widget()
+            self.timeout_progress_bar = timeout_ui.timeout_progress_bar
+            self.timeout_increase_button = timeout_ui.timeout_increase_button
             self.timeout_increase_button.setIconSize(self.timeout_increase_button.size())
             self.timeout_increase_button.clicked.connect(self.timeout_increase_clicked)
             self.timeout_progress_bar.setMinimum(0)
-            self.timeout_progress_bar.setMaximum(self.inputs.timeout)
-            self.timeout_progress_bar.setValue(self.inputs.timeout)
             self.timer = QTimer()
             self.timer.setInterval(1000)
             self.timer.timeout.connect(self.timer_timeout)
-            self.timer.start()
-            if self.inputs.timeout_text:
-                self.timeout_progress_bar.setFormat(self.inputs.timeout_text)
-            else:
-                self.timeout_progress_bar.setTextVisible(False)
+            self.timeout_shortcut = QShortcut(QKeySequence('+'), self)
+            self.timeout_shortcut.activated.connect(self.timeout_increase_clicked)
+        elif self.timeout_widget.isHidden():
+            self.timeout_widget.show()
+            self.timeout_shortcut.setEnabled(True)
+
+        # Started when the dialog is shown
+        self.timer.stop()
+        self.timeout_progress_bar.setMaximum(self.inputs.timeout)
+        self.timeout_progress_bar.setValue(self.inputs.timeout)
+        if self.inputs.timeout_text:
+            self.timeout_progress_bar.setFormat(self.inputs.timeout_text)
+            self.timeout_progress_bar.setTextVisible(True)
         else:
-            set_layout_visibility(self.timeout_h_layout, False)
+            self.timeout_progress_bar.setTextVisible(False)
 
-        # Stylesheet
-        logging.getLogger('qdarkstyle').setLevel(logging.ERROR)  # Disable `qdarkstyle` logging
-        stylesheet_app = {
-            Theme.Light: qdarkstyle.load_stylesheet(palette=LightPalette),
-            Theme.Dark: qdarkstyle.load_stylesheet(palette=DarkPalette),
-            Theme.System: '',
-        }[inputs.theme]
-        if self.stylesheet:
-            # Combine the two stylesheets
-            stylesheet_app += self.stylesheet + local_stylesheet
-        self.app.setStyleSheet(stylesheet_app)
+    def _set_stylesheet(self, local_stylesheet: str):
+        """
+        Set the app stylesheet, in the app or in this dialog (see ``style_app``), and the changes
+        that depend on the inputs.
 
-        # UI bindings
-        self.pass_button.clicked.connect(self.pass_clicked)
-        self.fail_button.clicked.connect(lambda: self.fail_clicked(ExitCode.Fail))
-        self.exit_shortcut = QShortcut(QKeySequence('Ctrl+Q'), self)
-        self.exit_shortcut.activated.connect(lambda: self.fail_clicked(ExitCode.Cancel))
-        self.pass_shortcut = QShortcut(QKeySequence('Ctrl+P'), self)
-        self.pass_shortcut.activated.connect(self.pass_clicked)
-        self.timeout_shortcut = QShortcut(QKeySequence('+'), self)
-        self.timeout_shortcut.activated.connect(self.timeout_increase_clicked)
+        :param local_stylesheet: Stylesheet modifications that depend on inputs. Apply to this
+            dialog only, so that they don't change other dialogs open at the same time.
+        """
+        if self.app_style:
+            # Theme and style are prebuilt
+            app_stylesheet = load_theme_pack(self.inputs.theme, self.app_style)
+        else:
+            app_stylesheet = stylesheet_cache.get(self.inputs.theme, self.stylesheet or '')
+        if self.style_app:
+            app_stylesheet.apply(self.app)
+            self.setStyleSheet(local_stylesheet)
+        else:
+            AppStylesheet(
+                app_stylesheet.stylesheet + local_stylesheet, app_stylesheet.link_color
+            ).apply(self)
+        self._local_stylesheet = local_stylesheet
 
-        # Inter-Process Communication server
-        self.ipc_server = self.ipc_thread = None
-        if self.ipc_params is not None:
-            self.ipc_server = IpcServer(self.ipc_params, self.process_ipc_message)
-            self.ipc_thread = threading.Thread(
-                target=self.ipc_server.start, name='show_dialog_ipc_server'
-            )
-            self.ipc_thread.start()
+    def _create_fail_button(self, text: str) -> QPushButton:
+        """Fail button, to the left of the pass button. Not created if there's only one button."""
+        fail_button = QPushButton(text, self)
+        fail_button.setObjectName('fail_button')
+        fail_button.setMaximumSize(self.pass_button.maximumSize())
+        fail_button.setIcon(QIcon(FAIL_ICON))
+        fail_button.clicked.connect(lambda: self.fail_clicked(ExitCode.Fail))
+        self.buttons_h_layout.insertWidget(0, fail_button)
+        return fail_button
+
+    def _create_timeout_widget(self) -> 'Ui_Timeout':
+        """Timeout progress bar and increase button. Not created if there's no timeout."""
+        from .forms.ui_timeout import Ui_Timeout
+
+        self.timeout_widget = QWidget(self)
+        self.timeout_widget.setObjectName('timeout_widget')
+        timeout_ui = Ui_Timeout()
+        timeout_ui.setupUi(self.timeout_widget)
+        # Above the buttons
+        self.verticalLayout.insertWidget(self.verticalLayout.count() - 1, self.timeout_widget)
+        return timeout_ui
+
+    def prepare(self):
+        """
+        Do the work needed to show the dialog, without showing it, so that ``reveal()`` is fast.
+
+        Used when the dialog is started hidden.
+        """
+        self.ensurePolished()
+        self.adjustSize()
+        self.winId()  # Create the native window
+
+    def reveal(self, inputs_fields: dict | None = None):
+        """
+        Show the dialog that was started hidden.
+
+        :param inputs_fields: Fields of ``Inputs`` to change before showing. Only the fields in
+            ``REVEAL_INPUTS_FIELDS`` can be changed, other fields are ignored.
+        :raises ValueError: If the values are not valid for ``Inputs``.
+        """
+        if inputs_fields:
+            if ignored := set(inputs_fields) - REVEAL_INPUTS_FIELDS:
+                logging.warning(f'Inputs fields can only be set when starting: {sorted(ignored)}')
+            inputs_fields = {k: v for k, v in inputs_fields.items() if k in REVEAL_INPUTS_FIELDS}
+            self.inputs = Inputs.from_dict(self.inputs.to_dict() | inputs_fields)
+            self._set_texts()
+        self.show()
+        self.raise_()
+        self.activateWindow()
 
     def process_ipc_message(self, message: Message) -> bool:
+        """
+        Called in the IPC server thread. The message is handled in the GUI thread.
+
+        :return: Whether the IPC server keeps listening for messages.
+        """
+        self.ipc_message_received.emit(message)
+        return message.type not in {MessageType.TIMEOUT, MessageType.PASS, MessageType.FAIL}
+
+    def _handle_ipc_message(self, message: Message):
         if message.type is MessageType.TIMEOUT:
-            self.timeout()
-            return False
+            self.timeout(ExitSource.IPC)
         elif message.type is MessageType.PASS:
-            self.pass_clicked()
-            return False
+            self.pass_clicked(ExitSource.IPC)
         elif message.type is MessageType.FAIL:
-            self.fail_clicked(ExitCode.Timeout)
-            return False
-        return True
+            self.fail_clicked(ExitCode.Timeout, ExitSource.IPC)
+        elif message.type is MessageType.SHOW:
+            try:
+                self.reveal(message.data)
+            except ValueError as e:
+                logging.error(f'Error in inputs fields {message.data}: {e}')
+                self.reveal()  # Show the dialog anyway
+
+    def exit(self, exit_code: ExitCode, source: ExitSource = ExitSource.API):
+        """
+        Exit with the exit code, recorded if ``config.RECORD_FILE`` is set.
 
-    def exit(self, exit_code: ExitCode):
+        :param source: What made the dialog exit. Default is code calling this method.
+        """
+        if self.exit_code is not None:
+            # Already exited, ex closing the window after clicking a button
+            return
+        self.exit_code = exit_code
+        self.exit_source = source
+        if self.timer:
+            self.timer.stop()
         if self.ipc_server:
             self.ipc_server.stop()
             timeout = 3.0
@@ -157,18 +393,58 @@ class ShowDialog(QDialog, Ui_ShowDialog):
                     raise ValueError('Error stopping IPC server.')
             logging.debug('IPC server sopped successfully.')
 
-        logging.debug(f'Exiting with code {exit_code.value}: {exit_code.name}.')
-        self.app.exit(int(exit_code))
+        logging.debug(f'Exiting with code {exit_code.value}: {exit_code.name} ({source.value}).')
+        record_dialog(self.inputs, exit_code, source, time.perf_counter() - self._shown_at)
+        self.exited.emit(exit_code)
+        if self.keep_open:
+            return
+        if self.quit_app:
+            self.app.exit(int(exit_code))
+        else:
+            self.done(int(exit_code))
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if startup_trace.enabled:
+            # Startup is complete once the dialog is displayed
+            startup_trace.mark('first_paint')
+            startup_trace.finish()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._start()
+
+    def _start(self):
+        """Start the timeout and the answer, if any, when shown or reconfigured while shown."""
+        if self.exit_code is not None or self._started:
+            # Ex shown again after being reconfigured while shown
+            return
+        self._started = True
+        self._shown_at = time.perf_counter()
+        if self.timer and self.inputs.timeout and not self.timer.isActive():
+            self.timer.start()
+        if self.answers is not None:
+            answer = self.answers.answer(self.inputs)
+            self._answer_id += 1
+            answer_id = self._answer_id
+            QTimer.singleShot(
+                int(answer.delay * 1000), lambda: self._auto_answer(answer_id, answer.exit_code)
+            )
+
+    def _auto_answer(self, answer_id: int, exit_code: ExitCode):
+        if answer_id == self._answer_id:
+            self.exit(exit_code, ExitSource.ANSWER)
 
     def resizeEvent(self, event):
         self.pass_button.setIconSize(self.pass_button.size())
-        self.fail_button.setIconSize(self.fail_button.size())
+        if self.fail_button:
+            self.fail_button.setIconSize(self.fail_button.size())
 
     def closeEvent(self, event):
         """
         When closing the app (``X`` button), mark as fail instead of pass.
         """
-        self.fail_clicked(ExitCode.Cancel)
+        self.fail_clicked(ExitCode.Cancel, ExitSource.CLOSE)
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Escape:
@@ -178,13 +454,13 @@ class ShowDialog(QDialog, Ui_ShowDialog):
         else:
             super().keyPressEvent(event)
 
-    def timeout(self):
+    def timeout(self, source: ExitSource = ExitSource.TIMEOUT):
         """Timeout occurred. Process it."""
         logging.debug('Timeout.')
         if self.inputs.timeout_pass:
-            self.pass_clicked()
+            self.pass_clicked(source)
         else:
-            self.fail_clicked(ExitCode.Timeout)
+            self.fail_clicked(ExitCode.Timeout, source)
 
     def timer_timeout(self):
         new_value = self.timeout_progress_bar.value() - self.timer.interval() / 1000
@@ -199,10 +475,10 @@ class ShowDialog(QDialog, Ui_ShowDialog):
             self.timeout_progress_bar.setMaximum(new_value)
         self.timeout_progress_bar.setValue(new_value)
 
-    def pass_clicked(self):
+    def pass_clicked(self, source: ExitSource = ExitSource.BUTTON):
         # Equivalent to `self.close()` and `self.done(0)`.
         # Using `QApplication.exit(0)` to enable testing exit code.
-        self.exit(ExitCode.Pass)
+        self.exit(ExitCode.Pass, source)
 
-    def fail_clicked(self, exit_code: ExitCode):
-        self.exit(exit_code)
+    def fail_clicked(self, exit_code: ExitCode, source: ExitSource = ExitSource.BUTTON):
+        self.exit(exit_code, source)
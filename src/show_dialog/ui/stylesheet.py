@@ -0,0 +1,270 @@
+"""
+App stylesheet, which is the theme (from ``qdarkstyle``) combined with the style and changes that
+depend on the inputs.
+
+Generating the theme with ``qdarkstyle`` is slow, so the combined stylesheets are cached in memory
+and on disk. A run with a cached stylesheet only imports the ``qdarkstyle`` resources, with the
+icons used by the stylesheet.
+
+For the included styles, the theme and style are also prebuilt as theme packs in the resources.
+"""
+
+import contextlib
+import functools
+import hashlib
+import logging
+import os
+import platform
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from .. import config
+from ..inputs import Theme
+from ..style import Style
+
+LINK_COLOR_PATTERN = re.compile(r'^/\* link-color: (\S*) \*/\n')
+"""First line in a cached stylesheet file, with the color to set for links in the app palette."""
+
+THEME_PACKS_DIR = ':/theme_packs'
+"""Directory in the resources with the theme packs."""
+
+
+@dataclass(frozen=True)
+class AppStylesheet:
+    stylesheet: str
+    link_color: str = ''
+    """
+    Color for links in the app palette.
+
+    ``qdarkstyle`` sets this color in the app palette when generating the theme stylesheet.
+    """
+
+    def apply(self, app):
+        """
+        Set the stylesheet and palette in the ``QApplication`` ``app``, or in a widget to style it
+        and its children only.
+
+        Does nothing if the app already has the stylesheet, ex from the previous dialog, as setting
+        it restyles all the widgets.
+        """
+        if app.styleSheet() == self.stylesheet:
+            return
+        app.setStyleSheet(self.stylesheet)
+        if self.link_color:
+            from PySide6.QtGui import QColor, QPalette
+
+            palette = app.palette()
+            palette.setColor(
+                QPalette.ColorGroup.Normal, QPalette.ColorRole.Link, QColor(self.link_color)
+            )
+            app.setPalette(palette)
+
+    def to_text(self) -> str:
+        """Text saved in the cache file."""
+        return f'/* link-color: {self.link_color} */\n{self.stylesheet}'
+
+    @classmethod
+    def from_text(cls, text: str) -> 'AppStylesheet':
+        if match := LINK_COLOR_PATTERN.match(text):
+            return cls(text[match.end() :], match.group(1))
+        return cls(text)
+
+
+def load_theme_stylesheet(theme: Theme) -> AppStylesheet:
+    """
+    Generate the stylesheet for the theme with ``qdarkstyle``.
+    """
+    if theme is Theme.System:
+        return AppStylesheet('')
+
+    import qdarkstyle
+    from qdarkstyle.dark.palette import DarkPalette
+    from qdarkstyle.light.palette import LightPalette
+
+    logging.getLogger('qdarkstyle').setLevel(logging.ERROR)  # Disable `qdarkstyle` logging
+    palette = {Theme.Light: LightPalette, Theme.Dark: DarkPalette}[theme]
+
+    return AppStylesheet(qdarkstyle.load_stylesheet(palette=palette), palette.COLOR_ACCENT_3)
+
+
+def register_theme_icons(theme: Theme):
+    """
+    Register the icons used by the theme stylesheet (``url(":/qss_icons/...")``), which are Qt
+    resources in ``qdarkstyle``.
+
+    Generating the theme registers them, so this is needed when the stylesheet is read from the
+    cache or from a theme pack. Imports only the resources module, not the stylesheet generation.
+    """
+    if theme is Theme.Dark:
+        from qdarkstyle.dark import darkstyle_rc  # noqa: F401
+    elif theme is Theme.Light:
+        from qdarkstyle.light import lightstyle_rc  # noqa: F401
+
+
+def minify_stylesheet(stylesheet: str) -> str:
+    """
+    Remove comments and whitespace that is not needed.
+    """
+    stylesheet = re.sub(r'/\*.*?\*/', '', stylesheet, flags=re.DOTALL)
+    stylesheet = re.sub(r'\s+', ' ', stylesheet)
+    stylesheet = re.sub(r' ?([{};,]) ?', r'\1', stylesheet)
+    stylesheet = re.sub(r': ', ':', stylesheet)
+    # In the declarations only, as in selectors a space before `:` is a descendant selector
+    stylesheet = re.sub(r'\{[^{}]*\}', lambda m: m.group().replace(' :', ':'), stylesheet)
+    stylesheet = stylesheet.replace(';}', '}')
+
+    return stylesheet.strip()
+
+
+def build_theme_pack(theme: Theme, stylesheet: str) -> AppStylesheet:
+    """
+    Combine the theme with the style into one minified stylesheet.
+
+    :param theme: Theme, generated with ``qdarkstyle``.
+    :param stylesheet: Style, ie, the contents of the CSS file.
+    """
+    theme_stylesheet = load_theme_stylesheet(theme)
+    return AppStylesheet(
+        minify_stylesheet(theme_stylesheet.stylesheet + stylesheet), theme_stylesheet.link_color
+    )
+
+
+def theme_pack_path(theme: Theme, style: Style) -> str:
+    """Path in the resources to the theme pack with the theme and style."""
+    return f'{THEME_PACKS_DIR}/{theme.value.lower()}_{Path(style.value).stem}.qss'
+
+
+@functools.cache
+def load_theme_pack(theme: Theme, style: Style) -> AppStylesheet:
+    """
+    Load the prebuilt theme pack from the resources.
+
+    Loaded once per theme and style, as many dialogs are shown with the same, ex with
+    ``DialogRuntime`` or the daemon.
+
+    Theme packs are built with ``inv ui.theme-packs``.
+    """
+    from ..utils_qt import read_file
+    from . import resources  # noqa: F401  # Register Qt resources
+
+    register_theme_icons(theme)
+    return AppStylesheet.from_text(read_file(theme_pack_path(theme, style)))
+
+
+@functools.cache
+def _qdarkstyle_version() -> str:
+    """
+    Version of ``qdarkstyle``, read from its source file without importing the package.
+
+    ``importlib.metadata`` is not used as it's slow and package metadata may not be available, ex in
+    the bundled app.
+    """
+    from importlib.util import find_spec
+
+    spec = find_spec('qdarkstyle')
+    try:
+        text = Path(spec.origin).read_text(encoding='utf-8')  # type: ignore
+    except (AttributeError, OSError, TypeError):
+        text = ''
+    if match := re.search(r'^__version__ = [\'"](.+)[\'"]', text, re.MULTILINE):
+        return match.group(1)
+
+    # Source file not available, ex in the bundled app
+    import qdarkstyle
+
+    return str(qdarkstyle.__version__)
+
+
+class StylesheetCache:
+    """
+    Cache of app stylesheets, in memory and optionally on disk.
+
+    The key includes everything the stylesheet depends on: ``qdarkstyle`` and Qt versions, OS,
+    theme, style and input specific changes.
+    """
+
+    def __init__(self, cache_dir: Path | None = None):
+        """
+        :param cache_dir: Directory where stylesheets are saved. ``None`` to cache in memory only.
+        """
+        self.cache_dir = cache_dir
+        self._stylesheets: dict[str, AppStylesheet] = {}
+
+    def get(self, theme: Theme, stylesheet: str = '', local_stylesheet: str = '') -> AppStylesheet:
+        """
+        Get the app stylesheet, generating it if not cached.
+
+        :param theme: Theme, generated with ``qdarkstyle``.
+        :param stylesheet: Style, ie, the contents of the CSS file. Added after the theme.
+        :param local_stylesheet: Changes that depend on the inputs. Added after the style.
+        """
+        key = self._key(theme, stylesheet, local_stylesheet)
+        if app_stylesheet := self._stylesheets.get(key):
+            return app_stylesheet
+
+        if (app_stylesheet := self._read(key)) is None:
+            theme_stylesheet = load_theme_stylesheet(theme)
+            app_stylesheet = AppStylesheet(
+                theme_stylesheet.stylesheet + stylesheet + local_stylesheet,
+                theme_stylesheet.link_color,
+            )
+            self._write(key, app_stylesheet)
+        else:
+            register_theme_icons(theme)
+
+        self._stylesheets[key] = app_stylesheet
+        return app_stylesheet
+
+    def clear(self):
+        """Clear the cache in memory. Files on disk are not deleted."""
+        self._stylesheets.clear()
+
+    def _key(self, theme: Theme, stylesheet: str, local_stylesheet: str) -> str:
+        from PySide6.QtCore import qVersion
+
+        qdarkstyle_version = _qdarkstyle_version() if theme is not Theme.System else ''
+        key_values = [
+            qdarkstyle_version,
+            qVersion(),
+            platform.system(),
+            theme.value,
+            stylesheet,
+            local_stylesheet,
+        ]
+        return hashlib.sha256('\0'.join(key_values).encode()).hexdigest()
+
+    def _file(self, key: str) -> Path | None:
+        return self.cache_dir / f'{key}.qss' if self.cache_dir else None
+
+    def _read(self, key: str) -> AppStylesheet | None:
+        if not (file := self._file(key)) or not file.is_file():
+            return None
+        try:
+            text = file.read_text(encoding='utf-8')
+        except OSError as e:
+            logging.warning(f'Error reading cached stylesheet `{file}`: {e}')
+            return None
+        logging.debug(f'Stylesheet read from cache: {file}')
+
+        return AppStylesheet.from_text(text)
+
+    def _write(self, key: str, app_stylesheet: AppStylesheet):
+        if not (file := self._file(key)):
+            return
+        # Write to a temporary file first, so other processes never read a partial file
+        temp_file = file.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file.write_text(app_stylesheet.to_text(), encoding='utf-8')
+            os.replace(temp_file, file)
+        except OSError as e:
+            logging.warning(f'Error caching stylesheet in `{file}`: {e}')
+            with contextlib.suppress(OSError):
+                temp_file.unlink(missing_ok=True)
+        else:
+            logging.debug(f'Stylesheet saved to cache: {file}')
+
+
+stylesheet_cache = StylesheetCache(config.CACHE_DIR if config.STYLESHEET_CACHE else None)
+"""Cache used by the app."""
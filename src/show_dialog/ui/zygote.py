@@ -0,0 +1,85 @@
+"""
+Fork server, aka zygote, that shows each dialog in a new process. Linux only.
+
+Started with ``show_dialog --serve --fork``. The server imports Qt and the app once, then forks a
+process for each dialog, which doesn't need to import them again. Unlike the daemon in
+``daemon.py``, each dialog runs in its own process, isolated from the others.
+
+Uses the same protocol as the daemon, so dialogs are requested with the launcher. See
+``launcher.py``.
+"""
+
+import json
+import logging
+import socketserver
+import sys
+
+from .. import config
+from ..exit_code import ExitCode
+from ..launcher import DAEMON_HOST, LaunchRequest, LaunchResponse
+
+
+def preload():
+    """
+    Import everything needed to show a dialog, except creating the ``QApplication``, which is not
+    safe to fork.
+    """
+    import qdarkstyle  # noqa: F401
+
+    from ..markdown_renderer import markdown_renderer
+    from . import resources, show_dialog  # noqa: F401
+
+    # Import `markdown` and its extensions
+    markdown_renderer.converter()
+    markdown_renderer.converter(['nl2br'])
+
+
+class _DialogHandler(socketserver.StreamRequestHandler):
+    """Handles one request, in the forked process."""
+
+    def handle(self):
+        from ..main import show_dialog
+
+        try:
+            request = LaunchRequest.from_json(self.rfile.readline())
+            exit_code = show_dialog(
+                request.inputs,
+                stylesheet=request.stylesheet,
+                style=request.style,
+                ipc_params=request.ipc_params,
+                hidden=request.hidden,
+                mode='return',
+            )
+        except Exception as e:
+            logging.error(f'Error showing dialog: {e}')
+            exit_code = ExitCode.Unknown
+        self.wfile.write(json.dumps(LaunchResponse(exit_code).to_dict()).encode() + b'\n')
+
+
+class ForkServer(socketserver.ForkingMixIn, socketserver.TCPServer):
+    allow_reuse_address = True
+
+    def __init__(self, port: int = config.DAEMON_PORT):
+        """
+        :param port: Port to listen on ``localhost``. ``0`` to use any free port.
+        :raises ValueError: If not running on Linux.
+        :raises OSError: If not able to listen on the port, ex another server is running.
+        """
+        if sys.platform != 'linux':
+            raise ValueError('Forking a process for each dialog is only supported on Linux.')
+        super().__init__((DAEMON_HOST, port), _DialogHandler)
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+
+def serve(port: int = config.DAEMON_PORT):
+    """Run the fork server until the process is terminated."""
+    preload()
+    with ForkServer(port) as server:
+        logging.info(f'Fork server listening on port {server.port}.')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logging.info('Fork server stopped.')
@@ -22,7 +22,7 @@ def list_resources(base_path: str = ':/', recursive: bool = False) -> list[str]:
     return [f'{base_path}/{entry}' for entry in entries if entry not in ['.', '..']]
 
 
-def read_file(file_path):
+def read_file(file_path) -> str:
     """
     Read both regular files (from a path) and resource files (file inside a resource).
     """
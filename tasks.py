@@ -53,6 +53,13 @@ QRC_FILES = tuple(ASSETS_DIR.glob("**/*.qrc"))
 Qt ``.qrc`` resource files.
 """
 
+THEME_PACKS_DIR = ASSETS_DIR / 'theme_packs'
+"""
+Theme packs, ie, each theme combined with each style and minified.
+Built with ``inv ui.theme-packs``.
+"""
+THEME_PACKS_QRC_FILE = ASSETS_DIR / 'resources.qrc'
+
 # region Executable build configs
 BUILD_SPEC_FILE = ASSETS_DIR / 'pyinstaller.spec'
 BUILD_WORK_DIR = PROJECT_ROOT / 'build'
@@ -261,9 +268,15 @@ def _update_imports():
         module = _module_path_from_file(root_path, build_source_dir.parent)
         for file in files:
             file_path = root_path / file
+            if file_path.suffix != '.py':
+                continue  # Ex `resources.rcc`, which is binary
 
             regex_replace = [
                 (r'''^( *from[ ]+)(\.)( .*)''', module),  # from . import <module>
+                (  # from .. import <module>
+                    r'''^( *from[ ]+)(\.{2})( .*)''',
+                    '.'.join(module.split('.')[:-1]),
+                ),
                 (
                     r'''^( *from[ ]+)(\.{2})(.*)''',
                     '.'.join(module.split('.')[:-1]) + '.',
@@ -682,18 +695,23 @@ def ui_py(c, file=None):
         file_path_out = SOURCE_DIR / 'ui/forms' / f'ui_{file_stem}.py'
 
         c.run(f'pyside6-uic {file_path_in} -o {file_path_out} --from-imports')
+        # Resources are registered by `ui/resources.py`, which prefers the binary `.rcc` file
+        _re_sub_file(file_path_out, r'^(from )(\. import resources_rc)()$', '.. import resources')
 
 
 @task(
     help={
-        'file': '`.qrc` file to be converted to `.py`. `.qrc` extension not required. '
+        'file': '`.qrc` file to be converted to `.rcc` and `.py`. `.qrc` extension not required. '
         'Can be a coma separated list of filenames. If not supplied, all files will be converted. '
         f'Available files: {", ".join(p.stem for p in QRC_FILES)}.'
     }
 )
 def ui_rc(c, file=None):
     """
-    Convert Qt `.qrc` files into `.py`.
+    Convert Qt `.qrc` files into binary `.rcc` and `.py`.
+
+    The binary file is memory mapped by Qt. The `.py` file is a fallback in case the binary file is
+    not available.
     """
     if file:
         file_stems = [
@@ -712,8 +730,48 @@ def ui_rc(c, file=None):
             )
 
         file_path_out = SOURCE_DIR / 'ui/forms' / f'{file_stem}_rc.py'
+        file_path_out_binary = SOURCE_DIR / 'ui/forms' / f'{file_stem}.rcc'
 
         c.run(f'pyside6-rcc {file_path_in} -o {file_path_out}')
+        c.run(f'pyside6-rcc --binary {file_path_in} -o {file_path_out_binary}')
+
+
+@task(help={'no_rc': 'Do not convert the `.qrc` file to `.py` after building the theme packs.'})
+def ui_theme_packs(c, no_rc: bool = False):
+    """
+    Build the theme packs and add them to the `.qrc` file.
+
+    A theme pack is a theme combined with one of the included styles into one minified stylesheet,
+    so that the app doesn't need to generate and combine them at runtime.
+    """
+    import re
+
+    from src.show_dialog import Style, Theme
+    from src.show_dialog.ui.stylesheet import build_theme_pack, theme_pack_path
+
+    # Build theme packs
+    THEME_PACKS_DIR.mkdir(exist_ok=True)
+    for file in THEME_PACKS_DIR.glob('*.qss'):
+        file.unlink()
+    qrc_entries = []
+    for style in Style:
+        # Styles in the resources are also in the assets dir, with the same relative path
+        css = (ASSETS_DIR / style.value.removeprefix(':/')).read_text()
+        for theme in Theme:
+            theme_pack = build_theme_pack(theme, css)
+            resource_path = theme_pack_path(theme, style).removeprefix(':/')
+            (ASSETS_DIR / resource_path).write_text(theme_pack.to_text(), newline='\n')
+            qrc_entries.append(f'    <file>{resource_path}</file>\n')
+            print(f'Theme pack created: {resource_path}')
+
+    # Update `.qrc` file
+    qrc_text = THEME_PACKS_QRC_FILE.read_text()
+    qrc_text = re.sub(r' *<file>theme_packs/.*</file>\n', '', qrc_text)
+    qrc_text = qrc_text.replace('  </qresource>', ''.join(qrc_entries) + '  </qresource>')
+    THEME_PACKS_QRC_FILE.write_text(qrc_text)
+
+    if not no_rc:
+        ui_rc(c, file=THEME_PACKS_QRC_FILE.stem)
 
 
 @task(
@@ -788,6 +846,14 @@ def test_unit(c):
     c.run('python -m pytest')
 
 
+@task
+def test_performance(c):
+    """
+    Run performance tests (benchmarks).
+    """
+    c.run('python -m pytest -m performance -s')
+
+
 @task(
     help=REQUIREMENTS_TASK_HELP
     | {
@@ -905,6 +971,7 @@ ns = Collection()  # Main namespace
 
 test_collection = Collection('test')
 test_collection.add_task(test_unit, 'unit')
+test_collection.add_task(test_performance, 'performance')
 
 build_collection = Collection('build')
 build_collection.add_task(build_clean, 'clean')
@@ -942,6 +1009,7 @@ docs_collection.add_task(docs_clean, 'clean')
 ui_collection = Collection('ui')
 ui_collection.add_task(ui_py, 'py')
 ui_collection.add_task(ui_rc, 'rc')
+ui_collection.add_task(ui_theme_packs, 'theme-packs')
 ui_collection.add_task(ui_edit, 'edit')
 
 ns.add_collection(build_collection)
@@ -0,0 +1,55 @@
+"""
+Helpers for the benchmarks, which are tests marked with ``performance``.
+
+Run the benchmarks with ``python -m pytest -m performance -s`` to see the results.
+Set the environment variable ``SHOW_DIALOG_BENCHMARK_DIR`` to also save the results as JSON files.
+"""
+
+import json
+import logging
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Callable
+
+BENCHMARK_DIR = os.environ.get('SHOW_DIALOG_BENCHMARK_DIR', '')
+"""Directory where the results are saved. Empty to not save."""
+
+
+def measure(func: Callable[[], object], repeat: int = 5) -> list[float]:
+    """Run ``func`` ``repeat`` times and return the durations in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def summary(durations: list[float]) -> dict[str, float]:
+    """Summary of the durations, in milliseconds."""
+    return {
+        'median_ms': round(statistics.median(durations) * 1000, 3),
+        'min_ms': round(min(durations) * 1000, 3),
+        'max_ms': round(max(durations) * 1000, 3),
+        'runs': len(durations),
+    }
+
+
+def report(name: str, results: dict) -> dict:
+    """
+    Print the results and save them to ``BENCHMARK_DIR``, if set.
+
+    :param name: Benchmark name, used as the file name.
+    :param results: JSON serializable results.
+    """
+    results_json = json.dumps(results, indent=2)
+    print(f'\nBenchmark `{name}`:\n{results_json}')
+    if BENCHMARK_DIR:
+        file = Path(BENCHMARK_DIR) / f'{name}.json'
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(results_json)
+        logging.info(f'Benchmark results saved to {file}')
+
+    return results
@@ -1,4 +1,5 @@
 import pytest
+from PySide6.QtWidgets import QApplication
 
 from src.show_dialog.inputs import Inputs
 
@@ -6,3 +7,9 @@ from src.show_dialog.inputs import Inputs
 @pytest.fixture
 def inputs_instance():
     return Inputs(title='Foo', description='Bar')
+
+
+@pytest.fixture(scope='session')
+def app():
+    _app = QApplication.instance() or QApplication([])
+    yield _app
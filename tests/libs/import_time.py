@@ -0,0 +1,74 @@
+"""
+Import time of each module, from the output of ``python -X importtime``.
+
+More info at https://docs.python.org/3/using/cmdline.html#cmdoption-X
+"""
+
+import re
+import statistics
+from dataclasses import dataclass
+
+from tests.libs.utils import run_python
+
+IMPORT_TIME_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+"""Line in the output, ex ``import time:       123 |        456 |   foo.bar``."""
+
+START_MARKER = 'import time: start of the measured code'
+"""
+Written to stderr before the code being measured, to exclude the modules imported before, ie, when
+the interpreter starts.
+"""
+
+
+@dataclass(frozen=True)
+class ModuleImport:
+    name: str
+    self_ms: float
+    """Time to import the module, excluding the modules it imports."""
+    cumulative_ms: float
+    """Time to import the module, including the modules it imports."""
+    level: int
+    """Nesting level. ``0`` for modules imported directly by the code being measured."""
+
+
+def parse_import_time(output: str) -> list[ModuleImport]:
+    """Parse the output of ``python -X importtime``, which is written to stderr."""
+    modules = []
+    for line in output.splitlines():
+        if match := IMPORT_TIME_PATTERN.match(line):
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append(
+                ModuleImport(name, int(self_us) / 1000, int(cumulative_us) / 1000, len(indent) // 2)
+            )
+    return modules
+
+
+def total_ms(modules: list[ModuleImport]) -> float:
+    """Time to import all the modules."""
+    return sum(module.cumulative_ms for module in modules if module.level == 0)
+
+
+def measure_import_time(code: str, runs: int = 5) -> list[ModuleImport]:
+    """
+    Import times in the run with the median total time, out of ``runs`` runs in new processes.
+
+    Only the modules imported by ``code`` are included, not the ones imported when the interpreter
+    starts.
+
+    :param code: Python code with the imports to measure, ex ``import foo``.
+    """
+    run_python('-c', code)  # Warm up, ex compile `.pyc` files
+    marked_code = f'import sys\nsys.stderr.write({START_MARKER!r} + "\\n")\n{code}'
+    results = []
+    for _ in range(runs):
+        result = run_python('-X', 'importtime', '-c', marked_code)
+        assert result.returncode == 0, result.stderr
+        results.append(parse_import_time(result.stderr.partition(START_MARKER)[2]))
+
+    median = statistics.median_low(total_ms(modules) for modules in results)
+    return next(modules for modules in results if total_ms(modules) == median)
+
+
+def top_offenders(modules: list[ModuleImport], count: int = 10) -> list[ModuleImport]:
+    """Modules that take the longest to import, excluding the modules they import."""
+    return sorted(modules, key=lambda module: module.self_ms, reverse=True)[:count]
@@ -0,0 +1,70 @@
+import contextlib
+import os
+import socket
+import subprocess
+import sys
+import threading
+from typing import Iterator
+
+from tests.libs.config import PROJECT_ROOT
+
+
+def run_python(
+    *args: str, env: dict[str, str] | None = None, timeout: float = 60
+) -> subprocess.CompletedProcess:
+    """
+    Run a new Python interpreter from the project root, ex ``run_python('-c', 'import foo')``.
+
+    Used to test behavior that depends on a clean process, like which modules are imported.
+
+    :param args: Arguments to the interpreter.
+    :param env: Environment variables to add to the current environment.
+    :param timeout: Timeout in seconds.
+    """
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_ROOT,
+        env=os.environ | (env or {}),
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+
+
+@contextlib.contextmanager
+def run_python_server(
+    *args: str, ready: str, env: dict[str, str] | None = None
+) -> Iterator[subprocess.Popen]:
+    """
+    Run a new Python interpreter in the background, ex a server, until the context exits.
+
+    :param args: Arguments to the interpreter.
+    :param ready: Text that the process writes to stderr when ready.
+    :param env: Environment variables to add to the current environment.
+    """
+    process = subprocess.Popen(
+        [sys.executable, *args],
+        cwd=PROJECT_ROOT,
+        env=os.environ | (env or {}),
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        for line in process.stderr:  # type: ignore
+            if ready in line:
+                break
+        else:
+            raise RuntimeError(f'Process exited before being ready: {args}')
+        # Keep reading stderr, so the process doesn't block when the pipe is full
+        threading.Thread(target=process.stderr.read, daemon=True).start()  # type: ignore
+        yield process
+    finally:
+        process.terminate()
+        process.wait(10)
+
+
+def free_port() -> int:
+    """A port on ``localhost`` that is not in use."""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
@@ -1,3 +1,7 @@
 import logging
+import os
 
 logging.basicConfig(level=logging.DEBUG)
+
+# Don't write to the user's cache directory
+os.environ.setdefault('SHOW_DIALOG_STYLESHEET_CACHE', 'False')
@@ -0,0 +1,51 @@
+import threading
+import time
+
+from src.show_dialog.ipc.client import IpcClient
+from src.show_dialog.ipc.ipc_params import IpcParams
+from src.show_dialog.ipc.message import Message, MessageType
+from src.show_dialog.ipc.server import IpcServer
+from tests.libs.utils import free_port
+
+
+def _start_server(process) -> tuple[IpcServer, threading.Thread]:
+    params = IpcParams(host='127.0.0.1', port=free_port(), timeout=10)
+    server = IpcServer(params, process)
+    thread = threading.Thread(target=server.start)
+    thread.start()
+    time.sleep(0.1)  # Listening
+    return server, thread
+
+
+def test_stop():
+    """Stops without waiting for the socket timeout."""
+    server, thread = _start_server(lambda message: True)
+    server.stop()
+    thread.join(1)
+    assert not thread.is_alive()
+    assert server._wakeup_writer is None  # Closed
+
+
+def test_process():
+    messages = []
+    server, thread = _start_server(lambda message: messages.append(message) or False)
+    client = IpcClient(server.params)
+    client.send(Message(MessageType.SHOW, data={'title': 'foo'}))
+    thread.join(1)
+    client.close()
+
+    assert not thread.is_alive()
+    assert messages[0].type is MessageType.SHOW
+    assert messages[0].data == {'title': 'foo'}
+
+
+def test_stop_before_start():
+    """Doesn't listen if stopped before starting, ex when the dialog exits right away."""
+    server = IpcServer(IpcParams(host='127.0.0.1', port=free_port(), timeout=10), lambda _: True)
+    server.stop()
+    thread = threading.Thread(target=server.start)
+    thread.start()
+    thread.join(1)
+
+    assert not thread.is_alive()
+    assert server._wakeup_writer is None
@@ -0,0 +1,69 @@
+"""
+Prompts answered per minute with ``--auto-answer``, with and without building the dialog, one
+process per prompt, and with ``DialogRuntime`` in one process.
+"""
+
+import json
+
+import pytest
+from pytest_params import params
+
+from src.show_dialog import Answer, Answers
+from tests.libs.benchmark import measure, report, summary
+from tests.libs.utils import run_python
+
+pytestmark = pytest.mark.performance
+
+RUNS = 10
+PROMPTS = 200
+
+RUNTIME_PROMPTS = '''
+import json, time
+from src.show_dialog import Answer, Answers, DialogRuntime, ExitCode, Inputs
+
+start = time.perf_counter()
+with DialogRuntime(answers=Answers([Answer()])) as runtime:
+    for i in range({prompts}):
+        assert runtime.show(Inputs(title=f'Prompt {{i}}')) is ExitCode.Pass
+print(json.dumps(time.perf_counter() - start))
+'''
+
+
+def _per_minute(duration: float) -> float:
+    return round(60 / duration, 1)
+
+
+@params('build_dialog', [('dialog', True), ('without dialog', False)])
+def test_auto_answer_cli(build_dialog: bool, tmp_path):
+    answers_file = tmp_path / 'answers.yaml'
+    Answers([Answer()], build_dialog=build_dialog).to_file(answers_file)
+
+    def run():
+        result = run_python(
+            '-m',
+            'src.show_dialog.main',
+            '--inputs',
+            '{"title": "Prompt"}',
+            '--auto-answer',
+            str(answers_file),
+            '--fast-exit',
+        )
+        assert result.returncode == 0, result.stderr
+
+    durations = measure(run, repeat=RUNS)
+    report(
+        'auto_answer_cli' if build_dialog else 'auto_answer_cli_without_dialog',
+        {'prompt': summary(durations), 'prompts_per_minute': _per_minute(min(durations))},
+    )
+
+
+def test_auto_answer_runtime():
+    result = run_python(
+        '-c', RUNTIME_PROMPTS.format(prompts=PROMPTS), env={'QT_QPA_PLATFORM': 'offscreen'}
+    )
+    assert result.returncode == 0, result.stderr
+    duration = json.loads(result.stdout.strip().splitlines()[-1])
+    report(
+        'auto_answer_runtime',
+        {'prompts': PROMPTS, 'prompts_per_minute': _per_minute(duration / PROMPTS)},
+    )
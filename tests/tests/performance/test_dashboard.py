@@ -0,0 +1,55 @@
+"""
+Memory and time to update the dashboard as the number of pending prompts grows.
+
+The memory is the Python memory allocated per prompt, the update is a tick of the countdowns and a
+repaint of the list. Both should stay flat, as only the visible rows are painted.
+"""
+
+import time
+import tracemalloc
+
+import pytest
+
+from src.show_dialog import Inputs
+from src.show_dialog.ui.dashboard import Dashboard
+from tests.libs.benchmark import measure, report, summary
+from tests.libs.fixtures import app  # noqa: F401
+
+pytestmark = pytest.mark.performance
+
+PROMPTS = [100, 200, 400, 800]
+RUNS = 20
+
+
+def _update(app, dashboard: Dashboard):
+    dashboard._tick()
+    app.processEvents()  # Repaint the visible rows
+
+
+def test_dashboard(app, qtbot):
+    results = {}
+    for prompts in PROMPTS:
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+        tracemalloc.start()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        for i in range(prompts):
+            inputs = Inputs(
+                title=f'Station {i}', description='Check the device. ' * 10, timeout=600
+            )
+            dashboard.add(inputs, lambda exit_code: None)
+        add_duration = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0] - start_memory
+        tracemalloc.stop()
+        app.processEvents()  # Lay out the rows
+
+        results[f'{prompts} prompts'] = {
+            'add_ms_per_prompt': round(add_duration / prompts * 1000, 3),
+            'memory_kb_per_prompt': round(memory / prompts / 1024, 2),
+            'update': summary(measure(lambda: _update(app, dashboard), repeat=RUNS)),
+        }
+        dashboard.cancel_all()
+        dashboard.hide()
+
+    report('dashboard', results)
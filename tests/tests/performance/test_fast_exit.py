@@ -0,0 +1,40 @@
+"""
+Time from the dialog exiting until the process exits, ie, until the calling process gets the exit
+code, with and without ``--fast-exit``.
+"""
+
+import time
+
+import pytest
+from pytest_params import params
+
+from tests.libs.benchmark import report, summary
+from tests.libs.utils import run_python_server
+
+pytestmark = pytest.mark.performance
+
+INPUTS = '{"timeout": 1, "timeout_pass": true}'
+RUNS = 10
+
+
+def _exit_duration(*args: str) -> float:
+    with run_python_server(
+        '-m',
+        'src.show_dialog.main',
+        '--inputs',
+        INPUTS,
+        '--log-level',
+        'debug',
+        *args,
+        ready='Exiting with code',  # Logged by the dialog when it exits
+        env={'QT_QPA_PLATFORM': 'offscreen'},
+    ) as process:
+        start = time.perf_counter()
+        assert process.wait(10) == 0
+        return time.perf_counter() - start
+
+
+@params('args', [('default', []), ('fast exit', ['--fast-exit'])])
+def test_fast_exit(args: list[str]):
+    durations = [_exit_duration(*args) for _ in range(RUNS)]
+    report('fast_exit' if args else 'exit', summary(durations))
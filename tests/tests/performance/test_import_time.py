@@ -0,0 +1,54 @@
+"""
+Import time of the modules in the startup path, compared to the budgets in
+``tests/assets/import_time_budget.json``.
+
+Fails if an import is over budget or imports a heavy module that is not needed at startup, ex Qt or
+``markdown``.
+"""
+
+import json
+
+import pytest
+from pytest_params import params
+
+from tests.libs.benchmark import report
+from tests.libs.config import TEST_ASSETS_DIR
+from tests.libs.import_time import measure_import_time, top_offenders, total_ms
+
+pytestmark = pytest.mark.performance
+
+BUDGETS: dict[str, dict] = json.loads((TEST_ASSETS_DIR / 'import_time_budget.json').read_text())
+
+
+def _format(modules) -> str:
+    return '\n'.join(
+        f'  {module.name}: {module.self_ms:.1f} ms (cumulative {module.cumulative_ms:.1f} ms)'
+        for module in modules
+    )
+
+
+@params('name', [(name, name) for name in BUDGETS])
+def test_import_time(name: str):
+    budget = BUDGETS[name]
+    modules = measure_import_time(budget['code'])
+    total = total_ms(modules)
+    offenders = top_offenders(modules)
+    report(
+        f'import_time_{name}',
+        {
+            'code': budget['code'],
+            'total_ms': round(total, 3),
+            'budget_ms': budget['budget_ms'],
+            'modules': len(modules),
+            'top_offenders': {module.name: module.self_ms for module in offenders},
+        },
+    )
+
+    forbidden = [
+        module.name for module in modules if module.name.split('.')[0] in budget['forbidden']
+    ]
+    assert not forbidden, f'`{budget["code"]}` imports forbidden modules: {", ".join(forbidden)}'
+    assert total <= budget['budget_ms'], (
+        f'`{budget["code"]}` took {total:.1f} ms, over the budget of {budget["budget_ms"]} ms. '
+        f'Top offenders:\n{_format(offenders)}'
+    )
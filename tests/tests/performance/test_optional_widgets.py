@@ -0,0 +1,66 @@
+"""
+Widget count, construction time and first paint latency of the common dialog, with one button and
+no timeout, vs a dialog with all the optional widgets (fail button and timeout).
+"""
+
+import time
+
+import pytest
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QWidget
+
+from src.show_dialog import Buttons, Inputs, ShowDialog, Style
+from tests.libs.benchmark import report, summary
+from tests.libs.fixtures import app  # noqa: F401
+
+pytestmark = pytest.mark.performance
+
+RUNS = 20
+
+
+class _PaintFilter(QObject):
+    def __init__(self):
+        super().__init__()
+        self.painted = False
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint:
+            self.painted = True
+        return False
+
+
+def _measure(app, inputs: Inputs) -> dict:
+    construction, first_paint, widgets = [], [], 0
+    for _ in range(RUNS):
+        paint_filter = _PaintFilter()
+        start = time.perf_counter()
+        dialog = ShowDialog(app, inputs, style=Style.Style02)
+        construction.append(time.perf_counter() - start)
+        dialog.installEventFilter(paint_filter)
+        dialog.show()
+        while not paint_filter.painted:
+            app.processEvents()
+        first_paint.append(time.perf_counter() - start)
+
+        widgets = len(dialog.findChildren(QWidget))
+        if dialog.timer:
+            dialog.timer.stop()
+        dialog.hide()
+        dialog.deleteLater()
+        app.processEvents()
+
+    return {
+        'widgets': widgets,
+        'construction': summary(construction),
+        'first_paint': summary(first_paint),
+    }
+
+
+def test_optional_widgets(app):
+    _measure(app, Inputs())  # Warm up, ex load the theme pack and icons
+
+    ok_dialog = _measure(app, Inputs(buttons=Buttons.OK))
+    full_dialog = _measure(app, Inputs(buttons=Buttons.PASS_FAIL, timeout=60))
+    report('optional_widgets', {'ok, no timeout': ok_dialog, 'pass/fail, timeout': full_dialog})
+
+    assert ok_dialog['widgets'] < full_dialog['widgets']
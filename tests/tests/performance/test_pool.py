@@ -0,0 +1,67 @@
+"""
+Per dialog overhead of ``DialogRuntime.show()`` building a new dialog each time vs reusing the
+dialogs in the pool, in a new process.
+
+The inputs alternate between dialogs with one and two buttons, with and without timeout, so the
+reused dialogs change their widgets. Each dialog exits as soon as it's painted.
+"""
+
+import json
+
+import pytest
+from pytest_params import params
+
+from tests.libs.benchmark import report, summary
+from tests.libs.utils import run_python
+
+pytestmark = pytest.mark.performance
+
+SHOW_DIALOGS = '''
+import json, time
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtWidgets import QApplication
+
+from src.show_dialog import Buttons, DialogRuntime, Inputs, Style
+from src.show_dialog.ui.show_dialog import ShowDialog
+
+class ExitOnPaint(QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint and isinstance(watched, ShowDialog):
+            if watched.exit_code is None:
+                QTimer.singleShot(0, watched.pass_clicked)
+        return False
+
+exit_on_paint = ExitOnPaint()
+all_inputs = [
+    Inputs(title='Title', description='Description'),
+    Inputs(title='Other title', buttons=Buttons.OK, timeout=10),
+]
+durations = []
+with DialogRuntime(style=Style.Style02, pool_size={pool_size}) as runtime:
+    QApplication.instance().installEventFilter(exit_on_paint)
+    for i in range({calls}):
+        start = time.perf_counter()
+        runtime.show(all_inputs[i % len(all_inputs)])
+        durations.append(time.perf_counter() - start)
+print(json.dumps(durations))
+'''
+"""Show the dialogs and print the duration of each."""
+
+RUNS = 5
+CALLS = 50
+
+
+@params('pool_size', [('new dialogs', 0), ('pool', 2)])
+def test_pool(pool_size: int):
+    durations = []
+    for _ in range(RUNS):
+        result = run_python(
+            '-c',
+            SHOW_DIALOGS.format(pool_size=pool_size, calls=CALLS),
+            env={'QT_QPA_PLATFORM': 'offscreen'},
+        )
+        assert result.returncode == 0, result.stderr
+        # The first dialogs include caches being filled, ex the stylesheet
+        durations.extend(json.loads(result.stdout.strip().splitlines()[-1])[2:])
+
+    report(f'pool_size={pool_size}', {'show': summary(durations)})
@@ -0,0 +1,67 @@
+"""
+Import time and memory to register the Qt resources: binary ``.rcc`` file vs Python module.
+"""
+
+import json
+import statistics
+
+import pytest
+
+from tests.libs.benchmark import report, summary
+from tests.libs.utils import run_python
+
+pytestmark = pytest.mark.performance
+
+REGISTER_RESOURCES = '''
+import json, resource, time
+from PySide6.QtCore import QFile
+
+import src.show_dialog.ui.forms  # Package imports are not measured
+
+def rss_kb():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * resource.getpagesize() // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # Peak, not current
+
+rss_start = rss_kb()
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+assert QFile(':/images/window_icon.png').exists()
+print(json.dumps({{'elapsed': elapsed, 'rss_kb': rss_kb() - rss_start}}))
+'''
+"""Time and memory (RSS) increase to register the resources in a new process."""
+
+BINARY = 'from src.show_dialog.ui import resources'
+PYTHON_MODULE = 'from src.show_dialog.ui.forms import resources_rc'
+
+RUNS = 10
+
+
+def _run(code: str) -> dict:
+    result = run_python('-c', REGISTER_RESOURCES.format(code=code))
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_resources():
+    pytest.importorskip('resource', reason='Unix only.')
+
+    binary = [_run(BINARY) for _ in range(RUNS)]
+    python_module = [_run(PYTHON_MODULE) for _ in range(RUNS)]
+
+    report(
+        'resources',
+        {
+            'python module (resources_rc.py)': summary([r['elapsed'] for r in python_module])
+            | {'rss_increase_kb': statistics.median(r['rss_kb'] for r in python_module)},
+            'binary (resources.rcc)': summary([r['elapsed'] for r in binary])
+            | {'rss_increase_kb': statistics.median(r['rss_kb'] for r in binary)},
+        },
+    )
+
+    assert statistics.median(r['elapsed'] for r in binary) < statistics.median(
+        r['elapsed'] for r in python_module
+    )
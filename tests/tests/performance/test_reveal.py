@@ -0,0 +1,82 @@
+"""
+Time until the dialog is displayed: starting the app (cold start) vs showing a dialog that was
+started hidden, from when the IPC ``show`` message is sent.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+from PySide6.QtCore import QEvent, QObject
+
+from src.show_dialog import Inputs, ShowDialog, Style
+from src.show_dialog.ipc.client import IpcClient
+from src.show_dialog.ipc.ipc_params import IpcParams
+from src.show_dialog.ipc.message import Message, MessageType
+from tests.libs.benchmark import report, summary
+from tests.libs.fixtures import app  # noqa: F401
+from tests.libs.utils import free_port, run_python
+
+pytestmark = pytest.mark.performance
+
+INPUTS = Inputs(title='Title', description='Description', timeout=1, timeout_pass=True)
+RUNS = 10
+
+
+class _PaintFilter(QObject):
+    def __init__(self):
+        super().__init__()
+        self.painted_at: float | None = None
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint and self.painted_at is None:
+            self.painted_at = time.perf_counter()
+        return False
+
+
+def _cold_start() -> float:
+    result = run_python(
+        '-m',
+        'src.show_dialog.main',
+        '--inputs',
+        INPUTS.to_json(),
+        '--startup-trace',
+        env={'QT_QPA_PLATFORM': 'offscreen'},
+    )
+    assert result.returncode == 0, result.stderr
+    trace, _ = json.JSONDecoder().raw_decode(result.stderr[result.stderr.index('{') :])
+    first_paint = next(phase for phase in trace['phases'] if phase['name'] == 'first_paint')
+    return first_paint['end_ms'] / 1000
+
+
+def _reveal(app, qtbot) -> float:
+    ipc_params = IpcParams(host='127.0.0.1', port=free_port(), timeout=10)
+    dialog = ShowDialog(app, INPUTS, style=Style.Style02, ipc_params=ipc_params, quit_app=False)
+    qtbot.addWidget(dialog)
+    dialog.prepare()
+    paint_filter = _PaintFilter()
+    dialog.installEventFilter(paint_filter)
+    qtbot.waitUntil(lambda: dialog.ipc_thread.is_alive())  # type: ignore
+    qtbot.wait(100)  # IPC server listening
+    client = IpcClient(ipc_params)
+
+    start = time.perf_counter()
+    # The client waits for the server's response, so it's sent from another thread
+    threading.Thread(target=client.send, args=(Message(MessageType.SHOW),)).start()
+    qtbot.waitUntil(lambda: paint_filter.painted_at is not None)
+    dialog.pass_clicked()
+    client.close()
+
+    return paint_filter.painted_at - start  # type: ignore
+
+
+def test_reveal(app, qtbot):
+    _reveal(app, qtbot)  # Warm up
+    report(
+        'reveal',
+        {
+            'cold start': summary([_cold_start() for _ in range(RUNS)]),
+            'reveal': summary([_reveal(app, qtbot) for _ in range(RUNS)]),
+        },
+    )
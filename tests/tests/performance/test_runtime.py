@@ -0,0 +1,75 @@
+"""
+Per dialog overhead of ``show_dialog()`` vs ``DialogRuntime.show()``, for the first dialog and for
+the following ones, in a new process.
+
+Each dialog exits as soon as it's painted, so the time is the overhead of showing a dialog.
+"""
+
+import json
+
+import pytest
+from pytest_params import params
+
+from tests.libs.benchmark import report, summary
+from tests.libs.utils import run_python
+
+pytestmark = pytest.mark.performance
+
+SHOW_DIALOGS = '''
+import contextlib, json, time
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtWidgets import QApplication
+
+from src.show_dialog import DialogRuntime, Inputs, Style, show_dialog
+from src.show_dialog.ui.show_dialog import ShowDialog
+
+class ExitOnPaint(QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint and isinstance(watched, ShowDialog):
+            if watched.exit_code is None:
+                QTimer.singleShot(0, watched.pass_clicked)
+        return False
+
+exit_on_paint = ExitOnPaint()
+inputs = Inputs(title='Title', description='Description')
+durations = []
+start = time.perf_counter()
+if {use_runtime}:
+    with DialogRuntime(style=Style.Style02) as runtime:
+        QApplication.instance().installEventFilter(exit_on_paint)
+        for _ in range({calls}):
+            runtime.show(inputs)
+            durations.append(time.perf_counter() - start)
+            start = time.perf_counter()
+else:
+    QApplication().installEventFilter(exit_on_paint)
+    for _ in range({calls}):
+        show_dialog(inputs, style=Style.Style02, mode='return')
+        durations.append(time.perf_counter() - start)
+        start = time.perf_counter()
+print(json.dumps(durations))
+'''
+"""Show the dialogs and print the duration of each. The first includes creating the app."""
+
+RUNS = 5
+CALLS = 50
+
+
+@params('use_runtime', [('show_dialog', False), ('runtime', True)])
+def test_runtime(use_runtime: bool):
+    first_call, later_calls = [], []
+    for _ in range(RUNS):
+        result = run_python(
+            '-c',
+            SHOW_DIALOGS.format(use_runtime=use_runtime, calls=CALLS),
+            env={'QT_QPA_PLATFORM': 'offscreen'},
+        )
+        assert result.returncode == 0, result.stderr
+        durations = json.loads(result.stdout.strip().splitlines()[-1])
+        first_call.append(durations[0])
+        later_calls.extend(durations[1:])
+
+    report(
+        'runtime' if use_runtime else 'show_dialog',
+        {'first call': summary(first_call), 'later calls': summary(later_calls)},
+    )
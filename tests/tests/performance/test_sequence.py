@@ -0,0 +1,62 @@
+"""
+Time to go through the steps of a sequence in one window vs one process for each step, as done
+before sequences were supported.
+
+Each step exits as soon as it's painted, so the time is the overhead of showing the steps.
+"""
+
+import pytest
+
+from tests.libs.benchmark import measure, report, summary
+from tests.libs.utils import run_python
+
+pytestmark = pytest.mark.performance
+
+EXIT_ON_PAINT = '''
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtWidgets import QApplication
+
+from src.show_dialog import ExitCode, Inputs, Style, show_dialog, show_sequence
+from src.show_dialog.ui.show_dialog import ShowDialog
+
+class ExitOnPaint(QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint and isinstance(watched, ShowDialog):
+            if watched.exit_code is None:
+                QTimer.singleShot(0, watched.pass_clicked)
+        return False
+
+exit_on_paint = ExitOnPaint()
+QApplication().installEventFilter(exit_on_paint)
+'''
+
+SHOW_SEQUENCE = EXIT_ON_PAINT + '''
+steps = [Inputs(title=f'Step {{i}}', description='Description') for i in range({steps})]
+assert show_sequence(steps, style=Style.Style02) == [ExitCode.Pass] * {steps}
+'''
+
+SHOW_DIALOG = EXIT_ON_PAINT + '''
+show_dialog(Inputs(title='Step', description='Description'), style=Style.Style02)
+'''
+
+RUNS = 3
+STEPS = 10
+
+
+def _run(code: str):
+    result = run_python('-c', code, env={'QT_QPA_PLATFORM': 'offscreen'})
+    assert result.returncode == 0, result.stderr
+
+
+def test_sequence():
+    process_per_step = measure(lambda: [_run(SHOW_DIALOG) for _ in range(STEPS)], repeat=RUNS)
+    sequence = measure(lambda: _run(SHOW_SEQUENCE.format(steps=STEPS)), repeat=RUNS)
+
+    report(
+        'sequence',
+        {
+            'steps': STEPS,
+            'process per step': summary(process_per_step),
+            'sequence': summary(sequence),
+        },
+    )
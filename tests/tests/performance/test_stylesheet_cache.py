@@ -0,0 +1,97 @@
+"""
+Startup time to set the app stylesheet, with and without the stylesheet cache.
+"""
+
+import json
+import statistics
+
+import pytest
+
+from tests.libs.benchmark import report, summary
+from tests.libs.utils import run_python
+
+pytestmark = pytest.mark.performance
+
+SET_STYLESHEET = '''
+import json, sys, time
+from PySide6.QtWidgets import QApplication
+
+from src.show_dialog import Theme
+from src.show_dialog.ui.stylesheet import stylesheet_cache
+
+app = QApplication([])
+css = open('assets/stylesheets/style_02.css').read()
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'elapsed': elapsed, 'generated': 'qtpy.QtGui' in sys.modules}}))
+'''
+"""
+Time to set the app stylesheet in a new process, after ``QApplication`` is created and the
+package is imported.
+
+``qdarkstyle`` imports ``qtpy.QtGui`` only to generate the theme, not to register its icons.
+"""
+
+BOTH_THEMES = '''
+import qdarkstyle
+from qdarkstyle.dark.palette import DarkPalette
+from qdarkstyle.light.palette import LightPalette
+
+stylesheet = {
+    'Light': qdarkstyle.load_stylesheet(palette=LightPalette),
+    'Dark': qdarkstyle.load_stylesheet(palette=DarkPalette),
+}['Light']
+app.setStyleSheet(stylesheet + css)
+'''
+"""Behavior before the cache: both themes are generated."""
+
+CACHE = '''
+stylesheet_cache.get(Theme.Light, css).apply(app)
+'''
+
+RUNS = 5
+
+
+def _run(code: str, cache_dir, cache: bool) -> dict:
+    result = run_python(
+        '-c',
+        SET_STYLESHEET.format(code=code),
+        env={
+            'QT_QPA_PLATFORM': 'offscreen',
+            'SHOW_DIALOG_CACHE_DIR': str(cache_dir),
+            'SHOW_DIALOG_STYLESHEET_CACHE': str(cache),
+        },
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_stylesheet_cache(tmp_path):
+    both_themes = [_run(BOTH_THEMES, tmp_path, False) for _ in range(RUNS)]
+    no_cache = [_run(CACHE, tmp_path, False) for _ in range(RUNS)]
+    cold = []
+    for i in range(RUNS):
+        cache_dir = tmp_path / f'cold_{i}'
+        cold.append(_run(CACHE, cache_dir, True))
+    cache_files = list((tmp_path / 'cold_0').glob('*.qss'))
+    modified_times = [file.stat().st_mtime_ns for file in cache_files]
+    warm = [_run(CACHE, tmp_path / 'cold_0', True) for _ in range(RUNS)]
+
+    report(
+        'stylesheet_cache',
+        {
+            'both themes (previous behavior)': summary([r['elapsed'] for r in both_themes]),
+            'one theme, no disk cache': summary([r['elapsed'] for r in no_cache]),
+            'cold disk cache': summary([r['elapsed'] for r in cold]),
+            'warm disk cache': summary([r['elapsed'] for r in warm]),
+        },
+    )
+
+    # The file saved in the cold run is read, not written again, in the warm runs
+    assert len(cache_files) == 1
+    assert [file.stat().st_mtime_ns for file in cache_files] == modified_times
+    assert not any(r['generated'] for r in warm), 'Theme generated with a warm cache.'
+    assert statistics.median(r['elapsed'] for r in warm) < statistics.median(
+        r['elapsed'] for r in cold
+    )
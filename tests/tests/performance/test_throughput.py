@@ -0,0 +1,103 @@
+"""
+Dialogs per second and latency per dialog, from the call until the exit code is returned, with:
+
+* ``cli``: A new ``show_dialog`` process for each dialog, answered with ``--auto-answer``.
+* ``library``: ``show_dialog(mode='return')`` called repeatedly in one process, answered with
+  ``answers``.
+* ``ipc``: ``show_dialog(mode='return')`` called repeatedly in one process, each dialog passed by an
+  ``IpcClient`` sending ``PASS`` from another thread.
+
+The dialogs are built and shown on the ``offscreen`` Qt platform. The results include the app
+version, to compare them across releases when saved to ``SHOW_DIALOG_BENCHMARK_DIR``.
+"""
+
+import json
+
+import pytest
+from pytest_params import params
+
+from src.show_dialog import Answer, Answers, Inputs, __version__
+from tests.libs.benchmark import measure, report, summary
+from tests.libs.utils import free_port, run_python
+
+pytestmark = pytest.mark.performance
+
+DIALOGS = 20
+INPUTS = Inputs(title='Title', description='Description')
+ENV = {'QT_QPA_PLATFORM': 'offscreen'}
+
+SHOW_DIALOGS = '''
+import json, socket, threading, time
+from src.show_dialog import Answer, Answers, ExitCode, Inputs, show_dialog
+from src.show_dialog.ipc.client import IpcClient
+from src.show_dialog.ipc.ipc_params import IpcParams
+from src.show_dialog.ipc.message import Message, MessageType
+
+inputs = Inputs.from_json({inputs!r})
+ipc_params = IpcParams(host='127.0.0.1', port={port}, timeout=10) if {ipc} else None
+answers = None if {ipc} else Answers([Answer()])
+
+def send_pass():
+    while True:
+        try:
+            client = IpcClient(ipc_params)
+            break
+        except ConnectionRefusedError:  # Server not listening yet
+            time.sleep(0.001)
+    client.send(Message(MessageType.PASS))
+    client.close()
+
+durations = []
+for _ in range({dialogs}):
+    start = time.perf_counter()
+    if ipc_params:
+        threading.Thread(target=send_pass).start()
+    exit_code = show_dialog(inputs, ipc_params=ipc_params, answers=answers, mode='return')
+    durations.append(time.perf_counter() - start)
+    assert exit_code is ExitCode.Pass, exit_code
+print(json.dumps(durations))
+'''
+"""Show the dialogs in one process and print the duration of each. The first creates the app."""
+
+
+def _cli(tmp_path) -> list[float]:
+    answers_file = tmp_path / 'answers.yaml'
+    Answers([Answer()]).to_file(answers_file)
+
+    def run():
+        result = run_python(
+            '-m',
+            'src.show_dialog.main',
+            '--inputs',
+            INPUTS.to_json(),
+            '--auto-answer',
+            str(answers_file),
+            env=ENV,
+        )
+        assert result.returncode == 0, result.stderr
+
+    return measure(run, repeat=DIALOGS)
+
+
+def _in_process(ipc: bool) -> list[float]:
+    script = SHOW_DIALOGS.format(
+        inputs=INPUTS.to_json(), port=free_port(), ipc=ipc, dialogs=DIALOGS + 1
+    )
+    result = run_python('-c', script, env=ENV)
+    assert result.returncode == 0, result.stderr
+    durations = json.loads(result.stdout.strip().splitlines()[-1])
+    return durations[1:]  # Without creating the app
+
+
+@params('mode', [('cli', 'cli'), ('library', 'library'), ('ipc', 'ipc')])
+def test_throughput(mode: str, tmp_path):
+    durations = _cli(tmp_path) if mode == 'cli' else _in_process(ipc=mode == 'ipc')
+    report(
+        f'throughput_{mode}',
+        {
+            'version': __version__,
+            'dialogs': len(durations),
+            'dialogs_per_second': round(len(durations) / sum(durations), 2),
+            'latency': summary(durations),
+        },
+    )
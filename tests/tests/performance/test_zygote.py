@@ -0,0 +1,60 @@
+"""
+Dialogs per second: cold start vs launcher with the fork server (zygote) or with the daemon.
+
+Each dialog exits with a 1 second timeout, so the overhead is the time per dialog minus 1 second.
+"""
+
+import statistics
+import sys
+
+import pytest
+
+from tests.libs.benchmark import measure, report, summary
+from tests.libs.utils import free_port, run_python, run_python_server
+
+pytestmark = pytest.mark.performance
+
+INPUTS = '{"timeout": 1, "timeout_pass": true}'
+TIMEOUT = 1.0
+RUNS = 5
+
+
+def _show_dialog(module: str, env: dict[str, str]):
+    result = run_python('-m', module, '--inputs', INPUTS, env=env)
+    assert result.returncode == 0, result.stderr
+
+
+def _launcher_durations(*serve_args: str) -> list[float]:
+    env = {'QT_QPA_PLATFORM': 'offscreen', 'SHOW_DIALOG_DAEMON_PORT': str(free_port())}
+    with run_python_server(
+        '-m', 'src.show_dialog.main', '--serve', *serve_args, ready='listening', env=env
+    ):
+        return measure(lambda: _show_dialog('src.show_dialog.launcher', env), RUNS)
+
+
+def _results(durations: list[float]) -> dict:
+    median = statistics.median(durations)
+    return summary(durations) | {
+        'dialogs_per_second': round(1 / median, 3),
+        'overhead_ms': round((median - TIMEOUT) * 1000, 3),
+    }
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Linux only.')
+def test_zygote():
+    cold = measure(
+        lambda: _show_dialog('src.show_dialog.main', {'QT_QPA_PLATFORM': 'offscreen'}), RUNS
+    )
+    fork_server = _launcher_durations('--fork')
+    daemon = _launcher_durations()
+
+    report(
+        'zygote',
+        {
+            'cold start': _results(cold),
+            'launcher with fork server': _results(fork_server),
+            'launcher with daemon': _results(daemon),
+        },
+    )
+
+    assert statistics.median(fork_server) < statistics.median(cold)
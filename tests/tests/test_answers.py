@@ -0,0 +1,58 @@
+from pytest_params import params
+
+from src.show_dialog import Answer, Answers, ExitCode, Inputs
+from src.show_dialog.answers import NO_ANSWER
+from tests.libs.config import TEST_ASSETS_DIR
+
+
+def test_from_file():
+    answers = Answers.from_file(TEST_ASSETS_DIR / 'answers/answers_01.yaml')
+    assert answers == Answers(
+        [
+            Answer(ExitCode.Fail, title='Step 2'),
+            Answer(ExitCode.Pass, dialog_title='sequence_01'),
+        ]
+    )
+    assert answers.build_dialog
+
+
+@params('exit_code', [('name', 'Timeout'), ('value', 4)])
+def test_exit_code(exit_code):
+    answer = Answers.from_dict({'answers': [{'exit_code': exit_code}]}).answers[0]
+    assert answer.exit_code is ExitCode.Timeout
+    assert answer.to_dict()['exit_code'] == 'Timeout'
+
+
+@params(
+    'inputs, expected_exit_code',
+    [
+        ('title', Inputs(title='foo'), ExitCode.Fail),
+        ('dialog title', Inputs(dialog_title='foo'), ExitCode.Cancel),
+        ('hash', Inputs(title='bar', timeout=5), ExitCode.Timeout),
+        ('first match', Inputs(title='foo', dialog_title='foo'), ExitCode.Fail),
+        ('no match', Inputs(title='bar'), ExitCode.Unknown),
+    ],
+)
+def test_answer(inputs: Inputs, expected_exit_code: ExitCode):
+    answers = Answers(
+        [
+            Answer(ExitCode.Fail, title='foo'),
+            Answer(ExitCode.Cancel, dialog_title='foo'),
+            Answer(ExitCode.Timeout, inputs_hash=Inputs(title='bar', timeout=5).content_hash()[:8]),
+        ]
+    )
+    assert answers.answer(inputs).exit_code is expected_exit_code
+
+
+def test_answer_any_inputs(caplog):
+    answers = Answers([Answer(ExitCode.Pass, delay=1)])
+    assert answers.answer(Inputs(title='foo')) == Answer(ExitCode.Pass, delay=1)
+    assert Answers().answer(Inputs(title='foo')) is NO_ANSWER
+    assert 'No answer for the inputs with title `foo`' in caplog.text
+
+
+def test_answer_times():
+    answers = Answers([Answer(ExitCode.Fail, times=2), Answer(ExitCode.Pass)])
+    exit_codes = [answers.answer(Inputs(title='foo')).exit_code for _ in range(4)]
+    assert exit_codes == [ExitCode.Fail, ExitCode.Fail, ExitCode.Pass, ExitCode.Pass]
+    assert '_used' not in answers.to_dict()
@@ -0,0 +1,96 @@
+import asyncio
+import time
+
+import pytest
+from PySide6.QtCore import QTimer
+
+from src.show_dialog import DialogRuntime, ExitCode, Inputs, QtEventLoopPolicy, show_dialog_async
+from src.show_dialog.ui.show_dialog import ShowDialog
+from tests.libs.fixtures import app  # noqa: F401
+
+
+@pytest.fixture
+def qt_policy():
+    asyncio.set_event_loop_policy(QtEventLoopPolicy())
+    yield
+    asyncio.set_event_loop_policy(None)
+
+
+def _visible_dialogs(app) -> list[ShowDialog]:
+    return [w for w in app.topLevelWidgets() if isinstance(w, ShowDialog) and w.isVisible()]
+
+
+async def _exit_dialog(app, title: str, exit_code: ExitCode, delay: float = 0.01):
+    await asyncio.sleep(delay)
+    next(d for d in _visible_dialogs(app) if d.title_label.text() == title).exit(exit_code)
+
+
+def test_gather(app, qt_policy):
+    async def main():
+        return await asyncio.gather(
+            show_dialog_async(Inputs(title='foo')),
+            show_dialog_async(Inputs(title='bar')),
+            _exit_dialog(app, 'bar', ExitCode.Fail),
+            _exit_dialog(app, 'foo', ExitCode.Pass, delay=0.05),
+        )
+
+    assert asyncio.run(main())[:2] == [ExitCode.Pass, ExitCode.Fail]
+
+
+def test_wait_for_timeout(app, qt_policy):
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(show_dialog_async(Inputs()), 0.05)
+        assert not _visible_dialogs(app)
+
+    asyncio.run(main())
+
+
+def test_runtime(app, qt_policy):
+    async def main():
+        with DialogRuntime(pool_size=0) as runtime:
+            asyncio.create_task(_exit_dialog(app, 'foo', ExitCode.Pass))
+            assert await show_dialog_async(Inputs(title='foo'), runtime=runtime) is ExitCode.Pass
+            assert asyncio.get_running_loop()._runtime is None
+
+    asyncio.run(main())
+
+
+def test_qt_events_while_waiting(app, qt_policy):
+    """Qt events are processed while ``asyncio`` waits, ``asyncio`` timers are not delayed."""
+    called = []
+
+    async def main():
+        QTimer.singleShot(0, lambda: called.append(True))
+        start = time.perf_counter()
+        await asyncio.sleep(0.05)
+        return time.perf_counter() - start
+
+    assert asyncio.run(main()) < 0.5
+    assert called
+
+
+def test_streams(app, qt_policy):
+    """Sockets wake the loop while waiting in Qt."""
+
+    async def main():
+        async def echo(reader, writer):
+            writer.write(await reader.readline())
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(echo, 'localhost', 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('localhost', port)
+        writer.write(b'foo\n')
+        line = await asyncio.wait_for(reader.readline(), 5)
+        writer.close()
+        server.close()
+        return line
+
+    assert asyncio.run(main()) == b'foo\n'
+
+
+def test_requires_qt_event_loop():
+    with pytest.raises(RuntimeError):
+        asyncio.run(show_dialog_async(Inputs()))
@@ -0,0 +1,50 @@
+from pytest_params import params
+
+from tests.libs.utils import run_python
+
+
+@params(
+    'code',
+    [
+        ('import package', 'import src.show_dialog'),
+        ('inputs', 'import src.show_dialog as sd; sd.Inputs(title="foo")'),
+        ('data classes', 'from src.show_dialog import Buttons, DataFileType, ExitCode, Theme'),
+        ('main module', 'import src.show_dialog.main'),
+        ('launcher module', 'import src.show_dialog.launcher'),
+        ('markdown renderer', 'import src.show_dialog.markdown_renderer'),
+        (
+            'dialog runtime',
+            'from src.show_dialog import DialogRuntime, open_dialog; DialogRuntime()',
+        ),
+        ('asyncio', 'from src.show_dialog import QtEventLoopPolicy, show_dialog_async'),
+    ],
+)
+def test_data_only_imports_do_not_load_qt(code):
+    result = run_python('-c', f'{code}\nimport sys\nassert "PySide6" not in sys.modules')
+    assert result.returncode == 0, result.stderr
+
+
+def test_lazy_attribute():
+    import src.show_dialog
+    from src.show_dialog.ui.show_dialog import ShowDialog
+
+    assert src.show_dialog.ShowDialog is ShowDialog
+    assert set(src.show_dialog.__all__) <= set(dir(src.show_dialog))
+
+
+def test_unknown_attribute():
+    import src.show_dialog
+
+    assert not hasattr(src.show_dialog, 'foo')
+
+
+def test_dialog_without_markdown_does_not_load_markdown():
+    code = (
+        'from PySide6.QtWidgets import QApplication\n'
+        'from src.show_dialog import Inputs, ShowDialog\n'
+        'ShowDialog(QApplication(), Inputs(description="foo"))\n'
+        'import sys\n'
+        'assert "markdown" not in sys.modules'
+    )
+    result = run_python('-c', code, env={'QT_QPA_PLATFORM': 'offscreen'})
+    assert result.returncode == 0, result.stderr
@@ -88,11 +88,37 @@ class TestInputs:
         inputs_instance_2 = Inputs.from_file(file)
         assert inputs_instance == inputs_instance_2
 
+    @params(
+        'file_name, dump, expected_count',
+        [
+            ('json list', 'test.json', json.dumps, 2),
+            ('yaml list', 'test.yaml', yaml.safe_dump, 2),
+            ('yaml documents', 'test.yaml', yaml.safe_dump_all, 2),
+            ('one inputs', 'test.yaml', lambda steps: yaml.safe_dump(steps[0]), 1),
+        ],
+    )
+    def test_list_from_file(self, tmp_path, file_name, dump, expected_count):
+        steps = [{'title': 'Foo'}, {'title': 'Bar', 'timeout': 5}]
+        file = tmp_path / file_name
+        file.write_text(dump(steps))
+
+        all_inputs = Inputs.list_from_file(file)
+        assert all_inputs == [Inputs.from_dict(step) for step in steps[:expected_count]]
+
     def test_from_file_invalid(self, tmp_path, inputs_instance):
         file = tmp_path / 'foo.bar'
         with pytest.raises(ValueError):
             Inputs.from_file(file)
 
+    def test_content_hash(self, tmp_path):
+        inputs = Inputs(title='Foo', timeout=5)
+        inputs.to_file(tmp_path / 'inputs.yaml')
+
+        assert Inputs.from_file(tmp_path / 'inputs.yaml').content_hash() == inputs.content_hash()
+        assert Inputs(title='Foo').content_hash() != inputs.content_hash()
+        # Not part of the content
+        assert Inputs(title='Foo', timeout=5, priority=3).content_hash() == inputs.content_hash()
+
     def test_create(self):
         base = Inputs(title='Foo', description='Bar')
         new = base.create(Inputs(description='Baz', dialog_title='qux'))
@@ -0,0 +1,30 @@
+from src.show_dialog import ExitCode, Inputs, Style
+from src.show_dialog.ipc.ipc_params import IpcParams
+from src.show_dialog.launcher import LaunchRequest, LaunchResponse
+from tests.libs.utils import free_port, run_python
+
+
+def test_request_json():
+    request = LaunchRequest(
+        Inputs(title='foo', timeout=5),
+        style=Style.Style01,
+        ipc_params=IpcParams(host='localhost', port=1234, timeout=5),
+    )
+    assert LaunchRequest.from_json(request.to_json()) == request
+
+
+def test_response_json():
+    response = LaunchResponse.from_json(LaunchResponse(ExitCode.Timeout).to_json())
+    assert response.exit_code is ExitCode.Timeout
+
+
+def test_launcher_without_daemon():
+    """Without a daemon, the dialog is shown in the launcher process, with the same exit code."""
+    result = run_python(
+        '-m',
+        'src.show_dialog.launcher',
+        '--inputs',
+        '{"timeout": 1}',
+        env={'QT_QPA_PLATFORM': 'offscreen', 'SHOW_DIALOG_DAEMON_PORT': str(free_port())},
+    )
+    assert result.returncode == ExitCode.Timeout, result.stderr
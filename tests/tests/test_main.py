@@ -0,0 +1,180 @@
+from pytest_params import params
+
+from src.show_dialog import Answers, ExitCode, ExitSource, load_records
+from tests.libs.config import TEST_ASSETS_DIR
+from tests.libs.utils import run_python
+
+RUN_MAIN_WITHOUT_QT = '''
+import sys
+from src.show_dialog.main import main
+sys.argv = ['show_dialog', *{args!r}]
+try:
+    main()
+finally:
+    assert 'PySide6' not in sys.modules, 'Qt was imported.'
+'''
+"""Run ``main()`` with the given arguments and fail if Qt is imported."""
+
+INPUTS_FILE = str(TEST_ASSETS_DIR / 'inputs/inputs_02.yaml')
+SEQUENCE_FILE = str(TEST_ASSETS_DIR / 'inputs/sequence_01.yaml')
+ANSWERS_FILE = str(TEST_ASSETS_DIR / 'answers/answers_01.yaml')
+IPC_JSON = '{"host": "localhost", "port": 12345, "timeout": 5}'
+
+
+@params(
+    'args, expected_exit_code',
+    [
+        ('version', ['--version'], 0),
+        ('help', ['--help'], 0),
+        ('unknown argument', ['--foo'], 2),
+        ('inputs', ['--inputs', '{"title": "foo"}', '--validate-only'], 0),
+        ('inputs file', ['--inputs-file', INPUTS_FILE, '--validate-only'], 0),
+        ('inputs and ipc', ['--inputs', '{}', '--ipc', IPC_JSON, '--validate-only'], 0),
+        ('sequence', ['--inputs-file', SEQUENCE_FILE, '--stop-on', 'never', '--validate-only'], 0),
+        (
+            'sequence and ipc',
+            ['--inputs-file', SEQUENCE_FILE, '--ipc', IPC_JSON, '--validate-only'],
+            1,
+        ),
+        ('invalid stop policy', ['--inputs', '{}', '--stop-on', 'foo', '--validate-only'], 2),
+        ('answers', ['--inputs', '{}', '--auto-answer', ANSWERS_FILE, '--validate-only'], 0),
+        (
+            'answers and replay',
+            ['--inputs', '{}', '--auto-answer', ANSWERS_FILE, '--replay', ANSWERS_FILE],
+            1,
+        ),
+        (
+            'answers not found',
+            ['--inputs', '{}', '--auto-answer', 'foo.yaml', '--validate-only'],
+            1,
+        ),
+        (
+            'included stylesheet',
+            ['--inputs', '{}', '--stylesheet', ':/stylesheets/style_01.css', '--validate-only'],
+            0,
+        ),
+        ('no inputs', ['--validate-only'], 1),
+        ('invalid inputs json', ['--inputs', '{"title": }', '--validate-only'], 1),
+        ('invalid inputs value', ['--inputs', '{"timeout": "foo"}', '--validate-only'], 1),
+        ('inputs file not found', ['--inputs-file', 'foo.yaml', '--validate-only'], 1),
+        ('invalid ipc', ['--inputs', '{}', '--ipc', '{"host": "foo"}', '--validate-only'], 1),
+        ('hidden', ['--inputs', '{}', '--ipc', IPC_JSON, '--hidden', '--validate-only'], 0),
+        ('hidden without ipc', ['--inputs', '{}', '--hidden', '--validate-only'], 1),
+        ('dashboard without serve', ['--inputs', '{}', '--dashboard', '--validate-only'], 2),
+        ('fork without serve', ['--inputs', '{}', '--fork', '--validate-only'], 2),
+        ('dashboard with fork', ['--serve', '--fork', '--dashboard'], 2),
+        (
+            'stylesheet not found',
+            ['--inputs', '{}', '--stylesheet', 'foo.css', '--validate-only'],
+            1,
+        ),
+        (
+            'resource stylesheet not found',
+            ['--inputs', '{}', '--stylesheet', ':/stylesheets/foo.css', '--validate-only'],
+            1,
+        ),
+    ],
+)
+def test_main_without_qt(args: list[str], expected_exit_code: int):
+    result = run_python('-c', RUN_MAIN_WITHOUT_QT.format(args=args))
+    assert result.returncode == expected_exit_code, result.stderr
+    assert 'Qt was imported.' not in result.stderr
+
+
+@params(
+    'args',
+    [
+        ('default', []),
+        ('fast exit', ['--fast-exit']),
+    ],
+)
+def test_main_exit_code(args: list[str], tmp_path):
+    trace_file = tmp_path / 'trace.json'
+    result = run_python(
+        '-m',
+        'src.show_dialog.main',
+        '--inputs',
+        '{"timeout": 1}',
+        '--startup-trace',
+        str(trace_file),
+        *args,
+        env={'QT_QPA_PLATFORM': 'offscreen'},
+    )
+    assert result.returncode == ExitCode.Timeout, result.stderr
+    # Output is written before exiting
+    assert 'Error: 4 - Timeout' in result.stderr
+    assert trace_file.is_file()
+
+
+def test_main_sequence():
+    """Steps time out, the sequence stops at the first one."""
+    result = run_python(
+        '-m',
+        'src.show_dialog.main',
+        '--inputs-file',
+        SEQUENCE_FILE,
+        '--inputs',
+        '{"timeout": 1}',
+        env={'QT_QPA_PLATFORM': 'offscreen'},
+    )
+    assert result.returncode == ExitCode.Timeout, result.stderr
+    assert 'Steps exit codes: Timeout\n' in result.stderr
+
+
+@params(
+    'build_dialog',
+    [('dialog', True), ('without dialog', False)],
+)
+def test_main_auto_answer(build_dialog: bool, tmp_path):
+    answers_file = tmp_path / 'answers.yaml'
+    answers = Answers.from_file(ANSWERS_FILE)
+    Answers(answers.answers, build_dialog=build_dialog).to_file(answers_file)
+    args = [
+        '--inputs-file',
+        SEQUENCE_FILE,
+        '--stop-on',
+        'never',
+        '--auto-answer',
+        str(answers_file),
+    ]
+    # Qt platform is set to `offscreen`
+    if build_dialog:
+        result = run_python('-m', 'src.show_dialog.main', *args, env={'QT_QPA_PLATFORM': ''})
+    else:
+        result = run_python('-c', RUN_MAIN_WITHOUT_QT.format(args=args))
+
+    assert result.returncode == ExitCode.Fail, result.stderr
+    assert 'Steps exit codes: Pass, Fail, Pass\n' in result.stderr
+
+
+def test_main_record_replay(tmp_path):
+    record_file = tmp_path / 'session.jsonl'
+    args = ['--inputs-file', SEQUENCE_FILE, '--stop-on', 'never']
+    result = run_python(
+        '-m',
+        'src.show_dialog.main',
+        *args,
+        '--auto-answer',
+        ANSWERS_FILE,
+        '--record',
+        str(record_file),
+        env={'QT_QPA_PLATFORM': ''},
+    )
+    assert result.returncode == ExitCode.Fail, result.stderr
+    records = load_records(record_file)
+    assert [record.exit_code for record in records] == [ExitCode.Pass, ExitCode.Fail, ExitCode.Pass]
+    assert {record.source for record in records} == {ExitSource.ANSWER}
+
+    # Replayed without the answers file, from the recording
+    result = run_python(
+        '-m',
+        'src.show_dialog.main',
+        *args,
+        '--replay',
+        str(record_file),
+        '--replay-speed',
+        '0',
+        env={'QT_QPA_PLATFORM': ''},
+    )
+    assert result.returncode == ExitCode.Fail, result.stderr
+    assert 'Steps exit codes: Pass, Fail, Pass\n' in result.stderr
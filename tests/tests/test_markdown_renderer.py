@@ -0,0 +1,54 @@
+from unittest.mock import patch
+
+import markdown
+import pytest
+from pytest_params import params
+
+from src.show_dialog.markdown_renderer import MarkdownRenderer
+
+
+@pytest.fixture
+def renderer() -> MarkdownRenderer:
+    return MarkdownRenderer(cache_size=2)
+
+
+@params(
+    'text, extensions',
+    [
+        ('title and text', '# Title\ntext', []),
+        ('without nl2br', 'line1\nline2', []),
+        ('with nl2br', 'line1\nline2', ['nl2br']),
+    ],
+)
+def test_render(renderer, text: str, extensions: list[str]):
+    assert renderer.render(text, extensions) == markdown.markdown(text, extensions=extensions)
+
+
+def test_converter_per_extensions(renderer):
+    assert renderer.converter() is renderer.converter([])
+    assert renderer.converter(['nl2br']) is renderer.converter(('nl2br',))
+    assert renderer.converter() is not renderer.converter(['nl2br'])
+
+
+def test_reset_between_renders(renderer):
+    """State from a previous text, ex reference links, is not used."""
+    renderer.render('[foo]: https://example.com')
+    assert 'href' not in renderer.render('[foo][]')
+
+
+def test_cache(renderer):
+    with patch('markdown.Markdown.convert', return_value='html') as convert_mock:
+        renderer.render('foo')
+        renderer.render('foo')
+        renderer.render('foo', ['nl2br'])
+
+    assert convert_mock.call_count == 2
+
+
+def test_cache_least_recently_used(renderer):
+    with patch('markdown.Markdown.convert', return_value='html') as convert_mock:
+        for text in ['foo', 'bar', 'foo', 'baz', 'foo', 'bar']:
+            renderer.render(text)
+
+    # `bar` is discarded when `baz` is rendered
+    assert [call.args[0] for call in convert_mock.call_args_list] == ['foo', 'bar', 'baz', 'bar']
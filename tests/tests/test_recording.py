@@ -0,0 +1,74 @@
+import json
+from unittest.mock import patch
+
+from pytest_params import params
+
+from src.show_dialog import ExitCode, ExitSource, Inputs, Record, load_records, replay_answers
+from src.show_dialog.recording import append_record, record_dialog
+
+
+def test_append_record(tmp_path):
+    file = tmp_path / 'session.jsonl'
+    records = [
+        Record(Inputs(title='foo', timeout=5), ExitCode.Pass, ExitSource.BUTTON, 1.5, 10),
+        Record(Inputs(title='bar'), ExitCode.Timeout, ExitSource.TIMEOUT, 5),
+    ]
+    for record in records:
+        append_record(record, file)
+
+    lines = file.read_text().splitlines()
+    assert json.loads(lines[0]) == {
+        'inputs': {'title': 'foo', 'timeout': 5},
+        'exit_code': 'Pass',
+        'source': 'button',
+        'duration': 1.5,
+        'time': 10,
+    }
+    assert ' ' not in lines[1]
+    assert load_records(file) == records
+
+
+def test_record_dialog(tmp_path):
+    file = tmp_path / 'session.jsonl'
+    record_dialog(Inputs(title='foo'), ExitCode.Pass, ExitSource.API, 1)
+    assert not file.exists()
+
+    with patch('src.show_dialog.config.RECORD_FILE', str(file)):
+        record_dialog(Inputs(title='foo'), ExitCode.Fail, ExitSource.IPC, 1.23456)
+    [record] = load_records(file)
+    assert (record.exit_code, record.source, record.duration) == (
+        ExitCode.Fail,
+        ExitSource.IPC,
+        1.235,
+    )
+
+
+def test_record_dialog_error(tmp_path, caplog):
+    with patch('src.show_dialog.config.RECORD_FILE', str(tmp_path)):
+        record_dialog(Inputs(title='foo'), ExitCode.Pass, ExitSource.API, 1)
+    assert 'Error recording the dialog' in caplog.text
+
+
+@params(
+    'speed, expected_delays',
+    [('recorded', 1, [2, 1, 4]), ('faster', 4, [0.5, 0.25, 1]), ('no delay', 0, [0, 0, 0])],
+)
+def test_replay_answers(speed: float, expected_delays: list[float], tmp_path):
+    file = tmp_path / 'session.jsonl'
+    foo, bar = Inputs(title='foo'), Inputs(title='bar')
+    for inputs, exit_code, duration in [
+        (foo, ExitCode.Fail, 2),
+        (bar, ExitCode.Pass, 1),
+        (foo, ExitCode.Pass, 4),
+    ]:
+        append_record(Record(inputs, exit_code, ExitSource.BUTTON, duration), file)
+
+    answers = replay_answers(file, speed=speed)
+    assert [answer.delay for answer in answers.answers] == expected_delays
+    # Same inputs are answered in the order recorded
+    assert [answers.answer(inputs).exit_code for inputs in [foo, foo, bar, foo]] == [
+        ExitCode.Fail,
+        ExitCode.Pass,
+        ExitCode.Pass,
+        ExitCode.Unknown,
+    ]
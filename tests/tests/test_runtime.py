@@ -0,0 +1,290 @@
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+
+import pytest
+from PySide6.QtCore import QTimer
+from pytest_params import params
+
+from src.show_dialog import (
+    Answer,
+    Answers,
+    Buttons,
+    DialogRuntime,
+    ExitCode,
+    Inputs,
+    StopPolicy,
+    Style,
+    open_dialog,
+)
+from src.show_dialog.ui.show_dialog import ShowDialog
+from tests.libs.fixtures import app  # noqa: F401
+
+
+def _exit_dialog(app, exit_code: ExitCode):
+    """Exit the dialog with ``exit_code`` once it's shown."""
+
+    def exit_dialog():
+        dialog = next(
+            w for w in app.topLevelWidgets() if isinstance(w, ShowDialog) and w.isVisible()
+        )
+        dialog.exit(exit_code)
+
+    QTimer.singleShot(0, exit_dialog)
+
+
+def test_show(app):
+    with DialogRuntime(style=Style.Style01) as runtime:
+        for exit_code in [ExitCode.Pass, ExitCode.Fail, ExitCode.Cancel]:
+            _exit_dialog(app, exit_code)
+            assert runtime.show(Inputs(title='foo')) is exit_code
+
+
+def test_show_deletes_dialogs(app):
+    with DialogRuntime() as runtime:
+        for _ in range(3):
+            _exit_dialog(app, ExitCode.Pass)
+            runtime.show(Inputs())
+    assert not [w for w in app.topLevelWidgets() if isinstance(w, ShowDialog)]
+
+
+def test_default_style(app):
+    with DialogRuntime() as runtime:
+        assert runtime.style is Style.Style02
+        assert runtime.stylesheet is None
+
+
+def test_quit_on_last_window_closed(app):
+    app.setQuitOnLastWindowClosed(True)
+    with DialogRuntime():
+        assert not app.quitOnLastWindowClosed()
+    assert app.quitOnLastWindowClosed()
+
+
+def test_show_not_running(app):
+    runtime = DialogRuntime()
+    with pytest.raises(RuntimeError):
+        runtime.show(Inputs())
+    with runtime:
+        pass
+    with pytest.raises(RuntimeError):
+        runtime.show(Inputs())
+
+
+def test_open(app):
+    """Several dialogs are open, exiting one doesn't close the others."""
+    with DialogRuntime() as runtime:
+        futures = [runtime.open(Inputs(title=str(i))) for i in range(3)]
+        dialogs = list(runtime.dialogs)
+        assert all(dialog.isVisible() for dialog in dialogs)
+        assert not any(future.done() for future in futures)
+
+        dialogs[1].fail_clicked(ExitCode.Fail)
+        assert futures[1].result() is ExitCode.Fail
+        assert not futures[0].done() and not futures[2].done()
+        assert dialogs[0].isVisible() and dialogs[2].isVisible()
+
+        QTimer.singleShot(0, dialogs[2].pass_clicked)
+        assert runtime.wait([futures[2]])
+        assert futures[2].result() is ExitCode.Pass
+        assert not futures[0].done()
+
+        dialogs[0].close()
+        assert futures[0].result() is ExitCode.Cancel
+        assert not runtime.dialogs
+
+
+def test_wait_all(app):
+    with DialogRuntime() as runtime:
+        futures = [runtime.open(Inputs()) for _ in range(2)]
+        for dialog in runtime.dialogs:
+            QTimer.singleShot(0, dialog.pass_clicked)
+        assert runtime.wait()
+        assert [future.result() for future in futures] == [ExitCode.Pass, ExitCode.Pass]
+
+
+def test_wait_timeout(app):
+    with DialogRuntime() as runtime:
+        future = runtime.open(Inputs())
+        assert not runtime.wait(timeout=0.1)
+        assert not future.done()
+
+
+def test_wait_timeout_done_later(app, caplog):
+    """A future done after the wait timed out, and the runtime exited, is ignored."""
+    future: Future[None] = Future()
+    with DialogRuntime() as runtime:
+        assert not runtime.wait([future], timeout=0.01)
+    future.set_result(None)  # Errors in the done callbacks are logged
+
+    assert not caplog.records
+
+
+def test_exit_cancels_open_dialogs(app):
+    with DialogRuntime() as runtime:
+        future = runtime.open(Inputs())
+    assert future.result() is ExitCode.Cancel
+
+
+def test_pool(app):
+    """Dialogs are reused, ex one with a fail button as one without."""
+    with DialogRuntime(pool_size=1) as runtime:
+        dialog = runtime._pool[0]
+        future = runtime.open(Inputs(title='foo'))
+        assert list(runtime.dialogs) == [dialog]
+        dialog.fail_clicked(ExitCode.Fail)
+        assert future.result() is ExitCode.Fail
+        assert runtime._pool == [dialog]
+
+        future = runtime.open(Inputs(title='bar', buttons=Buttons.OK))
+        assert list(runtime.dialogs) == [dialog]
+        assert dialog.title_label.text() == 'bar'
+        assert dialog.fail_button is None
+        # The pool is empty, a new dialog is created
+        runtime.open(Inputs())
+        assert len(runtime.dialogs) == 2
+    assert not runtime._pool
+
+
+def test_no_pool(app):
+    with DialogRuntime(pool_size=0) as runtime:
+        _exit_dialog(app, ExitCode.Pass)
+        runtime.show(Inputs())
+        assert not runtime._pool
+
+
+def _visible_dialogs(app) -> list[ShowDialog]:
+    return [w for w in app.topLevelWidgets() if isinstance(w, ShowDialog) and w.isVisible()]
+
+
+def test_open_dialog_from_threads(app):
+    """Worker threads open dialogs and wait for them, the GUI thread runs the event loop."""
+    # Pass the dialogs as they're shown
+    timer = QTimer()
+    timer.timeout.connect(lambda: [dialog.pass_clicked() for dialog in _visible_dialogs(app)])
+    timer.start(10)
+    with DialogRuntime() as runtime, ThreadPoolExecutor(4) as executor:
+        jobs = [
+            executor.submit(lambda i: open_dialog(Inputs(title=str(i))).result(timeout=10), i)
+            for i in range(8)
+        ]
+        assert runtime.wait(jobs, timeout=10)
+    timer.stop()
+    assert [job.result() for job in jobs] == [ExitCode.Pass] * 8
+
+
+def test_dialog_handle(app):
+    with DialogRuntime() as runtime:
+        handle = open_dialog(Inputs(title='foo'))
+        assert [dialog.title_label.text() for dialog in _visible_dialogs(app)] == ['foo']
+        assert not handle.done()
+        assert not handle.wait(0.01)
+        with pytest.raises(TimeoutError):
+            handle.result(0.01)
+
+        _exit_dialog(app, ExitCode.Fail)
+        assert handle.result() is ExitCode.Fail
+        assert handle.done()
+        assert not handle.cancel()
+        assert handle.runtime is runtime
+
+
+def test_dialog_handle_cancel(app):
+    with DialogRuntime(), ThreadPoolExecutor(1) as executor:
+        # Opened from another thread, shown when the GUI thread runs the event loop
+        handle = executor.submit(open_dialog, Inputs()).result()
+        assert handle.cancel()
+        with pytest.raises(CancelledError):
+            handle.result()
+        assert not _visible_dialogs(app)
+
+        handle = open_dialog(Inputs())
+        assert handle.cancel()
+        assert handle.result() is ExitCode.Cancel
+
+
+def test_dialog_handle_wait_in_thread(app):
+    with DialogRuntime(), ThreadPoolExecutor(1) as executor:
+        handle = open_dialog(Inputs())
+        assert not executor.submit(handle.wait, 0.01).result()
+        handle.cancel()
+        assert executor.submit(handle.wait, 0.01).result()
+
+
+def test_running_nested(app):
+    """The outer runtime is running again after each inner runtime exits."""
+    with DialogRuntime() as outer:
+        for _ in range(2):
+            with DialogRuntime() as inner:
+                assert DialogRuntime.running is inner
+            assert DialogRuntime.running is outer
+    assert DialogRuntime.running is None
+
+
+def test_open_dialog_not_running(app):
+    with pytest.raises(RuntimeError):
+        open_dialog(Inputs())
+
+
+def _exit_steps(app, exit_codes: list[ExitCode]) -> list[ShowDialog]:
+    """Exit the steps of a sequence with ``exit_codes``. Returns the dialog shown in each step."""
+    dialogs = []
+
+    def exit_step():
+        dialog = _visible_dialogs(app)[0]
+        dialogs.append(dialog)
+        exit_code = exit_codes[len(dialogs) - 1]
+        if len(dialogs) < len(exit_codes):
+            QTimer.singleShot(0, exit_step)
+        dialog.exit(exit_code)
+
+    QTimer.singleShot(0, exit_step)
+    return dialogs
+
+
+def test_show_sequence(app):
+    all_inputs = [Inputs(title='1'), Inputs(title='2', buttons=Buttons.OK), Inputs(title='3')]
+    with DialogRuntime() as runtime:
+        dialogs = _exit_steps(app, [ExitCode.Pass, ExitCode.Pass, ExitCode.Fail])
+        assert runtime.show_sequence(all_inputs) == [ExitCode.Pass, ExitCode.Pass, ExitCode.Fail]
+        # One window, updated in place
+        assert len(set(dialogs)) == 1
+        assert not _visible_dialogs(app)
+
+
+@params(
+    'stop_policy, exit_codes, expected_exit_codes',
+    [
+        ('fail', StopPolicy.FAIL, [ExitCode.Fail], [ExitCode.Fail]),
+        (
+            'cancel',
+            StopPolicy.CANCEL,
+            [ExitCode.Fail, ExitCode.Cancel],
+            [ExitCode.Fail, ExitCode.Cancel],
+        ),
+        ('never', StopPolicy.NEVER, [ExitCode.Cancel] * 3, [ExitCode.Cancel] * 3),
+    ],
+)
+def test_show_sequence_stop_policy(app, stop_policy, exit_codes, expected_exit_codes):
+    with DialogRuntime() as runtime:
+        _exit_steps(app, exit_codes)
+        assert runtime.show_sequence([Inputs()] * 3, stop_policy=stop_policy) == expected_exit_codes
+
+
+def test_show_sequence_window_closed(app):
+    """A step is cancelled by closing the window, which is shown again for the next step."""
+
+    def close_window():
+        _visible_dialogs(app)[0].close()
+        QTimer.singleShot(0, lambda: _visible_dialogs(app)[0].pass_clicked())
+
+    with DialogRuntime() as runtime:
+        QTimer.singleShot(0, close_window)
+        exit_codes = runtime.show_sequence([Inputs()] * 2, stop_policy=StopPolicy.NEVER)
+        assert exit_codes == [ExitCode.Cancel, ExitCode.Pass]
+
+
+def test_answers(app):
+    answers = Answers([Answer(ExitCode.Fail, title='2'), Answer(ExitCode.Pass)])
+    with DialogRuntime(answers=answers) as runtime:
+        assert runtime.show(Inputs(title='1')) is ExitCode.Pass
+        all_inputs = [Inputs(title='1'), Inputs(title='2'), Inputs(title='3')]
+        assert runtime.show_sequence(all_inputs) == [ExitCode.Pass, ExitCode.Fail]
@@ -0,0 +1,120 @@
+from unittest.mock import Mock
+
+from src.show_dialog import DialogScheduler, ExitCode, Inputs
+
+
+class FakeDialogs:
+    """Shows the dialogs as a list, in the order they're shown."""
+
+    def __init__(self):
+        self.shown: list[str] = []
+        self._exit: dict[str, object] = {}
+
+    def show(self, title: str):
+        def _show(done):
+            self.shown.append(title)
+            self._exit[title] = done
+            return lambda: self.exit(title, ExitCode.Cancel)
+
+        return _show
+
+    def exit(self, title: str, exit_code: ExitCode):
+        self._exit.pop(title)(exit_code)  # type: ignore[operator]
+
+    @property
+    def visible(self) -> list[str]:
+        return list(self._exit)
+
+
+def _submit(scheduler: DialogScheduler, dialogs: FakeDialogs, title: str, priority: int = 0):
+    on_exit = Mock()
+    withdraw = scheduler.submit(
+        Inputs(title=title, priority=priority), on_exit, dialogs.show(title)
+    )
+    return on_exit, withdraw
+
+
+def test_max_visible_and_priority():
+    scheduler, dialogs = DialogScheduler(max_visible=2), FakeDialogs()
+    for title, priority in [('a', 0), ('b', 0), ('c', 0), ('d', 5), ('e', -1), ('f', 5)]:
+        _submit(scheduler, dialogs, title, priority)
+    assert dialogs.visible == ['a', 'b']
+    assert scheduler.queued == 4
+
+    for title in ['a', 'b', 'd', 'f', 'c']:
+        dialogs.exit(title, ExitCode.Pass)
+    assert dialogs.shown == ['a', 'b', 'd', 'f', 'c', 'e']
+    assert scheduler.visible == 1
+
+
+def test_no_limit():
+    scheduler, dialogs = DialogScheduler(max_visible=0), FakeDialogs()
+    for title in 'abc':
+        _submit(scheduler, dialogs, title)
+    assert dialogs.visible == ['a', 'b', 'c']
+
+
+def test_merge():
+    scheduler, dialogs = DialogScheduler(max_visible=1), FakeDialogs()
+    on_exit_a1, _ = _submit(scheduler, dialogs, 'a')
+    on_exit_b1, _ = _submit(scheduler, dialogs, 'b')
+    on_exit_c, _ = _submit(scheduler, dialogs, 'c', priority=1)
+    on_exit_a2, _ = _submit(scheduler, dialogs, 'a')  # Shown
+    on_exit_b2, _ = _submit(scheduler, dialogs, 'b', priority=2)  # Queued, priority raised
+    assert scheduler.queued == 2
+    assert scheduler.waiting == 5
+
+    dialogs.exit('a', ExitCode.Fail)
+    on_exit_a1.assert_called_once_with(ExitCode.Fail)
+    on_exit_a2.assert_called_once_with(ExitCode.Fail)
+    dialogs.exit('b', ExitCode.Pass)
+    on_exit_b1.assert_called_once_with(ExitCode.Pass)
+    on_exit_b2.assert_called_once_with(ExitCode.Pass)
+    assert dialogs.shown == ['a', 'b', 'c']
+    on_exit_c.assert_not_called()
+
+
+def test_withdraw():
+    scheduler, dialogs = DialogScheduler(max_visible=1), FakeDialogs()
+    on_exit_a1, withdraw_a1 = _submit(scheduler, dialogs, 'a')
+    on_exit_a2, withdraw_a2 = _submit(scheduler, dialogs, 'a')
+    on_exit_b, withdraw_b = _submit(scheduler, dialogs, 'b')
+    _submit(scheduler, dialogs, 'c')
+
+    # Not shown
+    withdraw_b()
+    # Still shown for the other requester
+    withdraw_a1()
+    assert dialogs.visible == ['a']
+    # Cancelled, as no one is waiting
+    withdraw_a2()
+    assert dialogs.visible == ['c']
+    withdraw_a2()  # Ignored
+
+    assert dialogs.shown == ['a', 'c']
+    for on_exit in [on_exit_a1, on_exit_a2, on_exit_b]:
+        on_exit.assert_not_called()
+
+
+def test_cancel_queued():
+    scheduler, dialogs = DialogScheduler(max_visible=1), FakeDialogs()
+    on_exit_a, _ = _submit(scheduler, dialogs, 'a')
+    on_exit_b, _ = _submit(scheduler, dialogs, 'b')
+    scheduler.cancel_queued()
+    on_exit_b.assert_called_once_with(ExitCode.Cancel)
+    on_exit_a.assert_not_called()
+    assert scheduler.queued == 0
+
+
+def test_exit_when_shown():
+    """The dialog can exit while being shown, ex on error."""
+    scheduler = DialogScheduler(max_visible=1)
+    on_exit = Mock()
+
+    def show(done):
+        done(ExitCode.Unknown)
+        return lambda: None
+
+    scheduler.submit(Inputs(title='a'), on_exit, show)
+    on_exit.assert_called_once_with(ExitCode.Unknown)
+    assert scheduler.visible == 0
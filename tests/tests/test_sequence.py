@@ -0,0 +1,19 @@
+from pytest_params import params
+
+from src.show_dialog import ExitCode, StopPolicy
+
+
+@params(
+    'stop_policy, stopping_exit_codes',
+    [
+        (
+            'fail',
+            StopPolicy.FAIL,
+            {ExitCode.Unknown, ExitCode.Fail, ExitCode.Cancel, ExitCode.Timeout},
+        ),
+        ('cancel', StopPolicy.CANCEL, {ExitCode.Cancel}),
+        ('never', StopPolicy.NEVER, set()),
+    ],
+)
+def test_stop_policy(stop_policy: StopPolicy, stopping_exit_codes: set[ExitCode]):
+    assert {code for code in ExitCode if stop_policy.stops(code)} == stopping_exit_codes
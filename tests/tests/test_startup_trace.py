@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from src.show_dialog.startup_trace import StartupTrace
+from tests.libs.utils import run_python
+
+
+@pytest.fixture
+def trace(tmp_path) -> StartupTrace:
+    startup_trace = StartupTrace()
+    startup_trace.enable(str(tmp_path / 'trace.json'))
+    return startup_trace
+
+
+def test_disabled_does_not_record():
+    startup_trace = StartupTrace()
+    with startup_trace.phase('foo'):
+        pass
+    startup_trace.mark('bar')
+
+    assert startup_trace.phases == []
+
+
+def test_phases(trace):
+    with trace.phase('foo'):
+        pass
+    trace.mark('bar')
+
+    phases = trace.to_dict()['phases']
+    names = [phase['name'] for phase in phases]
+    assert names[-2:] == ['foo', 'bar']
+    assert phases[-1]['duration_ms'] == 0
+    assert all(phase['duration_ms'] >= 0 for phase in phases)
+    assert phases[-2]['end_ms'] <= phases[-1]['start_ms']
+
+
+def test_finish(trace):
+    trace.mark('foo')
+    trace.finish()
+
+    saved = json.loads(open(trace.output).read())
+    assert saved['phases'][-1]['name'] == 'foo'
+    assert not trace.enabled
+    assert trace.phases == []
+
+
+def test_main_startup_trace(tmp_path):
+    trace_file = tmp_path / 'trace.json'
+    result = run_python(
+        '-m',
+        'src.show_dialog.main',
+        '--inputs',
+        '{"title": "foo", "timeout": 1, "timeout_pass": true}',
+        '--startup-trace',
+        str(trace_file),
+        env={'QT_QPA_PLATFORM': 'offscreen'},
+    )
+
+    assert result.returncode == 0, result.stderr
+    names = [phase['name'] for phase in json.loads(trace_file.read_text())['phases']]
+    for name in [
+        'package_import',
+        'parse_args',
+        'set_config_values',
+        'import_qt',
+        'qapplication',
+        'show_dialog',
+        'show_dialog.setup_ui',
+        'show_dialog.stylesheet',
+        'show',
+        'first_paint',
+    ]:
+        assert name in names
@@ -0,0 +1,143 @@
+import socket
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.show_dialog import ExitCode, Inputs, Style, Theme
+from src.show_dialog.launcher import DAEMON_HOST, LaunchRequest, LaunchResponse, launch
+from src.show_dialog.ui.daemon import DialogDaemon
+from src.show_dialog.ui.stylesheet import load_theme_pack
+from tests.libs.fixtures import app  # noqa: F401
+
+
+@pytest.fixture
+def daemon(app):
+    _daemon = DialogDaemon(app, port=0)
+    yield _daemon
+    _daemon.close()
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=2) as _executor:
+        yield _executor
+
+
+def test_launch(daemon, executor, qtbot):
+    """Launcher blocks until the dialog exits and gets its exit code."""
+    request = LaunchRequest(Inputs(title='foo'), style=Style.Style01)
+    future = executor.submit(launch, request, daemon.port)
+    qtbot.waitUntil(lambda: len(daemon.dialogs) == 1)
+
+    dialog = next(iter(daemon.dialogs))
+    assert dialog.title_label.text() == 'foo'
+    assert not future.done()
+
+    dialog.fail_clicked(ExitCode.Fail)
+    qtbot.waitUntil(future.done)
+    assert future.result() is ExitCode.Fail
+    assert not daemon.dialogs
+
+
+def test_launch_styles(app, daemon, executor, qtbot):
+    """Each dialog has its theme and style, without changing the app or the other dialogs."""
+    app_stylesheet = app.styleSheet()
+    requests = [
+        LaunchRequest(Inputs(title='dark', theme=Theme.Dark), style=Style.Style01),
+        LaunchRequest(Inputs(title='light', theme=Theme.Light), style=Style.Style02),
+    ]
+    futures = [executor.submit(launch, request, daemon.port) for request in requests]
+    qtbot.waitUntil(lambda: len(daemon.dialogs) == 2)
+
+    shown_app_stylesheet = app.styleSheet()
+    dialogs = list(daemon.dialogs)
+    dialog_stylesheets = [dialog.styleSheet() for dialog in dialogs]
+    theme_packs = [load_theme_pack(dialog.inputs.theme, dialog.app_style) for dialog in dialogs]
+    for dialog in dialogs:
+        dialog.exit(ExitCode.Pass)
+    qtbot.waitUntil(lambda: all(future.done() for future in futures))
+
+    assert shown_app_stylesheet == app_stylesheet
+    for dialog_stylesheet, theme_pack in zip(dialog_stylesheets, theme_packs):
+        assert dialog_stylesheet.startswith(theme_pack.stylesheet)
+
+
+def test_launch_timeout(daemon, executor, qtbot):
+    """The app keeps running after the dialog exits."""
+    request = LaunchRequest(Inputs(timeout=1, timeout_pass=True))
+    for _ in range(2):
+        future = executor.submit(launch, request, daemon.port)
+        qtbot.waitUntil(future.done, timeout=5000)
+        assert future.result() is ExitCode.Pass
+
+
+def test_close(daemon, executor, qtbot):
+    """Closing the daemon cancels the dialogs being displayed."""
+    future = executor.submit(launch, LaunchRequest(Inputs()), daemon.port)
+    qtbot.waitUntil(lambda: len(daemon.dialogs) == 1)
+    daemon.close()
+    qtbot.waitUntil(future.done)
+    assert future.result() is ExitCode.Cancel
+
+
+def test_invalid_request(daemon, executor, qtbot):
+    def send_invalid_request():
+        with socket.create_connection((DAEMON_HOST, daemon.port)) as daemon_socket:
+            daemon_socket.sendall(b'{"foo": "bar"}\n')
+            return LaunchResponse.from_json(daemon_socket.makefile('rb').readline())
+
+    future = executor.submit(send_invalid_request)
+    qtbot.waitUntil(future.done)
+    assert future.result().exit_code is ExitCode.Unknown
+    assert not daemon.dialogs
+
+
+def test_port_in_use(app, daemon):
+    with pytest.raises(OSError):
+        DialogDaemon(app, port=daemon.port)
+
+
+def test_dashboard(app, executor, qtbot):
+    daemon = DialogDaemon(app, port=0, dashboard=True)
+    try:
+        future = executor.submit(launch, LaunchRequest(Inputs(title='foo')), daemon.port)
+        qtbot.waitUntil(lambda: len(daemon.dashboard.prompts) == 1)
+        assert not daemon.dialogs
+
+        prompt = daemon.dashboard.prompts[0]
+        assert prompt.inputs.title == 'foo'
+        daemon.dashboard.finish(prompt, ExitCode.Fail)
+        qtbot.waitUntil(future.done)
+        assert future.result() is ExitCode.Fail
+
+        # Cancelled when the daemon is closed
+        future = executor.submit(launch, LaunchRequest(Inputs(title='bar')), daemon.port)
+        qtbot.waitUntil(lambda: len(daemon.dashboard.prompts) == 1)
+    finally:
+        daemon.close()
+    qtbot.waitUntil(future.done)
+    assert future.result() is ExitCode.Cancel
+
+
+def test_scheduler(app, qtbot):
+    """Identical dialogs are merged and dialogs wait until there's room."""
+    daemon = DialogDaemon(app, port=0, max_visible=1)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        try:
+            futures = [
+                executor.submit(launch, LaunchRequest(Inputs(title=title)), daemon.port)
+                for title in ['foo', 'foo', 'bar']
+            ]
+            qtbot.waitUntil(lambda: daemon.scheduler.waiting == 3)
+            assert daemon.scheduler.queued == 1
+            dialog = next(iter(daemon.dialogs))
+            dialog.fail_clicked(ExitCode.Fail)
+            qtbot.waitUntil(lambda: futures[0].done() and futures[1].done())
+            assert [futures[0].result(), futures[1].result()] == [ExitCode.Fail] * 2
+
+            qtbot.waitUntil(lambda: len(daemon.dialogs) == 1 and dialog not in daemon.dialogs)
+            assert next(iter(daemon.dialogs)).inputs.title == 'bar'
+        finally:
+            daemon.close()
+        qtbot.waitUntil(futures[2].done)
+        assert futures[2].result() is ExitCode.Cancel
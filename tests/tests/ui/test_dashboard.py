@@ -0,0 +1,106 @@
+from unittest.mock import Mock
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtTest import QTest
+from pytest_params import params
+
+from src.show_dialog import Buttons, ExitCode, Inputs
+from src.show_dialog.ui.dashboard import Dashboard, Prompt
+from tests.libs.fixtures import app  # noqa: F401
+
+
+@pytest.fixture
+def dashboard(app, qtbot):
+    _dashboard = Dashboard()
+    qtbot.addWidget(_dashboard)
+    yield _dashboard
+
+
+def _click(dashboard: Dashboard, prompt: Prompt, exit_code: ExitCode):
+    row = dashboard.prompts.index(prompt)
+    rect = dashboard.view.visualRect(dashboard.model.index(row))
+    button_rect = dashboard.delegate.button_rects(rect, prompt)[exit_code]
+    QTest.mouseClick(dashboard.view.viewport(), Qt.MouseButton.LeftButton, pos=button_rect.center())
+
+
+@params(
+    'inputs, expected_texts',
+    [
+        ('ok', Inputs(buttons=Buttons.OK), ('Ok', None)),
+        ('yes/no', Inputs(buttons=Buttons.YES_NO), ('Yes', 'No')),
+        ('custom texts', Inputs(pass_button_text='Go', fail_button_text='Stop'), ('Go', 'Stop')),
+    ],
+)
+def test_prompt_buttons(inputs: Inputs, expected_texts: tuple[str, str | None]):
+    prompt = Prompt(1, inputs, Mock())
+    assert (prompt.pass_text, prompt.fail_text) == expected_texts
+
+
+def test_prompt_preview():
+    prompt = Prompt(1, Inputs(description='Connect\n  the\n\ndevice. ' * 100), Mock())
+    assert prompt.preview.startswith('Connect the device. Connect')
+    assert len(prompt.preview) == 200
+
+
+@params('exit_code', [('pass', ExitCode.Pass), ('fail', ExitCode.Fail)])
+def test_click(exit_code: ExitCode, dashboard: Dashboard, qtbot):
+    on_exit = [Mock(), Mock(), Mock()]
+    prompts = [dashboard.add(Inputs(title=f'Prompt {i}'), on_exit[i]) for i in range(3)]
+    assert dashboard.isVisible()
+    assert dashboard.model.rowCount() == 3
+    qtbot.waitExposed(dashboard)
+
+    _click(dashboard, prompts[1], exit_code)
+    on_exit[1].assert_called_once_with(exit_code)
+    on_exit[0].assert_not_called()
+    assert dashboard.prompts == [prompts[0], prompts[2]]
+    assert dashboard.windowTitle().endswith('2 pending')
+
+
+def test_timeout(dashboard: Dashboard, qtbot):
+    on_exit = Mock()
+    dashboard.add(Inputs(timeout=1), on_exit)
+    dashboard.add(Inputs(timeout=1, timeout_pass=True), on_exit)
+    dashboard.add(Inputs(), on_exit)
+    qtbot.waitUntil(lambda: on_exit.call_count == 2, timeout=5000)
+    assert [call.args for call in on_exit.call_args_list] == [(ExitCode.Timeout,), (ExitCode.Pass,)]
+    assert len(dashboard.prompts) == 1
+    assert not dashboard.timer.isActive()
+
+
+def test_finish_once(dashboard: Dashboard):
+    on_exit = Mock()
+    prompt = dashboard.add(Inputs(), on_exit)
+    dashboard.finish(prompt, ExitCode.Fail)
+    dashboard.finish(prompt, ExitCode.Cancel)
+    on_exit.assert_called_once_with(ExitCode.Fail)
+
+
+def test_finish_compacts_deadlines(dashboard: Dashboard):
+    """Answered prompts don't stay in the deadline heap until they time out."""
+    on_exit = Mock()
+    pending = dashboard.add(Inputs(timeout=60), on_exit)
+    for _ in range(100):
+        dashboard.finish(dashboard.add(Inputs(timeout=60), on_exit), ExitCode.Pass)
+    assert len(dashboard._deadlines) <= 2
+    assert pending in [entry[2] for entry in dashboard._deadlines]
+    dashboard.finish(pending, ExitCode.Pass)
+    assert not dashboard._deadlines
+
+
+def test_close(dashboard: Dashboard):
+    """Closing the window cancels the pending prompts."""
+    on_exit = Mock()
+    for _ in range(2):
+        dashboard.add(Inputs(), on_exit)
+    dashboard.close()
+    assert on_exit.call_count == 2
+    on_exit.assert_called_with(ExitCode.Cancel)
+    assert not dashboard.prompts
+
+
+def test_priority(dashboard: Dashboard):
+    for title, priority in [('a', 0), ('b', 1), ('c', 0), ('d', 2), ('e', -1)]:
+        dashboard.add(Inputs(title=title, priority=priority), Mock())
+    assert [prompt.inputs.title for prompt in dashboard.prompts] == ['d', 'b', 'a', 'c', 'e']
@@ -0,0 +1,40 @@
+import re
+
+from pytest_params import params
+
+from tests.libs.config import PROJECT_ROOT
+from tests.libs.utils import run_python
+
+QRC_FILES = re.findall(r'<file>(.*)</file>', (PROJECT_ROOT / 'assets/resources.qrc').read_text())
+"""Files in the ``.qrc`` file."""
+
+RESOURCES_EXIST = '''
+import sys
+from PySide6.QtCore import QFile
+{setup}
+from src.show_dialog.ui import resources
+
+missing = [file for file in {qrc_files!r} if not QFile(':/' + file).exists()]
+assert not missing, f'Files not in the resources: {{missing}}'
+assert ('src.show_dialog.ui.forms.resources_rc' in sys.modules) is {fallback}
+'''
+
+
+@params(
+    'setup, fallback',
+    [
+        ('binary', '', False),
+        (
+            'python module fallback',
+            'from unittest.mock import patch\n'
+            'patch("PySide6.QtCore.QResource.registerResource", return_value=False).start()',
+            True,
+        ),
+    ],
+)
+def test_resources(setup, fallback):
+    """All files in the ``.qrc`` file are in the resources."""
+    result = run_python(
+        '-c', RESOURCES_EXIST.format(setup=setup, fallback=fallback, qrc_files=QRC_FILES)
+    )
+    assert result.returncode == 0, result.stderr
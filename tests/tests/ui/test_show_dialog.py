@@ -3,32 +3,49 @@ from unittest.mock import patch
 import pytest
 from PySide6.QtCore import Qt
 from PySide6.QtTest import QTest
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QProgressBar, QPushButton
 from pytest_params import get_request_param, params
 
-from src.show_dialog import Buttons, ExitCode, Inputs, ShowDialog
+from src.show_dialog import (
+    Answer,
+    Answers,
+    Buttons,
+    ExitCode,
+    ExitSource,
+    Inputs,
+    ShowDialog,
+    Style,
+    Theme,
+    load_records,
+)
 from src.show_dialog.ipc.client import IpcClient
 from src.show_dialog.ipc.ipc_params import IpcParams
 from src.show_dialog.ipc.message import Message, MessageType
+from src.show_dialog.ui.stylesheet import load_theme_pack
 from tests.libs import config
-
-
-@pytest.fixture(scope='session')
-def app():
-    _app = QApplication([])
-    yield _app
+from tests.libs.fixtures import app  # noqa: F401
+from tests.libs.utils import free_port
 
 
 @pytest.fixture
 def show_dialog(request, app, qtbot):
     inputs = get_request_param(request, 'inputs', Inputs())
     ipc_params = get_request_param(request, 'ipc_params')
-    dialog = ShowDialog(app, inputs, ipc_params=ipc_params)
-    qtbot.addWidget(dialog)
+    style = get_request_param(request, 'style')
+    dialog = ShowDialog(app, inputs, style=style, ipc_params=ipc_params)
+    qtbot.addWidget(dialog, before_close_func=_do_not_quit_app)
 
     yield dialog
 
 
+def _do_not_quit_app(dialog: ShowDialog):
+    """
+    Closing the dialog after the test exits the app, which, outside of its event loop, makes the
+    event loops in the following tests, ex in ``qtbot.waitUntil``, return right away.
+    """
+    dialog.quit_app = False
+
+
 @params(
     'show_dialog', [('dialog title', {'inputs': Inputs(dialog_title='foo bar')})], indirect=True
 )
@@ -123,6 +140,99 @@ def test_fail_clicked(exit_mock, show_dialog: ShowDialog):
     exit_mock.assert_called_once_with(ExitCode.Fail)
 
 
+@patch('PySide6.QtWidgets.QApplication.exit')
+def test_exit_once(exit_mock, show_dialog: ShowDialog):
+    """Closing the window after clicking a button doesn't change the exit code."""
+    QTest.mouseClick(show_dialog.pass_button, Qt.MouseButton.LeftButton)
+    show_dialog.close()
+    exit_mock.assert_called_once_with(ExitCode.Pass)
+    assert show_dialog.exit_code is ExitCode.Pass
+    assert show_dialog.exit_source is ExitSource.BUTTON
+
+
+@params(
+    'exit_dialog, expected_exit_code, expected_source',
+    [
+        (
+            'pass button',
+            lambda dialog: dialog.pass_button.click(),
+            ExitCode.Pass,
+            ExitSource.BUTTON,
+        ),
+        ('close', lambda dialog: dialog.close(), ExitCode.Cancel, ExitSource.CLOSE),
+        (
+            'pass shortcut',
+            lambda dialog: dialog.pass_shortcut.activated.emit(),
+            ExitCode.Pass,
+            ExitSource.SHORTCUT,
+        ),
+        ('timeout', lambda dialog: dialog.timeout(), ExitCode.Timeout, ExitSource.TIMEOUT),
+        ('exit', lambda dialog: dialog.exit(ExitCode.Cancel), ExitCode.Cancel, ExitSource.API),
+    ],
+)
+@patch('PySide6.QtWidgets.QApplication.exit')
+def test_record(exit_mock, exit_dialog, expected_exit_code, expected_source, app, qtbot, tmp_path):
+    record_file = tmp_path / 'session.jsonl'
+    inputs = Inputs(title='foo')
+    dialog = ShowDialog(app, inputs)
+    qtbot.addWidget(dialog, before_close_func=_do_not_quit_app)
+    dialog.show()
+    with patch('src.show_dialog.config.RECORD_FILE', str(record_file)):
+        exit_dialog(dialog)
+        dialog.close()  # Not recorded again
+
+    [record] = load_records(record_file)
+    assert (record.inputs, record.exit_code, record.source) == (
+        inputs,
+        expected_exit_code,
+        expected_source,
+    )
+    assert 0 <= record.duration < 5
+
+
+@patch('PySide6.QtWidgets.QApplication.exit')
+def test_exit_without_quit_app(exit_mock, app, qtbot):
+    """Dialog closes and emits ``finished`` with the exit code, app keeps running."""
+    dialog = ShowDialog(app, Inputs(), quit_app=False)
+    qtbot.addWidget(dialog)
+    dialog.show()
+    with qtbot.waitSignal(dialog.finished) as blocker:
+        QTest.mouseClick(dialog.fail_button, Qt.MouseButton.LeftButton)
+
+    assert blocker.args == [ExitCode.Fail]
+    assert not dialog.isVisible()
+    exit_mock.assert_not_called()
+
+
+@patch('PySide6.QtWidgets.QApplication.exit')
+def test_keep_open(exit_mock, app, qtbot):
+    dialog = ShowDialog(app, Inputs(), keep_open=True)
+    qtbot.addWidget(dialog, before_close_func=_do_not_quit_app)
+    dialog.show()
+    with qtbot.waitSignal(dialog.exited) as blocker:
+        dialog.fail_clicked(ExitCode.Fail)
+
+    assert blocker.args == [ExitCode.Fail]
+    assert dialog.isVisible()
+    exit_mock.assert_not_called()
+
+
+@patch('PySide6.QtWidgets.QApplication.exit')
+def test_answers(exit_mock, app, qtbot):
+    answers = Answers([Answer(ExitCode.Fail, title='foo', delay=0.05), Answer(ExitCode.Pass)])
+    dialog = ShowDialog(app, Inputs(title='foo'), keep_open=True, answers=answers)
+    qtbot.addWidget(dialog, before_close_func=_do_not_quit_app)
+    dialog.show()
+    with qtbot.waitSignal(dialog.exited) as blocker:
+        # The pending answer to the previous inputs is ignored
+        dialog.reconfigure(Inputs(title='bar'))
+    assert blocker.args == [ExitCode.Pass]
+
+    with qtbot.waitSignal(dialog.exited) as blocker:
+        dialog.reconfigure(Inputs(title='foo'))
+    assert blocker.args == [ExitCode.Fail]
+
+
 @pytest.mark.skip('Not working.')
 @patch('PySide6.QtWidgets.QApplication.exit')
 def test_pass_shortcut(exit_mock, show_dialog: ShowDialog):
@@ -165,7 +275,8 @@ def test_pass_fail_buttons_text(show_dialog: ShowDialog, expected_pass_fail_text
     indirect=['show_dialog'],
 )
 def test_ok_button(show_dialog: ShowDialog, expected_button_text: str):
-    assert not show_dialog.fail_button.isVisible()
+    assert show_dialog.fail_button is None
+    assert show_dialog.findChild(QPushButton, 'fail_button') is None
     assert show_dialog.pass_button.text() == expected_button_text
 
 
@@ -194,6 +305,8 @@ def test_two_buttons(
 ):
     assert show_dialog.pass_button.text() == expected_pass_button_text
     assert show_dialog.fail_button.text() == expected_fail_button_text
+    # Fail button is to the left of the pass button
+    assert show_dialog.buttons_h_layout.indexOf(show_dialog.fail_button) == 0
 
 
 @params(
@@ -205,9 +318,173 @@ def test_two_buttons(
     indirect=True,
 )
 def test_timeout_no_timeout(show_dialog: ShowDialog):
-    """Timeout UI should not appear if there's no timeout."""
-    assert not show_dialog.timeout_progress_bar.isVisible()
-    assert not show_dialog.timeout_increase_button.isVisible()
+    """Timeout UI should not be created if there's no timeout."""
+    assert show_dialog.timeout_widget is None
+    assert show_dialog.findChild(QProgressBar) is None
+
+
+def test_stylesheet(app, qtbot):
+    """Theme and stylesheet in the app stylesheet, input specific changes in the dialog."""
+    dialog = ShowDialog(app, Inputs(buttons=Buttons.OK), stylesheet='QLabel { color: red; }')
+    qtbot.addWidget(dialog, before_close_func=_do_not_quit_app)
+
+    assert app.styleSheet().endswith('QLabel { color: red; }')
+    assert 'pass_button' not in app.styleSheet()
+    assert 'pass_button' in dialog.styleSheet()
+
+
+@params(
+    'show_dialog',
+    [('timeout', {'inputs': Inputs(timeout=5)})],
+    indirect=True,
+)
+def test_timeout(show_dialog: ShowDialog):
+    """Timeout UI is above the buttons."""
+    assert show_dialog.timeout_progress_bar.maximum() == 5
+    assert show_dialog.timeout_progress_bar.value() == 5
+    assert (
+        show_dialog.verticalLayout.indexOf(show_dialog.timeout_widget)
+        == show_dialog.verticalLayout.count() - 2
+    )
+
+    QTest.mouseClick(show_dialog.timeout_increase_button, Qt.MouseButton.LeftButton)
+    assert show_dialog.timeout_progress_bar.value() == 15
+
+
+@params(
+    'show_dialog',
+    [
+        (
+            'theme pack',
+            {'inputs': Inputs(buttons=Buttons.OK, theme=Theme.Dark), 'style': Style.Style02},
+        )
+    ],
+    indirect=True,
+)
+def test_theme_pack(show_dialog: ShowDialog):
+    """Theme and style from the theme pack, input specific changes in the dialog stylesheet."""
+    assert show_dialog.app.styleSheet() == load_theme_pack(Theme.Dark, Style.Style02).stylesheet
+    assert 'pass_button' in show_dialog.styleSheet()
+
+
+@params(
+    'show_dialog',
+    [('timeout', {'inputs': Inputs(timeout=5)})],
+    indirect=True,
+)
+def test_timeout_starts_when_shown(show_dialog: ShowDialog):
+    assert not show_dialog.timer.isActive()
+    show_dialog.show()
+    assert show_dialog.timer.isActive()
+
+
+@params(
+    'show_dialog',
+    [('reveal', {'inputs': Inputs(title='foo', buttons=Buttons.OK)})],
+    indirect=True,
+)
+def test_reveal(show_dialog: ShowDialog, caplog):
+    show_dialog.prepare()
+    assert not show_dialog.isVisible()
+
+    show_dialog.reveal({'title': 'bar', 'pass_button_text': 'Done', 'buttons': Buttons.YES_NO})
+    assert show_dialog.isVisible()
+    assert show_dialog.title_label.text() == 'bar'
+    assert show_dialog.pass_button.text() == 'Done'
+    # Fields that change the widgets can't be changed
+    assert show_dialog.inputs.buttons is Buttons.OK
+    assert show_dialog.fail_button is None
+    assert "['buttons']" in caplog.text
+
+
+@params(
+    'show_dialog',
+    [('reconfigure', {'inputs': Inputs(dialog_title='foo', title='foo', timeout=5)})],
+    indirect=True,
+)
+@patch('PySide6.QtWidgets.QApplication.exit')
+def test_reconfigure(exit_mock, show_dialog: ShowDialog):
+    show_dialog.show()
+    show_dialog.fail_clicked(ExitCode.Fail)
+    assert show_dialog.exit_code is ExitCode.Fail
+
+    # One button, no timeout
+    show_dialog.reconfigure(Inputs(title='bar', buttons=Buttons.OK))
+    assert show_dialog.exit_code is None
+    assert show_dialog.windowTitle() == 'Show Dialog'
+    assert show_dialog.title_label.text() == 'bar'
+    assert show_dialog.pass_button.text() == 'Ok'
+    assert show_dialog.fail_button is None
+    assert show_dialog.timeout_widget.isHidden()
+    show_dialog.show()
+    assert not show_dialog.timer.isActive()
+
+    # Two buttons, timeout is reset
+    show_dialog.timeout_progress_bar.setValue(1)
+    show_dialog.reconfigure(Inputs(buttons=Buttons.YES_NO, fail_button_text='Nope', timeout=3))
+    assert show_dialog.pass_button.text() == 'Yes'
+    assert show_dialog.fail_button.text() == 'Nope'
+    assert show_dialog.buttons_h_layout.indexOf(show_dialog.fail_button) == 0
+    assert not show_dialog.timeout_widget.isHidden()
+    assert show_dialog.timeout_progress_bar.maximum() == 3
+    assert show_dialog.timeout_progress_bar.value() == 3
+    show_dialog.show()
+    assert show_dialog.timer.isActive()
+
+    # Only the fail button text changes
+    show_dialog.reconfigure(Inputs(buttons=Buttons.YES_NO, timeout=3))
+    assert show_dialog.fail_button.text() == 'No'
+
+
+@pytest.fixture
+def ipc_params():
+    return IpcParams(host='127.0.0.1', port=free_port(), timeout=10)
+
+
+def _connect(qtbot, ipc_params: IpcParams) -> IpcClient:
+    """Connect once the IPC server, started in another thread, is listening."""
+    clients = []
+
+    def connect():
+        try:
+            clients.append(IpcClient(ipc_params))
+        except ConnectionRefusedError:
+            return False
+        return True
+
+    qtbot.waitUntil(connect)
+    return clients[0]
+
+
+def test_ipc_show(app, qtbot, ipc_params):
+    dialog = ShowDialog(app, Inputs(title='foo', timeout=5), ipc_params=ipc_params, quit_app=False)
+    qtbot.addWidget(dialog)
+    dialog.prepare()
+    assert not dialog.timer.isActive()
+
+    client = _connect(qtbot, ipc_params)
+    client.send(Message(MessageType.SHOW, data={'title': 'bar', 'description_md': True}))
+    qtbot.waitUntil(dialog.isVisible)
+    assert dialog.title_label.text() == 'bar'
+    assert dialog.timer.isActive()
+
+    # Keeps listening after showing
+    client.send(Message(MessageType.PASS))
+    qtbot.waitUntil(lambda: dialog.exit_code is ExitCode.Pass)
+    client.close()
+    assert not dialog.ipc_thread.is_alive()
+
+
+def test_ipc_show_invalid_inputs(app, qtbot, ipc_params):
+    """The dialog is shown with the original inputs."""
+    dialog = ShowDialog(app, Inputs(title='foo'), ipc_params=ipc_params, quit_app=False)
+    qtbot.addWidget(dialog)
+    client = _connect(qtbot, ipc_params)
+    client.send(Message(MessageType.SHOW, data={'description_md': 'foo'}))
+    qtbot.waitUntil(dialog.isVisible)
+    assert dialog.title_label.text() == 'foo'
+    client.close()
+    dialog.pass_clicked()
 
 
 @params(
@@ -0,0 +1,185 @@
+from unittest.mock import patch
+
+from PySide6.QtGui import QPalette
+from pytest_params import params
+
+from src.show_dialog import Style, Theme
+from src.show_dialog.ui.stylesheet import (
+    AppStylesheet,
+    StylesheetCache,
+    load_theme_pack,
+    minify_stylesheet,
+)
+from src.show_dialog.utils_qt import read_file
+from tests.libs.fixtures import app  # noqa: F401
+from tests.libs.utils import run_python
+
+LOAD_THEME_STYLESHEET = 'src.show_dialog.ui.stylesheet.load_theme_stylesheet'
+
+ICON_EXISTS = '''
+from pathlib import Path
+
+from PySide6.QtCore import QFile
+
+from src.show_dialog import Style, Theme
+from src.show_dialog.ui.stylesheet import StylesheetCache, load_theme_pack
+
+{code}
+print(QFile.exists(':/qss_icons/{theme}/rc/arrow_down.png'))
+'''
+"""
+Whether an icon of the theme is in the resources after loading the stylesheet, in a new process, so
+that the icons are not registered by other tests.
+"""
+
+QDARKSTYLE_THEMES = [(theme.value, theme) for theme in (Theme.Dark, Theme.Light)]
+
+
+def _icon_exists(code: str, theme: Theme) -> bool:
+    result = run_python('-c', ICON_EXISTS.format(code=code, theme=theme.value.lower()))
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip() == 'True'
+
+
+class TestAppStylesheet:
+    @params(
+        'app_stylesheet',
+        [
+            ('with link color', AppStylesheet('QLabel { color: red; }', '#ABCDEF')),
+            ('no link color', AppStylesheet('QLabel { color: red; }')),
+            ('empty', AppStylesheet('')),
+        ],
+    )
+    def test_to_text_from_text(self, app_stylesheet):
+        assert AppStylesheet.from_text(app_stylesheet.to_text()) == app_stylesheet
+
+    def test_apply(self, app):
+        AppStylesheet('QLabel { color: red; }', '#123456').apply(app)
+
+        assert app.styleSheet() == 'QLabel { color: red; }'
+        assert app.palette().color(QPalette.ColorGroup.Normal, QPalette.ColorRole.Link).name() == (
+            '#123456'
+        )
+
+
+class TestStylesheetCache:
+    def test_combined_stylesheet(self):
+        with patch(LOAD_THEME_STYLESHEET, return_value=AppStylesheet('theme;', '#000000')):
+            app_stylesheet = StylesheetCache().get(Theme.Light, 'style;', 'local;')
+
+        assert app_stylesheet == AppStylesheet('theme;style;local;', '#000000')
+
+    def test_qdarkstyle_theme(self):
+        app_stylesheet = StylesheetCache().get(Theme.Dark)
+
+        assert 'QWidget' in app_stylesheet.stylesheet
+        assert app_stylesheet.link_color
+
+    def test_system_theme(self):
+        assert StylesheetCache().get(Theme.System, 'style;') == AppStylesheet('style;')
+
+    def test_memory_cache(self):
+        cache = StylesheetCache()
+        with patch(LOAD_THEME_STYLESHEET, return_value=AppStylesheet('theme;')) as load_mock:
+            app_stylesheet_1 = cache.get(Theme.Light, 'style;')
+            app_stylesheet_2 = cache.get(Theme.Light, 'style;')
+
+        assert app_stylesheet_1 is app_stylesheet_2
+        load_mock.assert_called_once()
+
+    def test_disk_cache(self, tmp_path):
+        with patch(LOAD_THEME_STYLESHEET, return_value=AppStylesheet('theme;', '#000000')):
+            app_stylesheet_1 = StylesheetCache(tmp_path).get(Theme.Light, 'style;')
+        assert len(list(tmp_path.glob('*.qss'))) == 1
+
+        # New cache, as in a new process, reads from disk without generating the theme
+        with patch(LOAD_THEME_STYLESHEET) as load_mock:
+            app_stylesheet_2 = StylesheetCache(tmp_path).get(Theme.Light, 'style;')
+
+        load_mock.assert_not_called()
+        assert app_stylesheet_2 == app_stylesheet_1
+
+    @params(
+        'args_1, args_2',
+        [
+            ('theme', (Theme.Light, 'style;'), (Theme.Dark, 'style;')),
+            ('style', (Theme.Light, 'style_1;'), (Theme.Light, 'style_2;')),
+            ('local stylesheet', (Theme.Light, 'style;', 'local_1;'), (Theme.Light, 'style;')),
+        ],
+    )
+    def test_key(self, tmp_path, args_1, args_2):
+        cache = StylesheetCache(tmp_path)
+        with patch(LOAD_THEME_STYLESHEET, return_value=AppStylesheet('theme;')):
+            cache.get(*args_1)
+            cache.get(*args_2)
+
+        assert len(list(tmp_path.glob('*.qss'))) == 2
+
+    @params('theme', QDARKSTYLE_THEMES)
+    def test_disk_cache_icons(self, tmp_path, theme):
+        """The icons used by the theme are registered when the stylesheet is read from disk."""
+        StylesheetCache(tmp_path).get(theme)
+
+        assert _icon_exists(
+            f'StylesheetCache(Path({str(tmp_path)!r})).get(Theme.{theme.name})', theme
+        )
+
+    def test_cache_dir_not_writable(self, tmp_path):
+        cache_dir = tmp_path / 'file'
+        cache_dir.touch()  # A file, so it can't be used as a directory
+
+        with patch(LOAD_THEME_STYLESHEET, return_value=AppStylesheet('theme;')):
+            app_stylesheet = StylesheetCache(cache_dir).get(Theme.Light)
+
+        assert app_stylesheet == AppStylesheet('theme;')
+
+
+@params(
+    'stylesheet, expected',
+    [
+        ('comments', '/* foo */QLabel { color: red; } /* multi\nline */', 'QLabel{color:red}'),
+        (
+            'whitespace',
+            'QLabel ,  QPushButton\n{\n    color : red;\n    margin: 0 1px;\n}\n',
+            'QLabel,QPushButton{color:red;margin:0 1px}',
+        ),
+        ('space before colon', 'QLabel { color :green; }', 'QLabel{color:green}'),
+        (
+            'descendant pseudo state',
+            'QWidget :hover { color: red; }',
+            'QWidget :hover{color:red}',
+        ),
+        (
+            'pseudo state',
+            'QPushButton:hover { color: rgb(0, 0, 50); }',
+            'QPushButton:hover{color:rgb(0,0,50)}',
+        ),
+        (
+            'url',
+            'QCheckBox::indicator { image: url(":/foo/bar.png"); }',
+            'QCheckBox::indicator{image:url(":/foo/bar.png")}',
+        ),
+    ],
+)
+def test_minify_stylesheet(stylesheet, expected):
+    assert minify_stylesheet(stylesheet) == expected
+
+
+@params('theme', [(theme.value, theme) for theme in Theme])
+@params('style', [(style.name, style) for style in Style])
+def test_load_theme_pack(theme, style):
+    """All theme packs are built and in the resources."""
+    app_stylesheet = load_theme_pack(theme, style)
+
+    assert app_stylesheet.stylesheet.endswith(minify_stylesheet(read_file(style.value)))
+    assert bool(app_stylesheet.link_color) is (theme is not Theme.System)
+
+
+@params('theme', QDARKSTYLE_THEMES)
+def test_load_theme_pack_icons(theme):
+    """The icons used by the theme are registered when the theme pack is loaded."""
+    assert _icon_exists(f'load_theme_pack(Theme.{theme.name}, Style.Style01)', theme)
+
+
+def test_load_theme_pack_cached():
+    assert load_theme_pack(Theme.Dark, Style.Style01) is load_theme_pack(Theme.Dark, Style.Style01)
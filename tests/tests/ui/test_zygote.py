@@ -0,0 +1,50 @@
+import socket
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.show_dialog import ExitCode, Inputs
+from src.show_dialog.launcher import DAEMON_HOST, LaunchRequest, LaunchResponse, launch
+from tests.libs.utils import free_port, run_python_server
+
+pytestmark = pytest.mark.skipif(sys.platform != 'linux', reason='Linux only.')
+
+
+@pytest.fixture(scope='module')
+def fork_server_port():
+    port = free_port()
+    with run_python_server(
+        '-m',
+        'src.show_dialog.main',
+        '--serve',
+        '--fork',
+        ready='listening',
+        env={'QT_QPA_PLATFORM': 'offscreen', 'SHOW_DIALOG_DAEMON_PORT': str(port)},
+    ):
+        yield port
+
+
+def test_launch(fork_server_port):
+    request = LaunchRequest(Inputs(timeout=1))
+    assert launch(request, fork_server_port) is ExitCode.Timeout
+
+
+def test_launch_concurrent(fork_server_port):
+    """Each dialog is shown in its own process."""
+    requests = [
+        LaunchRequest(Inputs(timeout=1, timeout_pass=timeout_pass))
+        for timeout_pass in [True, False]
+    ]
+    with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+        exit_codes = list(executor.map(lambda r: launch(r, fork_server_port), requests))
+
+    assert exit_codes == [ExitCode.Pass, ExitCode.Timeout]
+
+
+def test_invalid_request(fork_server_port):
+    with socket.create_connection((DAEMON_HOST, fork_server_port)) as server_socket:
+        server_socket.sendall(b'{"foo": "bar"}\n')
+        response = LaunchResponse.from_json(server_socket.makefile('rb').readline())
+
+    assert response.exit_code is ExitCode.Unknown